@@ -1,10 +1,22 @@
 #$Id$
-from io import StringIO
+from io import BytesIO
 import urllib
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPProxyAuth
+from urllib3.exceptions import NewConnectionError
+from contextlib import contextmanager
+import contextvars
+import email.utils
 import math
+import itertools
+import random
+import os
+import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 class AnalyticsClient:
     """
@@ -36,10 +48,25 @@ class AnalyticsClient:
         self.exclude_ssl = False
         self.user_agent = "zoho-analytics-mcp-server"
 
+        self.pool_connections = 10
+        self.pool_maxsize = 10
+        self.pool_idle_timeout = 300
+        self.export_chunk_size = 65536
+        self.sessions = {}
+        self.sessions_lock = threading.Lock()
+
         self.client_id = client_id
         self.client_secret = client_secret
         self.refresh_token = refresh_token
         self.access_token = None
+        self.access_token_expiry = None
+        self.token_refresh_margin = 300
+        self.token_expiry_margin = 30
+        self.token_cache = None
+        self.token_lock = threading.Lock()
+        self.token_refresh_thread = None
+        self.retry_policy = RetryPolicy()
+        self.request_scheduler = RequestScheduler()
 
     def get_org_instance(self, org_id):
         """
@@ -2266,7 +2293,7 @@ class AnalyticsClient:
             response = self.ac.send_api_request("GET", endpoint, None, self.request_headers)
             return response["data"]     
 
-        def export_data(self, view_id, response_format, file_path, config = {}):
+        def export_data(self, view_id, response_format, file_path, config = {}, progress_callback = None):
             """
             Export the mentioned table (or) view data.
             @param view_id: Id of the view to be exported.
@@ -2277,12 +2304,14 @@ class AnalyticsClient:
             @type file_path: string
             @param config: Contains any additional control parameters. Can be C{None}.
             @type config:dictionary
+            @param progress_callback: Called with the bytes written so far and the total bytes (C{None} if unknown) after every chunk. Can be C{None}.
+            @type progress_callback:function
             @raise ServerError: If the server has received the request but did not process the request due to some error.
             @raise ParseError: If the server has responded but client was not able to parse the response.
             """
             endpoint = self.endpoint + "/views/" + view_id + "/data"
             config["responseFormat"] = response_format
-            self.ac.send_export_api_request(endpoint, config, self.request_headers, file_path)
+            self.ac.send_export_api_request(endpoint, config, self.request_headers, file_path, progress_callback)
 
         def initiate_bulk_export(self, view_id, response_format, config = {}):
             """
@@ -2337,18 +2366,34 @@ class AnalyticsClient:
             response = self.ac.send_api_request("GET", endpoint, None, self.request_headers)
             return response["data"]
 
-        def export_bulk_data(self, job_id, file_path):
+        def export_bulk_data(self, job_id, file_path, progress_callback = None):
             """
             Download the exported data for the mentioned job id.
             @param job_id: Id of the job to be exported.
             @type job_id: string
             @param file_path: Path of the file where the data exported to be stored.
             @type file_path: string
+            @param progress_callback: Called with the bytes written so far and the total bytes (C{None} if unknown) after every chunk. Can be C{None}.
+            @type progress_callback:function
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.bulk_endpoint + "/exportjobs/" + job_id + "/data"
+            self.ac.send_export_api_request(endpoint, None, self.request_headers, file_path, progress_callback)                 
+
+        def iter_bulk_data(self, job_id):
+            """
+            Stream the exported data for the mentioned job id, without storing it in a file.
+            Closing the generator before it is exhausted closes the connection, so the rest of the data is not downloaded.
+            @param job_id: Id of the job to be exported.
+            @type job_id: string
             @raise ServerError: If the server has received the request but did not process the request due to some error.
             @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Generator of the exported data in chunks of bytes.
+            @rtype:generator
             """
             endpoint = self.bulk_endpoint + "/exportjobs/" + job_id + "/data"
-            self.ac.send_export_api_request(endpoint, None, self.request_headers, file_path)                 
+            return self.ac.iter_export_api_response(endpoint, None, self.request_headers)
 
 
     def set_proxy(self, proxy_host, proxy_port, proxy_user_name, proxy_password):
@@ -2360,54 +2405,96 @@ class AnalyticsClient:
         self.proxy_port = proxy_port
         self.proxy_user_name = proxy_user_name
         self.proxy_password = proxy_password
+        # Pooled sessions carry the proxy settings they were created with.
+        self.close()
 
     def send_batch_import_api_request(self, request_url, config, request_headers, file_path, batch_size, tool_config):
-        if self.access_token is None:
-            self.regenerate_analytics_oauth_token()
-
-        file_header = open(file_path, 'r').readline()
-        file_content = open(file_path, 'r').readlines()
-        file_content.__delitem__(0)
-        total_lines = len(file_content)
-        total_batch_count = math.ceil(total_lines / batch_size)
+        """
+        Internal method to handle HTTP request.
+        The next batch is read and encoded on a background thread while the current batch is uploaded,
+        and the wait between batches is decided by L{BatchImportPacer} from the tool_config.
+        """
+        pacer = BatchImportPacer(tool_config)
+        # Throttled batches are paced by the BatchImportPacer, so only the batches that failed to send are retried here.
+        retry_policy = RetryPolicy(self.retry_policy.max_attempts, self.retry_policy.base_delay, self.retry_policy.max_delay,
+                                   retry_status_codes=())
+        stats_callback = tool_config.get("batchStatsCallback")
         config["batchKey"] = "start"
         request_url = self.analytics_server_url + request_url
+        response = None
 
-        for i in range(total_batch_count):
-            batch = ("".join(file_content[batch_size * i:batch_size + (i * batch_size)]))
-            batch_file = StringIO( file_header + batch )
-            files = {'FILE': batch_file}
-
-            config["isLastBatch"] = "true" if (i == (total_batch_count - 1)) else "false"
-            config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
-
-            resp_obj = self.submit_import_request(request_url, config_data, request_headers, self.access_token, files)
-
-            if not (str(resp_obj.status_code).startswith("2")):
-                if self.is_oauth_expired(resp_obj):
-                    self.regenerate_analytics_oauth_token()
-                    resp_obj = self.submit_import_request(request_url, config_data, request_headers, self.access_token,
-                                                          files)
-                    if not (str(resp_obj.status_code).startswith("2")):
-                        raise ServerError(resp_obj.resp_content, False)
-                else:
-                    raise ServerError(resp_obj.resp_content, False)
-
-            response = resp_obj.resp_content
-            response = json.loads(response)
-            config["batchKey"] = response["data"]["batchKey"]
-            time.sleep(2)
+        batches = read_file_in_batches(file_path, batch_size)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                next_batch = executor.submit(encode_next_batch, batches, self.COMMON_ENCODE_CHAR)
+                batch_number = 0
+                while True:
+                    wait_start_time = time.monotonic()
+                    batch = next_batch.result()
+                    if batch == None:
+                        break
+                    read_wait_time = time.monotonic() - wait_start_time
+                    batch_data, line_count, is_last_batch = batch
+                    if not is_last_batch:
+                        next_batch = executor.submit(encode_next_batch, batches, self.COMMON_ENCODE_CHAR)
+                    batch_number += 1
+
+                    config["isLastBatch"] = "true" if is_last_batch else "false"
+                    config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
+
+                    upload_start_time = time.monotonic()
+                    resp_obj = self.submit_batch_import_request(request_url, config_data, request_headers, batch_data, pacer,
+                                                                retry_policy)
+                    upload_time = time.monotonic() - upload_start_time
+
+                    response = resp_obj.resp_content
+                    response = json.loads(response)
+                    config["batchKey"] = response["data"]["batchKey"]
+
+                    delay = 0 if is_last_batch else pacer.get_delay()
+                    if stats_callback != None:
+                        stats_callback(pacer.get_batch_stats(batch_number, line_count, len(batch_data), read_wait_time,
+                                                             upload_time, delay))
+                    if is_last_batch:
+                        break
+                    if delay > 0:
+                        time.sleep(delay)
+        finally:
+            batches.close()
 
         return response
 
+    def submit_batch_import_request(self, request_url, config_data, request_headers, batch_data, pacer, retry_policy):
+        """
+        Internal method to upload a single batch, retrying it while the server throttles the request.
+        """
+        pacer.start_batch()
+        is_oauth_regenerated = False
+        while True:
+            access_token = self.get_access_token()
+            files = {'FILE': BytesIO(batch_data)}
+            resp_obj = self.submit_import_request(request_url, config_data, request_headers, access_token, files,
+                                                  retry_policy=retry_policy)
+
+            if str(resp_obj.status_code).startswith("2"):
+                pacer.on_success()
+                return resp_obj
+            if self.is_oauth_expired(resp_obj) and not is_oauth_regenerated:
+                self.refresh_access_token(access_token)
+                is_oauth_regenerated = True
+            elif pacer.is_throttled(resp_obj) and pacer.can_retry():
+                time.sleep(pacer.on_throttled(resp_obj))
+            else:
+                raise ServerError(resp_obj.resp_content, False)
+
     def send_import_api_request(self, request_url, config, request_headers, file_path, data=None):
         """
         Internal method to handle HTTP request.
         """
-        if self.access_token == None:
-            self.regenerate_analytics_oauth_token()
+        access_token = self.get_access_token()
 
         request_url = self.analytics_server_url + request_url
+        is_idempotent = self.retry_policy.is_import_idempotent(config)
         config_data = None
         if bool(config):
             config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
@@ -2419,19 +2506,19 @@ class AnalyticsClient:
                 config_data = ""  
 
             config_data += "DATA=" + urllib.parse.quote_plus(json.dumps(data)) 
-            resp_obj = self.submit_import_request(request_url, config_data, request_headers, self.access_token)
+            resp_obj = self.submit_import_request(request_url, config_data, request_headers, access_token, None, is_idempotent)
         else:
             files = {'FILE': open(file_path,'rb')}
-            resp_obj = self.submit_import_request(request_url, config_data, request_headers, self.access_token, files)    
+            resp_obj = self.submit_import_request(request_url, config_data, request_headers, access_token, files, is_idempotent)    
         
 
         if not (str(resp_obj.status_code).startswith("2")):
             if(self.is_oauth_expired(resp_obj)):
-                self.regenerate_analytics_oauth_token()
+                access_token = self.refresh_access_token(access_token)
                 if bool(data):
-                    resp_obj = self.submit_import_request(request_url, config_data, request_headers, self.access_token)
+                    resp_obj = self.submit_import_request(request_url, config_data, request_headers, access_token, None, is_idempotent)
                 else:
-                    resp_obj = self.submit_import_request(request_url, config_data, request_headers, self.access_token, files)
+                    resp_obj = self.submit_import_request(request_url, config_data, request_headers, access_token, files, is_idempotent)
                 if not (str(resp_obj.status_code).startswith("2")):
                     raise ServerError(resp_obj.resp_content, False)
             else:
@@ -2442,121 +2529,149 @@ class AnalyticsClient:
         return response
 
 
-    def submit_import_request(self, request_url, parameters, request_headers = {}, access_token = None, files = None):
+    def submit_import_request(self, request_url, parameters, request_headers = {}, access_token = None, files = None,
+                              is_idempotent = False, retry_policy = None):
         """
         Internal method to send request to server.
+        Failed imports are retried only if is_idempotent is True, see L{RetryPolicy}.
         """
-        try:
-            if request_headers == None:
-                request_headers = {}
+        if request_headers == None:
+            request_headers = {}
 
-            if access_token != None:
-                request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
+        if access_token != None:
+            request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
 
-            request_headers["User-Agent"] = self.user_agent
-            
-            req_obj = req_obj = requests.Session()
-            if self.proxy:
-                proxy_details = {
-                    "http" : "http://" + self.proxy_host + ":" + self.proxy_port,
-                    "https": "http://" + self.proxy_host + ":" + self.proxy_port
-                }
-                req_obj.proxies = proxy_details
-                if self.proxy_user_name != None and self.proxy_password != None:
-                    proxy_auth_details = HTTPProxyDigestAuth(self.proxy_user_name, self.proxy_password)
-                    req_obj.auth = proxy_auth_details
+        request_headers["User-Agent"] = self.user_agent
 
+        def send_request():
+            self.wait_for_request_slot("POST", request_url, request_headers)
+            req_obj = self.get_request_obj(request_url)
             if bool(files):
-                resp_obj = req_obj.post(request_url, params = parameters, files = files, headers = request_headers, verify=not self.exclude_ssl)
-            else:
-                resp_obj = req_obj.post(request_url, params = parameters, headers = request_headers, verify=not self.exclude_ssl)   
-            
-            resp_obj = response_obj(resp_obj)
-        except Exception as ex:
-            resp_obj = response_obj(ex)
-        
-        return resp_obj    
+                # A previous attempt has read the files to the end.
+                for file in files.values():
+                    file.seek(0)
+                return req_obj.post(request_url, params = parameters, files = files, headers = request_headers, verify=not self.exclude_ssl)
+            return req_obj.post(request_url, params = parameters, headers = request_headers, verify=not self.exclude_ssl)
+
+        resp_obj = self.send_with_retry("POST", request_url, send_request, is_idempotent, retry_policy)
+        return response_obj(resp_obj)
 
-    def send_export_api_request(self, request_url, config, request_headers, file_path):
+    def send_export_api_request(self, request_url, config, request_headers, file_path, progress_callback=None):
         """
         Internal method to handle HTTP request.
         """
-        file = open(file_path,"wb")
+        resp_obj = self.open_export_response(request_url, config, request_headers)
+        try:
+            self.write_export_response(resp_obj, file_path, progress_callback)
+        finally:
+            resp_obj.close()
+        return
 
-        if self.access_token == None:
-            self.regenerate_analytics_oauth_token()
+    def iter_export_api_response(self, request_url, config, request_headers):
+        """
+        Internal method to handle HTTP request, yielding the response in chunks of export_chunk_size bytes.
+        The response is closed when the generator is closed, even if it was not read to the end.
+        """
+        resp_obj = self.open_export_response(request_url, config, request_headers)
+        try:
+            for chunk in resp_obj.iter_content(chunk_size=self.export_chunk_size):
+                yield chunk
+        finally:
+            resp_obj.close()
+
+    def open_export_response(self, request_url, config, request_headers):
+        """
+        Internal method to send the export request, and to return the streamed response once it has succeeded.
+        """
+        access_token = self.get_access_token()
 
         request_url = self.analytics_server_url + request_url
         config_data = None
         if bool(config):
             config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
 
-        resp_obj = self.submit_export_request(request_url, config_data, request_headers, self.access_token)
+        resp_obj = self.submit_export_request(request_url, config_data, request_headers, access_token)
 
         if not (str(resp_obj.status_code).startswith("2")):
-            resp_obj = response_obj(resp_obj)
-            if(self.is_oauth_expired(resp_obj)):
-                self.regenerate_analytics_oauth_token()
-                resp_obj = self.submit_export_request(request_url, config_data, request_headers, self.access_token)
+            error_resp_obj = response_obj(resp_obj)
+            resp_obj.close()
+            if(self.is_oauth_expired(error_resp_obj)):
+                access_token = self.refresh_access_token(access_token)
+                resp_obj = self.submit_export_request(request_url, config_data, request_headers, access_token)
                 if not (str(resp_obj.status_code).startswith("2")):
-                    raise ServerError(resp_obj.resp_content, False)
+                    error_resp_obj = response_obj(resp_obj)
+                    resp_obj.close()
+                    raise ServerError(error_resp_obj.resp_content, False)
             else:
-                raise ServerError(resp_obj.resp_content, False)
+                raise ServerError(error_resp_obj.resp_content, False)
+        return resp_obj
 
-        file.write(resp_obj.content)
-        file.close()
-        return
+    def write_export_response(self, resp_obj, file_path, progress_callback=None):
+        """
+        Internal method to stream the export response to the file in chunks of export_chunk_size bytes,
+        so that memory usage stays bounded irrespective of the export size.
+        The partially written file is removed if the download fails or is interrupted.
+        """
+        total_bytes = self.get_export_content_length(resp_obj)
+        bytes_written = 0
+        try:
+            with open(file_path, "wb") as file:
+                for chunk in resp_obj.iter_content(chunk_size=self.export_chunk_size):
+                    file.write(chunk)
+                    bytes_written += len(chunk)
+                    if progress_callback != None:
+                        progress_callback(bytes_written, total_bytes)
+        except BaseException:
+            remove_partial_file(file_path)
+            raise
+
+    def get_export_content_length(self, resp_obj):
+        """
+        Internal method to get the size of the export response body, or None if it is not known upfront.
+        """
+        content_length = resp_obj.headers.get("Content-Length")
+        # Content-Length is the size on the wire, which does not match the decoded size for encoded responses.
+        if content_length == None or resp_obj.headers.get("Content-Encoding"):
+            return None
+        return int(content_length)
 
 
     def submit_export_request(self, request_url, parameters, request_headers = {}, access_token = None):
         """
         Internal method to send request to server.
         """
-        try:
-            if request_headers == None:
-                request_headers = {}
+        if request_headers == None:
+            request_headers = {}
 
-            if access_token != None:
-                request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
+        if access_token != None:
+            request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
 
-            request_headers["User-Agent"] = self.user_agent
-            
-            req_obj = req_obj = requests.Session()
-            if self.proxy:
-                proxy_details = {
-                    "http" : "http://" + self.proxy_host + ":" + self.proxy_port,
-                    "https": "http://" + self.proxy_host + ":" + self.proxy_port
-                }
-                req_obj.proxies = proxy_details
-                if self.proxy_user_name != None and self.proxy_password != None:
-                    proxy_auth_details = HTTPProxyDigestAuth(self.proxy_user_name, self.proxy_password)
-                    req_obj.auth = proxy_auth_details
-
-            resp_obj = req_obj.get(request_url, params = parameters, headers = request_headers, verify=not self.exclude_ssl)
-            
-        except Exception as ex:
-            resp_obj = response_obj(ex)
-        
-        return resp_obj    
+        request_headers["User-Agent"] = self.user_agent
+
+        def send_request():
+            self.wait_for_request_slot("GET", request_url, request_headers)
+            req_obj = self.get_request_obj(request_url)
+            return req_obj.get(request_url, params = parameters, headers = request_headers, verify=not self.exclude_ssl, stream=True)
+
+        return self.send_with_retry("GET", request_url, send_request)
 
     def send_api_request(self, request_method, request_url, config, request_headers, is_json_response = True):
         """
         Internal method to handle HTTP request.
         """
-        if self.access_token == None:
-            self.regenerate_analytics_oauth_token()
+        access_token = self.get_access_token()
 
         request_url = self.analytics_server_url + request_url
         config_data = None
         if bool(config):
             config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
 
-        resp_obj = self.submit_request(request_method, request_url, config_data, request_headers, self.access_token)
+        resp_obj = self.submit_request(request_method, request_url, config_data, request_headers, access_token)
 
         if not (str(resp_obj.status_code).startswith("2")):
             if(self.is_oauth_expired(resp_obj)):
-                self.regenerate_analytics_oauth_token()
-                resp_obj = self.submit_request(request_method, request_url, config_data, request_headers, self.access_token)
+                access_token = self.refresh_access_token(access_token)
+                resp_obj = self.submit_request(request_method, request_url, config_data, request_headers, access_token)
                 if not (str(resp_obj.status_code).startswith("2")):
                     raise ServerError(resp_obj.resp_content, False)
             else:
@@ -2576,25 +2691,17 @@ class AnalyticsClient:
         """
         Internal method to send request to server.
         """
-        try:
-            if request_headers == None:
-                request_headers = {}
+        if request_headers == None:
+            request_headers = {}
 
-            if access_token != None:
-                request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
+        if access_token != None:
+            request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
 
-            request_headers["User-Agent"] = self.user_agent
+        request_headers["User-Agent"] = self.user_agent
 
-            req_obj = req_obj = requests.Session()
-            if self.proxy:
-                proxy_details = {
-                    "http" : "http://" + self.proxy_host + ":" + self.proxy_port,
-                    "https": "http://" + self.proxy_host + ":" + self.proxy_port
-                }
-                req_obj.proxies = proxy_details
-                if self.proxy_user_name != None and self.proxy_password != None:
-                    proxy_auth_details = HTTPProxyDigestAuth(self.proxy_user_name, self.proxy_password)
-                    req_obj.auth = proxy_auth_details
+        def send_request():
+            self.wait_for_request_slot(request_method, request_url, request_headers)
+            req_obj = self.get_request_obj(request_url)
 
             resp_obj = None
 
@@ -2606,19 +2713,111 @@ class AnalyticsClient:
                 resp_obj = req_obj.put(request_url, params = parameters, headers = request_headers, verify=not self.exclude_ssl)
             elif request_method == "DELETE":
                 resp_obj = req_obj.delete(request_url, params = parameters, headers = request_headers, verify=not self.exclude_ssl)
-            
-            resp_obj = response_obj(resp_obj)
-        except Exception as ex:
-            resp_obj = response_obj(ex)
-        
-        return resp_obj
+            return resp_obj
+
+        resp_obj = self.send_with_retry(request_method, request_url, send_request)
+        return response_obj(resp_obj)
 
-    def get_request_obj(self):
+    def send_with_retry(self, request_method, request_url, send_request, is_idempotent = None, retry_policy = None):
         """
-        Internal method for getting OAuth token.
+        Internal method to send a request through send_request, and to send it again for as long as
+        the retry policy allows it.
+        @param is_idempotent: Whether the request can safely be applied twice. Decided by the retry policy
+        from the method and url if C{None}.
+        @param retry_policy: The L{RetryPolicy} to follow. Defaults to the retry_policy of the client.
+        """
+        if retry_policy == None:
+            retry_policy = self.retry_policy
+        if is_idempotent == None:
+            is_idempotent = retry_policy.is_idempotent(request_method, request_url)
+
+        attempt = 1
+        while True:
+            try:
+                resp_obj = send_request()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as ex:
+                if not retry_policy.should_retry_error(is_idempotent, self.is_request_unsent(ex), attempt):
+                    raise
+                delay = retry_policy.get_delay(attempt)
+            else:
+                if not retry_policy.should_retry_response(resp_obj.status_code, is_idempotent, attempt):
+                    return resp_obj
+                delay = retry_policy.get_delay(attempt, get_retry_after(resp_obj.headers))
+                if delay == None:
+                    return resp_obj
+                resp_obj.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def is_request_unsent(self, ex):
+        """
+        Internal method to check whether the request failed before it reached the server.
+        """
+        if isinstance(ex, requests.exceptions.ConnectTimeout):
+            return True
+        # requests wraps the connection failures of urllib3 in a ConnectionError.
+        reason = getattr(ex.args[0], "reason", None) if ex.args else None
+        return isinstance(reason, NewConnectionError)
+
+    def wait_for_request_slot(self, request_method, request_url, request_headers):
+        """
+        Internal method to wait until the request scheduler allows the request to be sent for its org.
+        Requests without an org (for example the OAuth requests) are not scheduled.
+        """
+        org_id = request_headers.get("ZANALYTICS-ORGID")
+        if self.request_scheduler == None or org_id == None:
+            return
+        bucket = self.request_scheduler.get_bucket(org_id, request_method, request_url)
+        if bucket == None:
+            return
+        is_background = request_priority.get() == BACKGROUND_PRIORITY
+        is_waiting = False
+        try:
+            while True:
+                wait_time = self.request_scheduler.take_token(bucket, is_background)
+                if wait_time == 0:
+                    return
+                if not is_waiting and not is_background:
+                    self.request_scheduler.add_waiter(bucket)
+                    is_waiting = True
+                time.sleep(wait_time)
+        finally:
+            if is_waiting:
+                self.request_scheduler.remove_waiter(bucket)
+
+    def get_request_obj(self, request_url):
+        """
+        Internal method to get the pooled session for the host of the given url.
+        Sessions are kept alive across requests so that connections are reused, and are evicted once
+        they have been idle for longer than pool_idle_timeout seconds.
+        """
+        url_parts = urllib.parse.urlsplit(request_url)
+        host_key = url_parts.scheme + "://" + url_parts.netloc
+        current_time = time.monotonic()
+
+        with self.sessions_lock:
+            for key in list(self.sessions):
+                session, last_used_time = self.sessions[key]
+                if current_time - last_used_time > self.pool_idle_timeout:
+                    session.close()
+                    del self.sessions[key]
+
+            if host_key in self.sessions:
+                req_obj = self.sessions[host_key][0]
+            else:
+                req_obj = self.create_request_obj()
+            self.sessions[host_key] = (req_obj, current_time)
+        return req_obj
+
+    def create_request_obj(self):
+        """
+        Internal method to create a new keep-alive session with the configured pool size and proxy settings.
         """
         req_obj = requests.Session()
-            
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        req_obj.mount("https://", adapter)
+        req_obj.mount("http://", adapter)
+
         if self.proxy:
             proxy_details = {
                 "http" : "http://" + self.proxy_host + ":" + self.proxy_port,
@@ -2626,10 +2825,19 @@ class AnalyticsClient:
             }
             req_obj.proxies = proxy_details
             if self.proxy_user_name != None and self.proxy_password != None:
-                proxy_auth_details = HTTPProxyDigestAuth(self.proxy_user_name, self.proxy_password)
+                proxy_auth_details = HTTPProxyAuth(self.proxy_user_name, self.proxy_password)
                 req_obj.auth = proxy_auth_details
         return req_obj
 
+    def close(self):
+        """
+        Closes all the pooled sessions held by the client.
+        """
+        with self.sessions_lock:
+            for session, last_used_time in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
 
     def is_oauth_expired(self, resp_obj):
         """
@@ -2643,6 +2851,96 @@ class AnalyticsClient:
                 return False
 
 
+    def get_access_token(self):
+        """
+        Internal method to get a valid access token.
+        The token is regenerated in the foreground only when it is missing or about to expire. Once it is within
+        token_refresh_margin seconds of expiry it is regenerated in the background, and callers keep using the
+        current token meanwhile.
+        """
+        access_token = self.access_token
+        remaining_time = self.get_token_remaining_time()
+        if access_token == None or remaining_time <= self.token_expiry_margin:
+            return self.refresh_access_token(access_token)
+        if remaining_time <= self.token_refresh_margin:
+            self.start_background_token_refresh(access_token)
+        return access_token
+
+    def get_token_remaining_time(self):
+        """
+        Internal method to get the number of seconds left before the access token expires.
+        """
+        if self.access_token_expiry == None:
+            return math.inf
+        return self.access_token_expiry - time.time()
+
+    def refresh_access_token(self, stale_token):
+        """
+        Internal method to regenerate the access token once the given token is found to be stale.
+        Concurrent callers are collapsed into a single regeneration, the callers waiting on the lock
+        get the token that was regenerated meanwhile.
+        """
+        with self.token_lock:
+            if self.access_token != stale_token and self.access_token != None \
+                    and self.get_token_remaining_time() > self.token_expiry_margin:
+                return self.access_token
+            self.load_or_regenerate_access_token(stale_token)
+            return self.access_token
+
+    def load_or_regenerate_access_token(self, stale_token):
+        """
+        Internal method to take the access token from the token cache when another process has already
+        regenerated it, and to regenerate and cache it otherwise.
+        """
+        if self.token_cache == None:
+            self.regenerate_analytics_oauth_token()
+            return
+
+        try:
+            lock_fd = self.token_cache.acquire_lock()
+        except OSError:
+            # An unusable cache directory should not stop the client from authenticating.
+            self.regenerate_analytics_oauth_token()
+            return
+
+        try:
+            cached_token, cached_expiry = self.token_cache.read()
+            if cached_token != None and cached_token != stale_token \
+                    and cached_expiry - time.time() > self.token_expiry_margin:
+                self.access_token = cached_token
+                self.access_token_expiry = cached_expiry
+                return
+
+            self.regenerate_analytics_oauth_token()
+            if self.access_token_expiry != None:
+                try:
+                    self.token_cache.write(self.access_token, self.access_token_expiry)
+                except OSError:
+                    pass
+        finally:
+            self.token_cache.release_lock(lock_fd)
+
+    def start_background_token_refresh(self, stale_token):
+        """
+        Internal method to regenerate the access token on a background thread, unless one is already running.
+        """
+        if self.token_refresh_thread != None and self.token_refresh_thread.is_alive():
+            return
+        self.token_refresh_thread = threading.Thread(target=self.refresh_access_token_in_background,
+                                                     args=(stale_token,), daemon=True)
+        self.token_refresh_thread.start()
+
+    def refresh_access_token_in_background(self, stale_token):
+        """
+        Internal method to regenerate the access token ahead of its expiry.
+        """
+        try:
+            self.refresh_access_token(stale_token)
+        except Exception:
+            # Failures are not fatal here, the token is regenerated in the foreground once it is about to expire.
+            pass
+
+
     def regenerate_analytics_oauth_token(self):
         """
         Internal method for getting OAuth token.
@@ -2652,6 +2950,7 @@ class AnalyticsClient:
         oauth_params["client_secret"] = self.client_secret
         oauth_params["refresh_token"] = self.refresh_token
         oauth_params["grant_type"] = "refresh_token"
+        request_time = time.time()
         oauth_params = urllib.parse.urlencode(oauth_params) #.encode(self.COMMON_ENCODE_CHAR)
         req_url = self.accounts_server_url + "/oauth/v2/token"
         oauth_resp_obj = self.submit_request("POST", req_url, oauth_params)
@@ -2660,11 +2959,377 @@ class AnalyticsClient:
             oauth_json_resp = json.loads(oauth_resp_obj.resp_content)
             if("access_token" in oauth_json_resp):
                 self.access_token = oauth_json_resp["access_token"]
+                expires_in = oauth_json_resp.get("expires_in")
+                self.access_token_expiry = request_time + float(expires_in) if expires_in else None
                 return
 
         raise ServerError(oauth_resp_obj.resp_content, True)
 
 
+def read_file_in_batches(file_path, batch_size):
+    """
+    Internal generator that reads the file in a single pass and yields (batch, line_count, is_last_batch) tuples.
+    Every batch is the header line followed by at most batch_size data lines, so only one batch is held
+    in memory at a time irrespective of the file size.
+    """
+    with open(file_path, 'r') as file:
+        file_header = file.readline()
+        next_line = file.readline()
+        while next_line:
+            batch_lines = [next_line]
+            batch_lines.extend(itertools.islice(file, batch_size - 1))
+            next_line = file.readline()
+            yield file_header + "".join(batch_lines), len(batch_lines), not next_line
+
+
+def encode_next_batch(batches, encoding):
+    """
+    Internal method to read and encode the next batch from L{read_file_in_batches}.
+    Returns (batch_data, line_count, is_last_batch), or None once the file is exhausted.
+    """
+    batch = next(batches, None)
+    if batch == None:
+        return None
+    batch_content, line_count, is_last_batch = batch
+    return batch_content.encode(encoding), line_count, is_last_batch
+
+
+class BatchImportPacer:
+    """
+    Internal class that decides how long to wait between import batches, based on the tool_config
+    passed to the batch import methods.
+    - pacing: "adaptive" (default) or "fixed".
+    - batchDelay: Seconds to wait after every batch in fixed mode. Defaults to 2.
+    - maxBatchDelay: Upper bound of the adaptive delay in seconds. Defaults to 60.
+    - maxThrottleRetries: Number of times a throttled batch is resent before giving up. Defaults to 5.
+    - batchStatsCallback: Called with the timing stats of every batch. Can be C{None}.
+    In adaptive mode batches are sent back to back while the server keeps up. A throttled batch (HTTP 429 / 503)
+    doubles the delay, honouring the Retry-After header, and every successful batch halves it again.
+    """
+    THROTTLE_STATUS_CODES = (429, 503)
+    MIN_ADAPTIVE_DELAY = 0.1
+
+    def __init__(self, tool_config):
+        self.is_adaptive = tool_config.get("pacing", "adaptive") == "adaptive"
+        self.fixed_delay = float(tool_config.get("batchDelay", 2))
+        self.max_delay = float(tool_config.get("maxBatchDelay", 60))
+        self.max_throttle_retries = int(tool_config.get("maxThrottleRetries", 5))
+        self.delay = 0
+        self.throttle_count = 0
+
+    def start_batch(self):
+        self.throttle_count = 0
+
+    def is_throttled(self, resp_obj):
+        return resp_obj.status_code in self.THROTTLE_STATUS_CODES
+
+    def can_retry(self):
+        return self.throttle_count < self.max_throttle_retries
+
+    def on_throttled(self, resp_obj):
+        """
+        Records a throttled batch and returns the number of seconds to wait before resending it.
+        """
+        self.throttle_count += 1
+        self.delay = min(self.max_delay, max(self.delay * 2, 1))
+        retry_after = get_retry_after(resp_obj.headers)
+        return max(self.delay, retry_after or 0)
+
+    def on_success(self):
+        self.delay = self.delay / 2
+        if self.delay < self.MIN_ADAPTIVE_DELAY:
+            self.delay = 0
+
+    def get_delay(self):
+        return self.delay if self.is_adaptive else self.fixed_delay
+
+    def get_batch_stats(self, batch_number, line_count, batch_bytes, read_wait_time, upload_time, delay):
+        return {
+            "batchNumber": batch_number,
+            "lineCount": line_count,
+            "bytes": batch_bytes,
+            "readWaitTime": read_wait_time,
+            "uploadTime": upload_time,
+            "linesPerSecond": line_count / upload_time if upload_time > 0 else None,
+            "throttleCount": self.throttle_count,
+            "delay": delay
+        }
+
+
+def remove_partial_file(file_path):
+    """
+    Internal method to remove a file that was only partially written, ignoring the file being already gone.
+    """
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def get_retry_after(headers):
+    """
+    Internal method to get the Retry-After header value in seconds, or None if it is absent or invalid.
+    The header can either be a number of seconds or an HTTP date.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after == None:
+        return None
+    try:
+        return max(0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_time = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_time == None or retry_time.tzinfo == None:
+        return None
+    return max(0, retry_time.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Internal class that decides whether a failed request is sent again, and how long to wait before that.
+    - max_attempts: Total number of attempts including the first one. Defaults to 4.
+    - base_delay: Backoff before the first retry in seconds, doubled for every further retry. Defaults to 0.5.
+    - max_delay: Upper bound of the backoff in seconds. Defaults to 30.
+    - max_retry_after: Longest Retry-After in seconds that is waited for. If the server asks to wait longer,
+      the response is returned as is. Defaults to 120.
+    - retry_status_codes: Status codes that are retried. Defaults to 429, 500, 502, 503 and 504.
+    Only safe retries are made. A request that failed with a 5xx status or a broken connection is retried only if it
+    is idempotent, since the server might have applied it already. A throttled (429) request and a request that could
+    not be sent at all did not reach the server, so they are retried irrespective of the method.
+    GET, PUT and DELETE requests are idempotent and POST requests are not, unless ENDPOINT_RULES says otherwise.
+    The backoff is fully jittered so that concurrent requests do not retry in lockstep, and is never shorter than
+    the Retry-After header of the response.
+    """
+    IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+    REJECTED_STATUS_CODES = (429,)
+    #: (method, path pattern, is_idempotent) overrides of the method default. The first matching rule wins.
+    ENDPOINT_RULES = [
+        ("POST", r"/oauth/v2/token$", True),
+        ("PUT", r"/publish/privatelink$", False)
+    ]
+    #: Import types for which importing the same data twice gives the same result.
+    IDEMPOTENT_IMPORT_TYPES = ("truncateadd", "updateadd")
+
+    def __init__(self, max_attempts=4, base_delay=0.5, max_delay=30, max_retry_after=120,
+                 retry_status_codes=(429, 500, 502, 503, 504)):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retry_status_codes = retry_status_codes
+
+    def is_idempotent(self, request_method, request_url):
+        path = urllib.parse.urlsplit(request_url).path
+        for method, path_pattern, is_idempotent in self.ENDPOINT_RULES:
+            if method == request_method and re.search(path_pattern, path):
+                return is_idempotent
+        return request_method in self.IDEMPOTENT_METHODS
+
+    def is_import_idempotent(self, config):
+        return bool(config) and config.get("importType") in self.IDEMPOTENT_IMPORT_TYPES
+
+    def should_retry_response(self, status_code, is_idempotent, attempt):
+        if attempt >= self.max_attempts or status_code not in self.retry_status_codes:
+            return False
+        return is_idempotent or status_code in self.REJECTED_STATUS_CODES
+
+    def should_retry_error(self, is_idempotent, is_unsent, attempt):
+        return attempt < self.max_attempts and (is_idempotent or is_unsent)
+
+    def get_delay(self, attempt, retry_after=None):
+        """
+        Returns the number of seconds to wait before the next attempt, or None if the Retry-After is too long to wait for.
+        """
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after == None:
+            return backoff
+        if retry_after > self.max_retry_after:
+            return None
+        return max(retry_after, backoff)
+
+
+INTERACTIVE_PRIORITY = "interactive"
+BACKGROUND_PRIORITY = "background"
+#: Priority of the requests sent from the current thread or task, see L{background_priority}.
+request_priority = contextvars.ContextVar("request_priority", default=INTERACTIVE_PRIORITY)
+
+
+@contextmanager
+def background_priority():
+    """
+    Sends the requests made within the block with background priority, so that they give way to interactive calls
+    of the same org and traffic class. Tasks created within the block inherit the priority.
+    """
+    token = request_priority.set(BACKGROUND_PRIORITY)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+request_reservation = contextvars.ContextVar("request_reservation", default=None)
+
+
+@contextmanager
+def reserved_requests(request_scheduler, org_id, traffic_class, count):
+    """
+    Takes up to count tokens of the traffic class of the org up front, for a batch of requests made within the block,
+    so that the batch is sent as one burst instead of queueing behind the rate limit request by request. Only the
+    tokens available right away are reserved, the other requests of the batch wait for their turn as usual.
+    Tasks created within the block share the reservation, and the unused tokens are given back at the end.
+    """
+    reservation = None
+    if request_scheduler != None and org_id != None:
+        reservation = request_scheduler.reserve(org_id, traffic_class, count)
+    token = request_reservation.set(reservation)
+    try:
+        yield reservation
+    finally:
+        request_reservation.reset(token)
+        if reservation != None:
+            request_scheduler.release(reservation)
+
+
+class RequestReservation:
+    """
+    Internal class. Tokens taken from a bucket for a batch of requests, see L{reserved_requests}.
+    """
+    def __init__(self, bucket, tokens):
+        self.bucket = bucket
+        self.tokens = tokens
+
+
+class TokenBucket:
+    """
+    Internal class. Holds at most capacity tokens and is refilled with rate tokens every second of the clock.
+    """
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.refill_time = clock()
+        self.interactive_waiters = 0
+
+    def refill(self):
+        current_time = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (current_time - self.refill_time) * self.rate)
+        self.refill_time = current_time
+
+    def take(self):
+        """
+        Takes a token and returns 0, or returns the number of seconds until a token is available.
+        """
+        self.refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def take_available(self, count):
+        """
+        Takes up to count of the tokens available right away, and returns the number of tokens taken.
+        """
+        self.refill()
+        taken = min(count, int(self.tokens))
+        self.tokens -= taken
+        return taken
+
+
+class RequestScheduler:
+    """
+    Internal class that paces the requests of every org with token buckets, so that concurrent tool calls get a steady
+    throughput close to the API quota instead of bursting into throttling errors.
+    Every org has a separate budget for each traffic class, given in requests per second by rates.
+    - metadata: All the requests that are not poll or bulk requests.
+    - poll: Status checks of export and import jobs.
+    - bulk: Imports, exports and export job downloads.
+    A traffic class with no rate is not limited. A bucket holds burst_seconds worth of tokens, so that the requests of
+    a few concurrent tool calls are sent at once, while a sustained load is held to the rate.
+    Interactive calls have priority: background requests wait while an interactive request of the same bucket is waiting.
+    The buckets are refilled by the clock, time.monotonic by default.
+    """
+    DEFAULT_RATES = {"metadata": 10, "poll": 5, "bulk": 5}
+    DEFAULT_BURST_SECONDS = 10
+    POLL_PATH_PATTERN = r"/(exportjobs|importjobs)/[^/]+$"
+    BULK_PATH_PATTERN = r"(/bulk/|/data$|/data/batch$)"
+
+    def __init__(self, rates=None, burst_seconds=None, clock=time.monotonic):
+        self.rates = dict(self.DEFAULT_RATES if rates == None else rates)
+        self.burst_seconds = self.DEFAULT_BURST_SECONDS if burst_seconds == None else burst_seconds
+        self.clock = clock
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def get_traffic_class(self, request_method, request_url):
+        path = urllib.parse.urlsplit(request_url).path
+        if request_method == "GET" and re.search(self.POLL_PATH_PATTERN, path):
+            return "poll"
+        if re.search(self.BULK_PATH_PATTERN, path):
+            return "bulk"
+        return "metadata"
+
+    def get_bucket(self, org_id, request_method, request_url):
+        """
+        Returns the bucket of the org for the traffic class of the request, or None if the traffic class is not limited.
+        """
+        return self.get_class_bucket(org_id, self.get_traffic_class(request_method, request_url))
+
+    def get_class_bucket(self, org_id, traffic_class):
+        rate = self.rates.get(traffic_class)
+        if not rate:
+            return None
+        with self.lock:
+            bucket = self.buckets.get((org_id, traffic_class))
+            if bucket == None:
+                bucket = TokenBucket(rate, max(1, rate * self.burst_seconds), self.clock)
+                self.buckets[(org_id, traffic_class)] = bucket
+            return bucket
+
+    def take_token(self, bucket, is_background):
+        """
+        Takes a token from the bucket and returns 0, or returns the number of seconds to wait before trying again.
+        """
+        with self.lock:
+            reservation = request_reservation.get()
+            if reservation != None and reservation.bucket is bucket and reservation.tokens > 0:
+                reservation.tokens -= 1
+                return 0
+            if is_background and bucket.interactive_waiters > 0:
+                return 1 / bucket.rate
+            return bucket.take()
+
+    def reserve(self, org_id, traffic_class, count):
+        """
+        Takes up to count of the tokens available right away in the bucket of the org for the traffic class, and returns
+        them as a L{RequestReservation}, or None if the traffic class is not limited.
+        """
+        bucket = self.get_class_bucket(org_id, traffic_class)
+        if bucket == None:
+            return None
+        with self.lock:
+            return RequestReservation(bucket, bucket.take_available(count))
+
+    def release(self, reservation):
+        """
+        Gives the unused tokens of the reservation back to its bucket.
+        """
+        with self.lock:
+            reservation.bucket.tokens = min(reservation.bucket.capacity, reservation.bucket.tokens + reservation.tokens)
+            reservation.tokens = 0
+
+    def add_waiter(self, bucket):
+        with self.lock:
+            bucket.interactive_waiters += 1
+
+    def remove_waiter(self, bucket):
+        with self.lock:
+            bucket.interactive_waiters -= 1
+
+
 class response_obj:
     """
     Internal class.
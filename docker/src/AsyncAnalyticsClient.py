@@ -0,0 +1,2966 @@
+#$Id$
+from io import BytesIO
+import urllib.parse
+import json
+import httpx
+import asyncio
+import time
+import inspect
+import math
+from AnalyticsClient import ServerError, response_obj, read_file_in_batches, encode_next_batch, BatchImportPacer, remove_partial_file, \
+    RetryPolicy, get_retry_after, RequestScheduler, request_priority, BACKGROUND_PRIORITY
+from utils.progress import get_progress_reporter
+
+class AsyncAnalyticsClient:
+    """
+    AsyncAnalyticsClient provides the asyncio based language binding to the https based API of Zoho Analytics.
+    It exposes the same API surface as C{AnalyticsClient}, with every request issuing method being awaitable.
+    """
+
+    CLIENT_VERSION = "2.6.0"
+    COMMON_ENCODE_CHAR = "UTF-8"
+
+    def __init__(self, client_id, client_secret, refresh_token):
+        """
+        Creates a new C{AsyncAnalyticsClient} instance.
+        @param client_id: User client id for OAUth
+        @type client_id:string
+        @param client_secret: User client secret for OAuth
+        @type client_secret:string
+        @param refresh_token: User's refresh token for OAUth).
+        @type refresh_token:string
+        """
+
+        self.proxy = False
+        self.proxy_host = None
+        self.proxy_port = None
+        self.proxy_user_name = None
+        self.proxy_password = None
+
+        self.accounts_server_url = "https://accounts.zoho.com"
+        self.analytics_server_url = "https://analyticsapi.zoho.com"
+        self.exclude_ssl = False
+        self.user_agent = "zoho-analytics-mcp-server"
+
+        self.pool_maxsize = 10
+        self.pool_idle_timeout = 300
+        self.export_chunk_size = 65536
+        self.clients = {}
+        self.retired_clients = []
+
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self.access_token = None
+        self.access_token_expiry = None
+        self.token_refresh_margin = 300
+        self.token_expiry_margin = 30
+        self.token_cache = None
+        self.token_lock = asyncio.Lock()
+        self.token_refresh_task = None
+        self.retry_policy = RetryPolicy()
+        self.request_scheduler = RequestScheduler()
+
+    def get_org_instance(self, org_id):
+        """
+        Returns a new C{OrgAPI} instance.
+        @param org_id: The id of the organization.
+        @type org_id:string
+        """
+        org_instance = AsyncAnalyticsClient.OrgAPI(self, org_id)
+        return org_instance
+
+    def get_workspace_instance(self, org_id, workspace_id):
+        """
+        Returns a new C{WorkspaceAPI} instance.
+        @param org_id: The id of the organization.
+        @type org_id:string
+        @param workspace_id: The id of the workspace.
+        @type workspace_id:string
+        """
+        workspace_instance = AsyncAnalyticsClient.WorkspaceAPI(self, org_id, workspace_id)
+        return workspace_instance
+
+    def get_view_instance(self, org_id, workspace_id, view_id):
+        """
+        Returns a new C{ViewAPI} instance.
+        @param org_id: The id of the organization.
+        @type org_id:string
+        @param workspace_id: The id of the workspace.
+        @type workspace_id:string
+        @param view_id: The id of the view.
+        @type view_id:string
+        """
+        view_instance = AsyncAnalyticsClient.ViewAPI(self, org_id, workspace_id, view_id)
+        return view_instance    
+
+    def get_bulk_instance(self, org_id, workspace_id):
+        """
+        Returns a new C{BulkAPI} instance.
+        @param org_id: The id of the organization.
+        @type org_id:string
+        @param workspace_id: The id of the workspace.
+        @type workspace_id:string
+        """
+        data_instance = AsyncAnalyticsClient.BulkAPI(self, org_id, workspace_id)
+        return data_instance
+
+
+    async def get_orgs(self):
+        """
+        Returns list of all accessible organizations.
+        @return: Organization list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/orgs"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]["orgs"]
+
+    async def get_workspaces(self):
+        """
+        Returns list of all accessible workspaces.
+        @return: Workspace list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/workspaces"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]
+
+    async def get_owned_workspaces(self):
+        """
+        Returns list of owned workspaces.
+        @return: Workspace list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/workspaces/owned"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]["workspaces"]
+
+    async def get_shared_workspaces(self):
+        """
+        Returns list of shared workspaces.
+        @return: Workspace list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/workspaces/shared"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]["workspaces"]
+
+    async def get_recent_views(self):
+        """
+        Returns list of recently accessed views.
+        @return: View list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/recentviews"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]["views"]
+
+    async def get_dashboards(self):
+        """
+        Returns list of all accessible dashboards.
+        @return: Dashboard list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/dashboards"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]
+
+    async def get_owned_dashboards(self):
+        """
+        Returns list of owned dashboards.
+        @return: Dashboard list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/dashboards/owned"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]["views"]
+
+    async def get_shared_dashboards(self):
+        """
+        Returns list of shared dashboards.
+        @return: Dashboard list.
+        @rtype:list
+        @raise ServerError: If the server has received the request but did not process the request 
+        due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        """
+        endpoint = "/restapi/v2/dashboards/shared"
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]["views"]
+
+    async def get_workspace_details(self, workspace_id):
+        """
+        Returns details of the specified workspace.
+        @param workspace_id: Id of the workspace.
+        @type workspace_id: string
+        @raise ServerError: If the server has received the request but did not process the request due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        @return: Workspace details.
+        @rtype:dictionary
+        """
+        endpoint = "/restapi/v2/workspaces/" + workspace_id
+        response = await self.send_api_request("GET", endpoint, None, None)
+        return response["data"]["workspaces"]   
+            
+    async def get_view_details(self, view_id, config = {}):
+        """
+        Returns details of the specified view.
+        @param view_id: Id of the view.
+        @type view_id: string
+        @param config: Contains any additional control parameters. Can be C{None}.
+        @type config:dictionary
+        @raise ServerError: If the server has received the request but did not process the request due to some error.
+        @raise ParseError: If the server has responded but client was not able to parse the response.
+        @return: View details.
+        @rtype:dictionary
+        """
+        endpoint = "/restapi/v2/views/" + view_id
+        response = await self.send_api_request("GET", endpoint, config, None)
+        return response["data"]["views"]  
+
+
+    class OrgAPI:
+        """
+        OrgAPI contains organization level operations.
+        """
+        def __init__(self, ac, org_id):
+            self.ac = ac
+            self.request_headers = {}
+            self.request_headers["ZANALYTICS-ORGID"] = org_id
+
+        async def create_workspace(self, workspace_name, config = {}):
+            """
+            Create a blank workspace in the specified organization.
+            @param workspace_name: The name of the workspace.
+            @type workspace_name:string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Created workspace id.
+            @rtype:string
+            """
+            config["workspaceName"] = workspace_name
+            endpoint = "/restapi/v2/workspaces/"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["workspaceId"])
+
+        async def get_admins(self):
+            """
+            Returns list of admins for a specified organization.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Organization admin list.
+            @rtype:list
+            """
+            endpoint = "/restapi/v2/orgadmins"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["orgAdmins"]
+
+        async def get_users(self):
+            """
+            Returns list of users for the specified organization.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: User list.
+            @rtype:list
+            """
+            endpoint = "/restapi/v2/users"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["users"]
+
+        async def add_users(self, email_ids, config = {}):
+            """
+            Add users to the specified organization.
+            @param email_ids: The email address of the users to be added.
+            @type email_ids:list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = "/restapi/v2/users"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def remove_users(self, email_ids, config = {}):
+            """
+            Remove users from the specified organization.
+            @param email_ids: The email address of the users to be removed.
+            @type email_ids:list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = "/restapi/v2/users"
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def activate_users(self, email_ids, config = {}):
+            """
+            Activate users in the specified organization.
+            @param email_ids: The email address of the users to be activated.
+            @type email_ids:list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = "/restapi/v2/users/active"
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def deactivate_users(self, email_ids, config = {}):
+            """
+            Deactivate users in the specified organization.
+            @param email_ids: The email address of the users to be deactivated.
+            @type email_ids:list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = "/restapi/v2/users/inactive"
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def change_user_role(self, email_ids, role, config = {}):
+            """
+            Change role for the specified users.
+            @param email_ids: The email address of the users to be deactivated.
+            @type email_ids:list
+            @param role: New role for the users.
+            @type role:string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            config["role"] = role
+            endpoint = "/restapi/v2/users/role"
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)    
+
+        async def get_subscription_details(self):
+            """
+            Returns subscription details of the specified organization.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Subscription details.
+            @rtype:dictionary
+            """
+            endpoint = "/restapi/v2/subscription"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["subscription"]
+
+
+        async def get_resource_details(self):
+            """
+            Returns resource usage details of the specified organization.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Resource details.
+            @rtype:dictionary
+            """
+            endpoint = "/restapi/v2/resources"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["resourceDetails"]    
+
+        async def get_meta_details(self, workspace_name, view_name):
+            """
+            Returns details of the specified workspace/view.
+            @param workspace_name: Name of the workspace.
+            @type workspace_name:string
+            @param view_name: Name of the view.
+            @type view_name:string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Workspace (or) View meta details.
+            @rtype:dictionary
+            """
+            config = {}
+            config["workspaceName"] = workspace_name
+            if view_name != None:
+                config["viewName"] = view_name
+            endpoint = "/restapi/v2/metadetails"    
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]
+
+
+    class WorkspaceAPI:
+        """
+        WorkspaceAPI contains workspace level operations.
+        """
+        def __init__(self, ac, org_id, workspace_id):
+            self.ac = ac
+            self.endpoint = "/restapi/v2/workspaces/" + workspace_id
+            self.request_headers = {}
+            self.request_headers["ZANALYTICS-ORGID"] = org_id 
+
+        async def copy(self, new_workspace_name, config = {}, dest_org_id = None):
+            """
+            Copy the specified workspace from one organization to another or within the organization.
+            @param new_workspace_name: Name of the new workspace.
+            @type new_workspace_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @param dest_org_id: Id of the organization where the destination workspace is present. Can be C{None}.
+            @type dest_org_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Copied workspace id.
+            @rtype:string
+            """
+            config["newWorkspaceName"] = new_workspace_name
+            headers = self.request_headers.copy()
+            if bool(dest_org_id):
+                headers["ZANALYTICS-DEST-ORGID"] = dest_org_id
+            response = await self.ac.send_api_request("POST", self.endpoint, config, headers)
+            return int(response["data"]["workspaceId"])
+
+        async def rename(self, workspace_name, config = {}):
+            """
+            Rename a specified workspace in the organization.
+            @param workspace_name: New name for the workspace.
+            @type workspace_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["workspaceName"] = workspace_name
+            response = await self.ac.send_api_request("PUT", self.endpoint, config, self.request_headers)
+
+        async def delete(self):
+            """
+            Delete a specified workspace in the organization.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            response = await self.ac.send_api_request("DELETE", self.endpoint, None, self.request_headers)
+
+        async def get_secret_key(self, config = {}):
+            """
+            Returns the secret key of the specified workspace.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Workspace secret key.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/secretkey"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["workspaceKey"]
+
+        async def add_favorite(self):
+            """
+            Adds a specified workspace as favorite.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/favorite"
+            response = await self.ac.send_api_request("POST", endpoint, None, self.request_headers)
+
+        async def remove_favorite(self):
+            """
+            Remove a specified workspace from favorite.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/favorite"
+            response = await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def add_default(self):
+            """
+            Adds a specified workspace as default.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/default"
+            response = await self.ac.send_api_request("POST", endpoint, None, self.request_headers)
+
+        async def remove_default(self):
+            """
+            Remove a specified workspace from default.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/default"
+            response = await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def get_admins(self):
+            """
+            Returns list of admins for the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Workspace admin list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/admins"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["workspaceAdmins"]
+
+        async def add_admins(self, email_ids, config = {}):
+            """
+            Add admins for the specified workspace.
+            @param email_ids: The email address of the admin users to be added.
+            @type email_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = self.endpoint + "/admins"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def remove_admins(self, email_ids, config = {}):
+            """
+            Remove admins from the specified workspace.
+            @param email_ids: The email address of the admin users to be removed.
+            @type email_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = self.endpoint + "/admins"
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def get_share_info(self):
+            """
+            Returns shared details of the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Workspace share info.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/share"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]   
+
+        async def share_views(self, view_ids, email_ids, permissions, config = {}):
+            """
+            Share views to the specified users.
+            @param view_ids: View ids which to be shared.
+            @type view_ids: list
+            @param email_ids: The email address of the users to whom the views need to be shared.
+            @type email_ids: list
+            @param permissions: Contains permission details.
+            @type permissions: dictionary
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["viewIds"] = view_ids
+            config["emailIds"] = email_ids
+            config["permissions"] = permissions
+            endpoint = self.endpoint + "/share"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def remove_share(self, view_ids, email_ids, config = {}):
+            """
+            Remove shared views for the specified users.
+            @param view_ids: View ids whose sharing needs to be removed.
+            @type view_ids: list
+            @param email_ids: The email address of the users to whom the sharing need to be removed.
+            @type email_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            if view_ids != None:
+                config["viewIds"] = view_ids
+            endpoint = self.endpoint + "/share"    
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def get_shared_details_for_views(self, view_ids):
+            """
+            Returns shared details of the specified views.
+            @param view_ids: View ids for which sharing details are required.
+            @type view_ids: list
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Shared information.
+            @rtype:list
+            """
+            config = {}
+            config["viewIds"] = view_ids
+            endpoint = self.endpoint + "/share/shareddetails"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["sharedDetails"]
+
+        async def get_folders(self):
+            """
+            Returns list of all accessible folders for the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Folder list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/folders"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["folders"]
+            
+        async def create_folder(self, folder_name, config = {}):
+            """
+            Create a folder in the specified workspace.
+            @param folder_name: Name of the folder to be created.
+            @type folder_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Created folder id.
+            @rtype:string
+            """
+            config["folderName"] = folder_name
+            endpoint = self.endpoint + "/folders"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["folderId"])                               
+         
+        async def get_views(self, config = {}):
+            """
+            Returns list of all accessible views for the specified workspace.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: View list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/views"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["views"]
+
+        async def create_table(self, table_design):
+            """
+            Create a table in the specified workspace.
+            @param table_design: Table structure.
+            @type table_design: dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: created table id.
+            @rtype:string
+            """
+            config = {}
+            config["tableDesign"] = table_design
+            endpoint = self.endpoint + "/tables"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["viewId"])
+
+        async def create_query_table(self, sql_query, query_table_name, config = {}):
+            """
+            Create a new query table in the workspace.
+            @param sql_query: SQL query to construct the query table.
+            @type sql_query: string
+            @param query_table_name: Name of the query table to be created.
+            @type query_table_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: created table id.
+            @rtype:string
+            """
+            config["sqlQuery"] = sql_query
+            config["queryTableName"] = query_table_name
+            endpoint = self.endpoint + "/querytables"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["viewId"])
+
+        async def edit_query_table(self, view_id, sql_query, config = {}):
+            """
+            Update the mentioned query table in the workspace.
+            @param view_id: Id of the query table to be updated.
+            @type view_id: string
+            @param sql_query: New SQL query to be updated.
+            @type sql_query: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["sqlQuery"] = sql_query
+            endpoint = self.endpoint + "/querytables/" + view_id
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def copy_views(self, view_ids, dest_workspace_id, config = {}, dest_org_id = None):
+            """
+            Copy the specified views from one workspace to another workspace.
+            @param view_ids: The id of the views to be copied.
+            @type view_ids: list
+            @param dest_workspace_id: The destination workspace id.
+            @type dest_workspace_id: string
+            @param dest_org_id: Id of the organization where the destination workspace is present. Can be C{None}.
+            @type dest_org_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: View list.
+            @rtype:list
+            """
+            config["viewIds"] = view_ids
+            config["destWorkspaceId"] = dest_workspace_id
+            endpoint = self.endpoint + "/views/copy"
+            headers = self.request_headers.copy()
+            if bool(dest_org_id):
+                headers["ZANALYTICS-DEST-ORGID"] = dest_org_id
+            response = await self.ac.send_api_request("POST", endpoint, config, headers)
+            return response["data"]["views"]     
+
+        async def enable_domain_access(self):
+            """
+            Enable workspace to the specified white label domain.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/wlaccess"
+            response = await self.ac.send_api_request("POST", endpoint, None, self.request_headers)
+
+        async def disable_domain_access(self):
+            """
+            Disable workspace from the specified white label domain.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/wlaccess"
+            response = await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def rename_folder(self, folder_id, folder_name, config = {}):
+            """
+            Rename a specified folder in the workspace.
+            @param folder_id: Id of the folder.
+            @type folder_id: string
+            @param folder_name: New name for the folder.
+            @type folder_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["folderName"] = folder_name
+            endpoint = self.endpoint + "/folders/" + folder_id
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_folder(self, folder_id):
+            """
+            Delete a specified folder in the workspace.
+            @param folder_id: Id of the folder to be deleted.
+            @type folder_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/folders/" + folder_id
+            await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def get_groups(self):
+            """
+            Returns list of groups for the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Group list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/groups"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["groups"]
+
+        async def create_group(self, group_name, email_ids, config = {}):
+            """
+            Create a group in the specified workspace.
+            @param group_name: Name of the group.
+            @type group_name: string
+            @param email_ids: The email address of the users to be added to the group.
+            @type email_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Created group id.
+            @rtype:string
+            """
+            config["groupName"] = group_name
+            config["emailIds"] = email_ids
+            endpoint = self.endpoint + "/groups"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["groupId"])    
+
+        async def get_group_details(self, group_id):
+            """
+            Get the details of the specified group.
+            @param group_id: Id of the group.
+            @type group_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Details of the specified group.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/groups/" + group_id
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["groups"]    
+
+        async def rename_group(self, group_id, group_name, config = {}):
+            """
+            Rename a specified group.
+            @param group_id: Id of the group.
+            @type group_id: string
+            @param group_name: New name for the group.
+            @type group_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["groupName"] = group_name
+            endpoint = self.endpoint + "/groups/" + group_id
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_group(self, group_id):
+            """
+            Delete a specified group.
+            @param group_id: The id of the group.
+            @type group_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/groups/" + group_id
+            await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def add_group_members(self, group_id, email_ids, config = {}):
+            """
+            Add users to the specified group.
+            @param group_id: Id of the group.
+            @type group_id: string
+            @param email_ids: The email address of the users to be added to the group.
+            @type email_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = self.endpoint + "/groups/" + group_id + "/members"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def remove_group_members(self, group_id, email_ids, config = {}):
+            """
+            Remove users from the specified group.
+            @param group_id: Id of the group.
+            @type group_id: string
+            @param email_ids: The email address of the users to be removed from the group.
+            @type email_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = self.endpoint + "/groups/" + group_id + "/members"
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+            
+        async def create_slideshow(self, slide_name, view_ids, config = {}):
+            """
+            Create a slideshow in the specified workspace.
+            @param slide_name: Name of the slideshow to be created.
+            @type slide_name: string
+            @param view_ids: Ids of the view to be included in the slideshow.
+            @type view_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Id of the created slideshow.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/slides"
+            config["slideName"] = slide_name
+            config["viewIds"] = view_ids
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["slideId"]) 
+
+        async def update_slideshow(self, slide_id, config = {}):
+            """
+            Update details of the specified slideshow.
+            @param slide_id: The id of the slideshow.
+            @type slide_id: string
+            @param config - Contains the control configurations.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/slides/" + slide_id
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_slideshow(self, slide_id):
+            """
+            Delete a specified slideshow in the workspace.
+            @param slide_id: Id of the slideshow.
+            @type slide_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/slides/" + slide_id
+            await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def get_slideshows(self):
+            """
+            Returns list of slideshows for the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Slideshow list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/slides"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["slideshows"]    
+
+        async def get_slideshow_url(self, slide_id, config = {}):
+            """
+            Returns slide URL to access the specified slideshow.
+            @param slide_id: Id of the slideshow.
+            @type slide_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Slideshow URL.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/slides/" + slide_id + "/publish"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["slideUrl"]
+
+        async def get_slideshow_details(self, slide_id):
+            """
+            Returns details of the specified slideshow.
+            @param slide_id: Id of the slideshow.
+            @type slide_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Slideshow details.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/slides/" + slide_id
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["slideInfo"]   
+
+        async def create_variable(self, variable_name, variable_datatype, variable_type, config = {}):
+            """
+            Create a variable in the workspace.
+            @param variable_name: Name of the variable to be created.
+            @type variable_name: string
+            @param variable_datatype: Datatype of the variable to be created.
+            @type variable_datatype: string
+            @param variable_type: Type of the variable to be created.
+            @type variable_type: string
+            @param config: Contains the control parameters.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Id of the created variable.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/variables"
+            config["variableName"] = variable_name
+            config["variableDataType"] = variable_datatype
+            config["variableType"] = variable_type
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["variableId"])
+
+        async def update_variable(self, variable_id, variable_name, variable_datatype, variable_type, config = {}):
+            """
+            Update details of the specified variable in the workspace.
+            @param variable_id: Id of the variable.
+            @type variable_id: string
+            @param variable_name: New name for the variable.
+            @type variable_name: string
+            @param variable_datatype: New datatype for the variable.
+            @type variable_datatype: string
+            @param variable_type: New type for the variable.
+            @type variable_type: string
+            @param config: Contains the control parameters.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/variables/" + variable_id
+            config["variableName"] = variable_name
+            config["variableDataType"] = variable_datatype
+            config["variableType"] = variable_type
+            response = await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_variable(self, variable_id):
+            """
+            Delete the specified variable in the workspace.
+            @param variable_id: Id of the variable.
+            @type variable_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/variables/" + variable_id
+            response = await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def get_variables(self):
+            """
+            Returns list of variables for the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Variable list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/variables"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["variables"]
+
+        async def get_variable_details(self, variable_id):
+            """
+            Returns list of variables for the specified workspace.
+            @param variable_id: Id of the variable.
+            @type variable_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Variable details.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/variables/" + variable_id
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]
+
+        async def make_default_folder(self, folder_id):
+            """
+            Make the specified folder as default.
+            @param folder_id: Id of the folder.
+            @type folder_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/folders/" + folder_id + "/default"
+            response = await self.ac.send_api_request("PUT", endpoint, None, self.request_headers)
+
+        async def get_datasources(self):
+            """
+            Returns list of datasources for the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Datasource list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/datasources"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["dataSources"]
+
+        async def sync_data(self, datasource_id, config = {}):
+            """
+            Initiate data sync for the specified datasource.
+            @param datasource_id: Id of the datasource.
+            @type datasource_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/datasources/" + datasource_id + "/sync"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def update_datasource_connection(self, datasource_id, config = {}):
+            """
+            Update connection details for the specified datasource.
+            @param datasource_id: Id of the datasource.
+            @type datasource_id: string
+            @param config: Contains the control parameters.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/datasources/" + datasource_id
+            response = await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)   
+
+        async def get_trash_views(self):
+            """
+            Initiate data sync for the specified datasource.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Trash view list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/trash"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["views"]
+
+        async def restore_trash_views(self, view_id, config = {}):
+            """
+            Restore the specified view from trash.
+            @param view_id: Id of the view.
+            @type view_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/trash/" + view_id
+            response = await self.ac.send_api_request("POST", endpoint, None, self.request_headers)
+
+        async def delete_trash_views(self, view_id, config = {}):
+            """
+            Delete the specified view permanently from trash.
+            @param view_id: Id of the view.
+            @type view_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/trash/" + view_id
+            response = await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def change_folder_hierarchy(self, folder_id, hierarchy, config = {}):
+            """
+            Swaps the hierarchy of a parent folder and a subfolder.
+            @param folder_id: Id of the folder.
+            @type folder_id: string
+            @param hierarchy: New hierarchy for the folder. (0 - Parent; 1 - Child).
+            @type hierarchy: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/folders/" + folder_id + "/move";
+            config["hierarchy"] = hierarchy
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def change_folder_position(self, folder_id, reference_folder_id, config = {}):
+            """
+            Place the folder above the reference folder.
+            @param folder_id: Id of the folder.
+            @type folder_id: string
+            @param reference_folder_id: Id of the reference folder.
+            @type reference_folder_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/folders/" + folder_id + "/reorder"
+            config["referenceFolderId"] = reference_folder_id
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def move_views_to_folder(self, folder_id, view_ids, config = {}):
+            """
+            Move views to the mentioned folder.
+            @param folder_id: Id of the folder.
+            @type folder_id: string
+            @param view_ids: View ids to be moved.
+            @type view_ids: list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/views/movetofolder"
+            config["folderId"] = folder_id
+            config["viewIds"] = view_ids
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def export_as_template(self, view_ids, file_path, config = {}):
+            """
+            Export the mentioned views as templates.
+            @param view_ids: Ids of the views to be exported.
+            @type view_ids: list
+            @param file_path: Path of the file where the data exported to be stored. ( Should be in 'atpt' format )
+            @type file_path: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/template/data"
+            config["viewIds"] = view_ids
+            await self.ac.send_export_api_request(endpoint, config, self.request_headers, file_path)
+
+        async def get_workspace_users(self):
+            """
+            Returns list of users for the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: User list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/users";
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["users"]
+
+        async def add_workspace_users(self, email_ids, role, config = {}):
+            """
+            Add users to the specified workspace.
+            @param email_ids: The email address of the users to be added.
+            @type email_ids:list
+            @param role: Role of the user to be added.
+            @type role:string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            config["role"] = role
+            endpoint = self.endpoint + "/users";
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def remove_workspace_users(self, email_ids, config = {}):
+            """
+            Remove users from the specified workspace.
+            @param email_ids: The email address of the users to be removed.
+            @type email_ids:list
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            endpoint = self.endpoint + "/users";
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def change_workspace_user_status(self, email_ids, operation, config = {}):
+            """
+            Change users status in the specified workspace.
+            @param email_ids: The email address of the users.
+            @type email_ids:list
+            @param operation: New status for the users ( Values -  activate | deactivate ).
+            @type operation:string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            config["operation"] = operation
+            endpoint = self.endpoint + "/users/status";
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)  
+
+        async def change_workspace_user_role(self, email_ids, role, config = {}):
+            """
+            Change role for the specified users.
+            @param email_ids: The email address of the users.
+            @type email_ids:list
+            @param role: New role for the users.
+            @type role:string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["emailIds"] = email_ids
+            config["role"] = role
+            endpoint = self.endpoint + "/users/role";
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+
+        async def get_email_schedules(self):
+            """
+            Returns list of email schedules available in the specified workspace.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: List of email schedules.
+            @rtype: list
+            """
+            endpoint = self.endpoint + "/emailschedules"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["emailSchedules"]
+
+        async def create_email_schedule(self, schedule_name, view_ids, format, email_ids, schedule_details, config={}):
+            """
+            Create an email schedule in the specified workspace.
+            @param schedule_name: Name of the email schedule.
+            @type schedule_name: string
+            @param view_ids: View ids to be mailed.
+            @type view_ids: list
+            @param format: The format in which the data has to be mailed.
+            @type format: string
+            @param email_ids: The recipients' email addresses for sending views.
+            @type email_ids: list
+            @param schedule_details: Contains schedule frequency, date, and time info.
+            @type schedule_details: dictionary
+            @param config: Contains any additional control parameters. Can be None.
+            @type config: dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Email schedule id.
+            @rtype: string
+            """
+            config["scheduleName"] = schedule_name
+            config["viewIds"] = view_ids
+            config["exportType"] = format
+            config["emailIds"] = email_ids
+            config["scheduleDetails"] = schedule_details
+            endpoint = self.endpoint + "/emailschedules"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return str(response["data"]["scheduleId"])
+
+        async def update_email_schedule(self, schedule_id, config):
+            """
+            Update configurations of the specified email schedule in the workspace.
+            @param schedule_id: Id for the email schedule.
+            @type schedule_id: string
+            @param config: Contains the control configurations.
+            @type config: dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Updated schedule id.
+            @rtype: string
+            """
+            endpoint = self.endpoint + "/emailschedules/" + schedule_id
+            response = await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+            return str(response["data"]["scheduleId"])
+
+        async def trigger_email_schedule(self, schedule_id):
+            """
+            Trigger configured email schedules instantly.
+            @param schedule_id: Id for the email schedule.
+            @type schedule_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/emailschedules/" + schedule_id
+            await self.ac.send_api_request("POST", endpoint, None, self.request_headers)
+
+        async def change_email_schedule_status(self, schedule_id, operation):
+            """
+            Update email schedule status.
+            @param schedule_id: Id for the email schedule.
+            @type schedule_id: string
+            @param operation: New status for the schedule ( Values -  activate | deactivate )
+            @type operation: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/emailschedules/" + schedule_id + "/status"
+            config = {"operation": operation}
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_email_schedule(self, schedule_id):
+            """
+            Delete the specified email schedule in the workspace.
+            @param schedule_id: Id for the email schedule.
+            @type schedule_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/emailschedules/" + schedule_id
+            await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def get_aggregate_formulas(self, config = {}):
+            """
+            Returns list of all aggregate formulas for the specified workspace.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Aggregate formula list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/aggregateformulas"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["aggregateFormulas"]
+
+        async def get_aggregate_formula_dependents(self, formula_id):
+            """
+            Returns list of all dependent views and formulas for the specified aggregate formula.
+            @param formula_id: Id of the aggregate formula
+            @type formula_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Dependent details.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/aggregateformulas/" + formula_id + "/dependents"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]
+
+        async def get_aggregate_formula_value(self, formula_id):
+            """
+            Returns the value of the aggregate formula.
+            @param formula_id: Id of the aggregate formula
+            @type formula_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Aggregate formula value.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/aggregateformulas/" + formula_id + "/value"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["formulaValue"]
+
+        async def create_report(self, config = {}):
+            """
+            Create a report in the specified workspace.
+            @param config: Contains the control parameters.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Id of the created view.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/reports"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["viewId"])
+
+        async def update_report(self, view_id, config = {}):
+            """
+            Update the design and configuration of the specified report.
+            @param view_id: Id of the view.
+            @type view_id: string
+            @param config: Contains the control parameters.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/reports/" + view_id
+            response = await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+
+    class ViewAPI:
+        """
+        ViewAPI contains view level operations.
+        """
+        def __init__(self, ac, org_id, workspace_id, view_id):
+            self.ac = ac
+            self.endpoint = "/restapi/v2/workspaces/" + workspace_id + "/views/" + view_id
+            self.request_headers = {}
+            self.request_headers["ZANALYTICS-ORGID"] = org_id
+
+        async def rename(self, view_name, config = {}):
+            """
+            Rename a specified view in the workspace.
+            @param view_name: New name of the view.
+            @type view_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["viewName"] = view_name
+            response = await self.ac.send_api_request("PUT", self.endpoint, config, self.request_headers)
+
+        async def delete(self, config = {}):
+            """
+            Delete a specified view in the workspace.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            response = await self.ac.send_api_request("DELETE", self.endpoint, config, self.request_headers)
+
+        async def save_as(self, new_view_name, config = {}):
+            """
+            Copy a specified view within the workspace.
+            @param new_view_name: The name of the new view.
+            @type new_view_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Created view id.
+            @rtype:string
+            """
+            config["viewName"] = new_view_name
+            endpoint = self.endpoint + "/saveas"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["viewId"])
+            
+        async def copy_formulas(self, formula_names, dest_workspace_id, config = {}, dest_org_id = None):
+            """
+            Copy the specified formulas from one table to another within the workspace or across workspaces.
+            @param formula_names: The name of the formula columns to be copied.
+            @type formula_names: list
+            @param dest_workspace_id: The ID of the destination workspace.
+            @type dest_workspace_id: string
+            @param dest_org_id: Id of the organization where the destination workspace is present. Can be C{None}.
+            @type dest_org_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["formulaColumnNames"] = formula_names
+            config["destWorkspaceId"] = dest_workspace_id
+            endpoint = self.endpoint + "/formulas/copy"
+            headers = self.request_headers.copy()
+            if bool(dest_org_id):
+                headers["ZANALYTICS-DEST-ORGID"] = dest_org_id
+            await self.ac.send_api_request("POST", endpoint, config, headers)  
+            
+        async def add_favorite(self):
+            """
+            Adds a specified view as favorite.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/favorite"
+            response = await self.ac.send_api_request("POST", endpoint, None, self.request_headers)
+
+        async def remove_favorite(self):
+            """
+            Remove a specified view from favorite.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/favorite"
+            response = await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)                 
+
+        async def create_similar_views(self, ref_view_id, folder_id, config = {}):
+            """
+            Create reports for the specified table based on the reference table.
+            @param ref_view_id: The ID of the reference view.
+            @type ref_view_id: string
+            @param folder_id: The folder id where the views to be saved.
+            @type folder_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["referenceViewId"] = ref_view_id
+            config["folderId"] = folder_id
+            endpoint = self.endpoint + "/similarviews"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def auto_analyse(self, config = {}):
+            """
+            Auto generate reports for the specified table.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/autoanalyse"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def get_my_permissions(self):
+            """
+            Returns permissions for the specified view.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Permission details.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/share/userpermissions"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["permissions"]
+
+        async def get_view_url(self, config = {}):
+            """
+            Returns the URL to access the specified view.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: View URL.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/publish"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["viewUrl"]
+
+        async def get_embed_url(self, config = {}):
+            """
+            Returns embed URL to access the specified view.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Embed URL.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/publish/embed"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["embedUrl"]
+
+        async def get_private_url(self, config = {}):
+            """
+            Returns private URL to access the specified view.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Private URL.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/publish/privatelink"
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["privateUrl"]
+            
+        async def create_private_url(self, config = {}):
+            """
+            Create a private URL for the specified view.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Private URL.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/publish/privatelink"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return response["data"]["privateUrl"]
+
+        async def remove_private_access(self):
+            """
+            Remove private link access for the specified view.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/publish/privatelink"
+            response = await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def make_view_public(self, config = {}):
+            """
+            Make the specified view publically accessible.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Public URL.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/publish/public"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return response["data"]["publicUrl"]
+
+        async def remove_public_access(self):
+            """
+            Remove public access for the specified view.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            response = endpoint = self.endpoint + "/publish/public"
+            await self.ac.send_api_request("DELETE", endpoint, None, self.request_headers)
+
+        async def get_publish_configurations(self):
+            """
+            Returns publish configurations for the specified view.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Publish details.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/publish/config"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]
+
+        async def update_publish_configurations(self, config = {}):
+            """
+            Update publish configurations for the specified view.
+            @param config: Contains the control parameters.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/publish/config"
+            response = await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def add_column(self, column_name, data_type, config = {}):
+            """
+            Add a column in the specified table.
+            @param column_name: The name of the column.
+            @type column_name: string
+            @param data_type: The data-type of the column.
+            @type data_type: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Created column id.
+            @rtype:string
+            """
+            config["columnName"] = column_name
+            config["dataType"] = data_type
+            endpoint = self.endpoint + "/columns"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return int(response["data"]["columnId"])
+
+        async def hide_columns(self, column_ids):
+            """
+            Hide the specified columns in the table.
+            @param column_ids: Ids of the columns to be hidden.
+            @type column_ids: list
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config = {}
+            config["columnIds"] = column_ids
+            endpoint = self.endpoint + "/columns/hide"
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def show_columns(self, column_ids):
+            """
+            Show the specified hidden columns in the table.
+            @param column_ids: Ids of the columns to be shown.
+            @type column_ids: list
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config = {}
+            config["columnIds"] = column_ids
+            endpoint = self.endpoint + "/columns/show"
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def add_row(self, column_values, config = {}):
+            """
+            Add a single row in the specified table.
+            @param column_values: Contains the values for the row. The column names are the key.
+            @type column_values: dictionary
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Column Names and Added Row Values.
+            @rtype:dictionary
+            """
+            config["columns"] = column_values
+            endpoint = self.endpoint + "/rows"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return response["data"]
+
+        async def update_row(self, column_values, criteria, config = {}):
+            """
+            Update rows in the specified table.
+            @param column_values: Contains the values for the row. The column names are the key.
+            @type column_values: dictionary
+            @param criteria: The criteria to be applied for updating data. Only rows matching the criteria will be updated. Should be null for update all rows.
+            @type criteria: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Updated Columns List and Updated Rows Count.
+            @rtype:dictionary
+            """
+            config["columns"] = column_values
+            if criteria != None:
+                config["criteria"] = criteria
+            endpoint = self.endpoint + "/rows"    
+            response = await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+            return response["data"]
+
+        async def delete_row(self, criteria, config = {}):
+            """
+            Delete rows in the specified table.
+            @param criteria: The criteria to be applied for deleting data. Only rows matching the criteria will be deleted. Should be null for delete all rows.
+            @type criteria: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Deleted rows details.
+            @rtype:string
+            """
+            if criteria != None:
+                config["criteria"] = criteria
+            endpoint = self.endpoint + "/rows"
+            response = await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+            return response["data"]["deletedRows"]
+
+        async def rename_column(self, column_id, column_name, config = {}):
+            """
+            Rename a specified column in the table.
+            @param column_id: Id of the column.
+            @type column_id: string
+            @param column_name: New name for the column.
+            @type column_name: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["columnName"] = column_name
+            endpoint = self.endpoint + "/columns/" + column_id
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_column(self, column_id, config = {}):
+            """
+            Delete a specified column in the table.
+            @param column_id: Id of the column.
+            @type column_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/columns/" + column_id
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def add_lookup(self, column_id, ref_view_id, ref_column_id, config = {}):
+            """
+            Add a lookup in the specified child table.
+            @param column_id: Id of the column.
+            @type column_id: string
+            @param ref_view_id: The id of the table contains the parent column.
+            @type ref_view_id: string
+            @param ref_column_id: The id of the parent column.
+            @type ref_column_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            config["referenceViewId"] = ref_view_id;
+            config["referenceColumnId"] = ref_column_id
+            endpoint = self.endpoint + "/columns/" + column_id + "/lookup"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def remove_lookup(self, column_id, config = {}):
+            """
+            Remove the lookup for the specified column in the table.
+            @param column_id: Id of the column.
+            @type column_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/columns/" + column_id + "/lookup"
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def auto_analyse_column(self, column_id, config = {}):
+            """
+            Auto generate reports for the specified column.
+            @param column_id: Id of the column.
+            @type column_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/columns/" + column_id + "/autoanalyse"
+            await self.ac.send_api_request("POST", endpoint, config, self.request_headers)    
+
+        async def refetch_data(self, config = {}):
+            """
+            Sync data from available datasource for the specified view.
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/sync"
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+
+        async def get_last_import_details(self):
+            """
+            Returns last import details of the specified view.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Last import details.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/importdetails"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]
+
+        async def get_formula_columns(self):
+            """
+            Returns list of all formula columns for the specified table.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Formula column list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/formulacolumns"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["formulaColumns"]
+
+        async def add_formula_column(self, formula_name, expression, config = {}):
+            """
+            Add a formula column in the specified table.
+            @param formula_name: Name of the formula column to be created.
+            @type formula_name: string
+            @param expression: Formula expression.
+            @type expression: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Created formula id.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/formulacolumns"
+            config["formulaName"] = formula_name;
+            config["expression"] = expression;
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return response["data"]["formulaId"]
+
+        async def edit_formula_column(self, formula_id, expression, config = {}):
+            """
+            Edit the specified formula column.
+            @param formula_id: Id of the formula column to be updated.
+            @type formula_id: string
+            @param expression: Formula expression.
+            @type expression: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/formulacolumns/" + formula_id
+            config["expression"] = expression;
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_formula_column(self, formula_id, config = {}):
+            """
+            Delete the specified formula column.
+            @param formula_id: Id of the formula column to be deleted.
+            @type formula_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/formulacolumns/" + formula_id
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def get_aggregate_formulas(self):
+            """
+            Returns list of all aggregate formulas for the specified table.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Aggregate Formula list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/aggregateformulas"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["aggregateFormulas"]
+
+        async def add_aggregate_formula(self, formula_name, expression, config = {}):
+            """
+            Add an aggregate formula in the specified table.
+            @param formula_name: Name of the aggregate formula to be created.
+            @type formula_name: string
+            @param expression: Formula expression.
+            @type expression: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Created formula id.
+            @rtype:string
+            """
+            endpoint = self.endpoint + "/aggregateformulas"
+            config["formulaName"] = formula_name;
+            config["expression"] = expression;
+            response = await self.ac.send_api_request("POST", endpoint, config, self.request_headers)
+            return response["data"]["formulaId"]
+
+        async def edit_aggregate_formula(self, formula_id, expression, config = {}):
+            """
+            Edit the specified aggregate formula.
+            @param formula_id: Id of the aggregate formula to be updated.
+            @type formula_id: string
+            @param expression: Formula expression.
+            @type expression: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/aggregateformulas/" + formula_id
+            config["expression"] = expression;
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+        async def delete_aggregate_formula(self, formula_id, config = {}):
+            """
+            Delete the specified aggregate formula.
+            @param formula_id: Id of the aggregate formula to be deleted.
+            @type formula_id: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/aggregateformulas/" + formula_id
+            await self.ac.send_api_request("DELETE", endpoint, config, self.request_headers)
+
+        async def get_view_dependents(self):
+            """
+            Returns list of dependents views for the specified view.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Dependent view list.
+            @rtype:list
+            """
+            endpoint = self.endpoint + "/dependents"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]["views"]
+
+        async def get_column_dependents(self, column_id):
+            """
+            Returns list of dependents views and formulas for the specified column.
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Dependent details.
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/columns/" + column_id + "/dependents"
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]
+
+        async def update_shared_details(self, config = {}):
+            """
+            Update shared details of the specified view.
+            @param config: Contains the control parameters.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/share"
+            await self.ac.send_api_request("PUT", endpoint, config, self.request_headers)
+
+
+    class BulkAPI:
+        """
+        BulkAPI contains data operations.
+        """
+        def __init__(self, ac, org_id, workspace_id):
+            self.ac = ac
+            self.endpoint = "/restapi/v2/workspaces/" + workspace_id
+            self.bulk_endpoint = "/restapi/v2/bulk/workspaces/" + workspace_id
+            self.request_headers = {}
+            self.request_headers["ZANALYTICS-ORGID"] = org_id
+
+        async def import_data_in_new_table(self, table_name, file_type, auto_identify, file_path, config = {}):
+            """
+            Create a new table and import the data contained in the mentioned file into the created table.
+            @param table_name: Name of the new table to be created.
+            @type table_name: string
+            @param file_type: Type of the file to be imported.
+            @type file_type: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param file_path: Path of the file to be imported.
+            @type file_path: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import result
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/data"
+            config["tableName"] = table_name
+            config["fileType"] = file_type
+            config["autoIdentify"] = auto_identify
+            response = await self.ac.send_import_api_request(endpoint, config, self.request_headers, file_path)
+            return response["data"]
+
+        async def import_data_in_new_table_as_batches(self, table_name, auto_identify, file_path, batch_size,
+                                                config={}, tool_config={}):
+            """
+            Create a new table and import the data contained in the mentioned file into the created table.
+            @param table_name: Name of the new table to be created.
+            @type table_name: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param file_path: Path of the file to be imported.
+            @type file_path: string
+            @param batch_size: Number of lines per batch.
+            @type batch_size:int
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @param tool_config: Contains any additional control parameters for the library. Can be C{None}.
+            @type tool_config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import job id
+            @rtype:string
+            """
+            endpoint = self.bulk_endpoint + "/data/batch"
+            config["tableName"] = table_name
+            config["autoIdentify"] = auto_identify
+            response = await self.ac.send_batch_import_api_request(endpoint, config, self.request_headers, file_path,
+                                                             batch_size, tool_config)
+            return response["data"]["jobId"]
+
+        async def import_raw_data_in_new_table(self, table_name, file_type, auto_identify, data, config={}):
+            """
+            Create a new table and import the raw data provided into the created table.
+            @param table_name: Name of the new table to be created.
+            @type table_name: string
+            @param file_type: Type of the file to be imported.
+            @type file_type: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param data: Raw data to be imported.
+            @type data: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import result
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/data"
+            config["tableName"] = table_name
+            config["fileType"] = file_type
+            config["autoIdentify"] = auto_identify
+            response = await self.ac.send_import_api_request(endpoint, config, self.request_headers, None, data)
+            return response["data"]    
+
+        async def import_data(self, view_id, import_type, file_type, auto_identify, file_path, config = {}):
+            """
+            Import the data contained in the mentioned file into the table.
+            @param view_id: Id of the view where the data to be imported.
+            @type view_id: string
+            @param import_type: The type of import. Can be one of - append, truncateadd, updateadd.
+            @type import_type: string
+            @param file_type: Type of the file to be imported.
+            @type file_type: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param file_path: Path of the file to be imported.
+            @type file_path: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import result
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/views/" + view_id + "/data"
+            config["fileType"] = file_type
+            config["autoIdentify"] = auto_identify
+            config["importType"] = import_type
+            response = await self.ac.send_import_api_request(endpoint, config, self.request_headers, file_path)
+            return response["data"] 
+
+        async def import_raw_data(self, view_id, import_type, file_type, auto_identify, data, config = {}):
+            """
+            Import the raw data provided into the table.
+            @param view_id: Id of the view where the data to be imported.
+            @type view_id: string
+            @param import_type: The type of import. Can be one of - append, truncateadd, updateadd.
+            @type import_type: string
+            @param file_type: Type of the file to be imported.
+            @type file_type: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param data: Raw data to be imported.
+            @type data: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import result
+            @rtype:dictionary
+            """
+            endpoint = self.endpoint + "/views/" + view_id + "/data"
+            config["fileType"] = file_type
+            config["autoIdentify"] = auto_identify
+            config["importType"] = import_type
+            response = await self.ac.send_import_api_request(endpoint, config, self.request_headers, None, data)
+            return response["data"]       
+
+        async def import_bulk_data_in_new_table(self, table_name, file_type, auto_identify, file_path, config = {}):
+            """
+            Asynchronously create a new table and import the data contained in the mentioned file into the created table.
+            @param table_name: Name of the new table to be created.
+            @type table_name: string
+            @param file_type: Type of the file to be imported.
+            @type file_type: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param file_path: Path of the file to be imported.
+            @type file_path: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import job id
+            @rtype:string
+            """
+            endpoint = self.bulk_endpoint + "/data"
+            config["tableName"] = table_name
+            config["fileType"] = file_type
+            config["autoIdentify"] = auto_identify
+            response = await self.ac.send_import_api_request(endpoint, config, self.request_headers, file_path)
+            return response["data"]["jobId"]  
+
+        async def import_bulk_data(self, view_id, import_type, file_type, auto_identify, file_path, config = {}):
+            """
+            Asynchronously import the data contained in the mentioned file into the table.
+            @param view_id: Id of the view where the data to be imported.
+            @type view_id: string
+            @param import_type: The type of import. Can be one of - append, truncateadd, updateadd.
+            @type import_type: string
+            @param file_type: Type of the file to be imported.
+            @type file_type: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param file_path: Path of the file to be imported.
+            @type file_path: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import job id
+            @rtype:string
+            """
+            endpoint = self.bulk_endpoint + "/views/" + view_id + "/data"
+            config["fileType"] = file_type
+            config["autoIdentify"] = auto_identify
+            config["importType"] = import_type
+            response = await self.ac.send_import_api_request(endpoint, config, self.request_headers, file_path)
+            return response["data"]["jobId"]
+
+        async def import_data_as_batches(self, view_id, import_type, auto_identify, file_path, batch_size,
+                                                config={}, tool_config={}):
+            """
+            Asynchronously import the data contained in the mentioned file into the table.
+            @param view_id: Id of the view where the data to be imported.
+            @type view_id: string
+            @param import_type: The type of import. Can be one of - append, truncateadd, updateadd.
+            @type import_type: string
+            @param auto_identify: Used to specify whether to auto identify the CSV format. Allowable values - true/false.
+            @type auto_identify: string
+            @param file_path: Path of the file to be imported.
+            @type file_path: string
+            @param batch_size: Number of lines per batch.
+            @type batch_size:int
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @param tool_config: Contains any additional control parameters for the library. Can be C{None}.
+            @type tool_config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import job id
+            @rtype:string
+            """
+            endpoint = self.bulk_endpoint + "/views/" + view_id + "/data/batch"
+            config["importType"] = import_type
+            config["autoIdentify"] = auto_identify
+            response = await self.ac.send_batch_import_api_request(endpoint, config, self.request_headers, file_path,
+                                                             batch_size, tool_config)
+            return response["data"]["jobId"]
+
+        async def get_import_job_details(self, job_id):
+            """
+            Returns the details of the import job.
+            @param job_id: Id of the job.
+            @type job_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Import job details
+            @rtype:dictionary
+            """
+            endpoint = self.bulk_endpoint + "/importjobs/" + job_id
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]     
+
+        async def export_data(self, view_id, response_format, file_path, config = {}, progress_callback = None):
+            """
+            Export the mentioned table (or) view data.
+            @param view_id: Id of the view to be exported.
+            @type view_id: string
+            @param response_format: The format in which the data is to be exported.
+            @type response_format: string
+            @param file_path: Path of the file where the data exported to be stored.
+            @type file_path: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @param progress_callback: Called with the bytes written so far and the total bytes (C{None} if unknown) after every chunk. Can be C{None}.
+            @type progress_callback:function
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.endpoint + "/views/" + view_id + "/data"
+            config["responseFormat"] = response_format
+            await self.ac.send_export_api_request(endpoint, config, self.request_headers, file_path, progress_callback)
+
+        async def initiate_bulk_export(self, view_id, response_format, config = {}):
+            """
+            Initiate asynchronous export for the mentioned table (or) view data.
+            @param view_id: Id of the view to be exported.
+            @type view_id: string
+            @param response_format: The format in which the data is to be exported.
+            @type response_format: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Export job id
+            @rtype:string
+            """
+            endpoint = self.bulk_endpoint + "/views/" + view_id + "/data"
+            config["responseFormat"] = response_format
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["jobId"]
+
+        async def initiate_bulk_export_using_sql(self, sql_query, response_format, config = {}):
+            """
+            Initiate asynchronous export with the given SQL Query.
+            @param sql_query: SQL Query.
+            @type sql_query: string
+            @param response_format: The format in which the data is to be exported.
+            @type response_format: string
+            @param config: Contains any additional control parameters. Can be C{None}.
+            @type config:dictionary
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Export job id
+            @rtype:string
+            """
+            endpoint = self.bulk_endpoint + "/data"
+            config["responseFormat"] = response_format
+            config["sqlQuery"] = sql_query
+            response = await self.ac.send_api_request("GET", endpoint, config, self.request_headers)
+            return response["data"]["jobId"]   
+
+        async def get_export_job_details(self, job_id):
+            """
+            Returns the details of the export job.
+            @param job_id: Id of the export job.
+            @type job_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return Export job details
+            @rtype:dictionary
+            """
+            endpoint = self.bulk_endpoint + "/exportjobs/" + job_id
+            response = await self.ac.send_api_request("GET", endpoint, None, self.request_headers)
+            return response["data"]
+
+        async def export_bulk_data(self, job_id, file_path, progress_callback = None):
+            """
+            Download the exported data for the mentioned job id.
+            @param job_id: Id of the job to be exported.
+            @type job_id: string
+            @param file_path: Path of the file where the data exported to be stored.
+            @type file_path: string
+            @param progress_callback: Called with the bytes written so far and the total bytes (C{None} if unknown) after every chunk. Can be C{None}.
+            @type progress_callback:function
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            """
+            endpoint = self.bulk_endpoint + "/exportjobs/" + job_id + "/data"
+            await self.ac.send_export_api_request(endpoint, None, self.request_headers, file_path, progress_callback)                 
+
+        def iter_bulk_data(self, job_id):
+            """
+            Stream the exported data for the mentioned job id, without storing it in a file.
+            Closing the generator before it is exhausted closes the connection, so the rest of the data is not downloaded.
+            @param job_id: Id of the job to be exported.
+            @type job_id: string
+            @raise ServerError: If the server has received the request but did not process the request due to some error.
+            @raise ParseError: If the server has responded but client was not able to parse the response.
+            @return: Async generator of the exported data in chunks of bytes.
+            @rtype:async generator
+            """
+            endpoint = self.bulk_endpoint + "/exportjobs/" + job_id + "/data"
+            return self.ac.iter_export_api_response(endpoint, None, self.request_headers)
+
+
+    def set_proxy(self, proxy_host, proxy_port, proxy_user_name, proxy_password):
+        """
+        Internal method to handle proxy details.
+        """
+        self.proxy = True
+        self.proxy_host = proxy_host
+        self.proxy_port = proxy_port
+        self.proxy_user_name = proxy_user_name
+        self.proxy_password = proxy_password
+        # Pooled clients carry the proxy settings they were created with.
+        self.retired_clients.extend(self.clients.values())
+        self.clients.clear()
+
+    async def send_batch_import_api_request(self, request_url, config, request_headers, file_path, batch_size, tool_config):
+        """
+        Internal method to handle HTTP request.
+        The next batch is read and encoded on a worker thread while the current batch is uploaded,
+        and the wait between batches is decided by L{BatchImportPacer} from the tool_config.
+        The batch stats callback can either be a plain function or a coroutine function.
+        The number of batches sent is reported as the progress of the tool call, if any. Since the file is read in a
+        single pass, the total number of batches is only reported along with the last batch.
+        """
+        config = dict(config)
+        pacer = BatchImportPacer(tool_config)
+        # Throttled batches are paced by the BatchImportPacer, so only the batches that failed to send are retried here.
+        retry_policy = RetryPolicy(self.retry_policy.max_attempts, self.retry_policy.base_delay, self.retry_policy.max_delay,
+                                   retry_status_codes=())
+        stats_callback = tool_config.get("batchStatsCallback")
+        config["batchKey"] = "start"
+        request_url = self.analytics_server_url + request_url
+        response = None
+
+        reporter = get_progress_reporter()
+        reporter.start_phase()
+        batches = read_file_in_batches(file_path, batch_size)
+        next_batch = asyncio.ensure_future(asyncio.to_thread(encode_next_batch, batches, self.COMMON_ENCODE_CHAR))
+        try:
+            batch_number = 0
+            while True:
+                wait_start_time = time.monotonic()
+                # The read ahead cannot be interrupted, so a cancelled import waits for it in the finally block
+                # instead of closing the file under it.
+                batch = await asyncio.shield(next_batch)
+                if batch == None:
+                    break
+                read_wait_time = time.monotonic() - wait_start_time
+                batch_data, line_count, is_last_batch = batch
+                if not is_last_batch:
+                    next_batch = asyncio.ensure_future(asyncio.to_thread(encode_next_batch, batches, self.COMMON_ENCODE_CHAR))
+                batch_number += 1
+
+                config["isLastBatch"] = "true" if is_last_batch else "false"
+                config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
+
+                upload_start_time = time.monotonic()
+                resp_obj = await self.submit_batch_import_request(request_url, config_data, request_headers, batch_data, pacer,
+                                                                  retry_policy)
+                upload_time = time.monotonic() - upload_start_time
+
+                response = resp_obj.resp_content
+                response = json.loads(response)
+                config["batchKey"] = response["data"]["batchKey"]
+
+                delay = 0 if is_last_batch else pacer.get_delay()
+                if stats_callback != None:
+                    result = stats_callback(pacer.get_batch_stats(batch_number, line_count, len(batch_data),
+                                                                  read_wait_time, upload_time, delay))
+                    if inspect.isawaitable(result):
+                        await result
+                await reporter.report(batch_number, batch_number if is_last_batch else None)
+                if is_last_batch:
+                    break
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            # The read ahead runs on a worker thread, so let it finish before closing the file.
+            if not next_batch.done():
+                await asyncio.wait([next_batch])
+            batches.close()
+
+        return response
+
+    async def submit_batch_import_request(self, request_url, config_data, request_headers, batch_data, pacer, retry_policy):
+        """
+        Internal method to upload a single batch, retrying it while the server throttles the request.
+        """
+        pacer.start_batch()
+        is_oauth_regenerated = False
+        while True:
+            access_token = await self.get_access_token()
+            files = {'FILE': BytesIO(batch_data)}
+            resp_obj = await self.submit_import_request(request_url, config_data, request_headers, access_token, files,
+                                                        retry_policy=retry_policy)
+
+            if str(resp_obj.status_code).startswith("2"):
+                pacer.on_success()
+                return resp_obj
+            if self.is_oauth_expired(resp_obj) and not is_oauth_regenerated:
+                await self.refresh_access_token(access_token)
+                is_oauth_regenerated = True
+            elif pacer.is_throttled(resp_obj) and pacer.can_retry():
+                await asyncio.sleep(pacer.on_throttled(resp_obj))
+            else:
+                raise ServerError(resp_obj.resp_content, False)
+
+    async def send_import_api_request(self, request_url, config, request_headers, file_path, data=None):
+        """
+        Internal method to handle HTTP request.
+        """
+        request_url = self.analytics_server_url + request_url
+        is_idempotent = self.retry_policy.is_import_idempotent(config)
+        config_data = None
+        if bool(config):
+            config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
+
+        if bool(data):
+            if(bool(config_data)):
+                config_data += "&"
+            else:
+                config_data = ""
+
+            config_data += "DATA=" + urllib.parse.quote_plus(json.dumps(data))
+
+        access_token = await self.get_access_token()
+
+        if bool(data):
+            resp_obj = await self.submit_import_request(request_url, config_data, request_headers, access_token, None, is_idempotent)
+        else:
+            with open(file_path, 'rb') as file:
+                resp_obj = await self.submit_import_request(request_url, config_data, request_headers, access_token, {'FILE': file}, is_idempotent)
+
+        if not (str(resp_obj.status_code).startswith("2")):
+            if(self.is_oauth_expired(resp_obj)):
+                access_token = await self.refresh_access_token(access_token)
+                if bool(data):
+                    resp_obj = await self.submit_import_request(request_url, config_data, request_headers, access_token, None, is_idempotent)
+                else:
+                    with open(file_path, 'rb') as file:
+                        resp_obj = await self.submit_import_request(request_url, config_data, request_headers, access_token, {'FILE': file}, is_idempotent)
+                if not (str(resp_obj.status_code).startswith("2")):
+                    raise ServerError(resp_obj.resp_content, False)
+            else:
+                raise ServerError(resp_obj.resp_content, False)
+
+        response = resp_obj.resp_content
+        response = json.loads(response)
+        return response
+
+
+    async def submit_import_request(self, request_url, parameters, request_headers = {}, access_token = None, files = None,
+                                    is_idempotent = False, retry_policy = None):
+        """
+        Internal method to send request to server.
+        Failed imports are retried only if is_idempotent is True, see L{RetryPolicy}.
+        """
+        if request_headers == None:
+            request_headers = {}
+
+        if access_token != None:
+            request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
+
+        request_headers["User-Agent"] = self.user_agent
+
+        async def send_request():
+            await self.wait_for_request_slot("POST", request_url, request_headers)
+            req_obj = self.get_request_obj(request_url)
+            if bool(files):
+                # A previous attempt has read the files to the end.
+                for file in files.values():
+                    file.seek(0)
+                return await req_obj.post(request_url, params = parameters, files = files, headers = request_headers)
+            return await req_obj.post(request_url, params = parameters, headers = request_headers)
+
+        resp_obj = await self.send_with_retry("POST", request_url, send_request, is_idempotent, retry_policy)
+        return response_obj(resp_obj)
+
+    async def send_export_api_request(self, request_url, config, request_headers, file_path, progress_callback=None):
+        """
+        Internal method to handle HTTP request.
+        """
+        resp_obj = await self.open_export_response(request_url, config, request_headers)
+        try:
+            await self.write_export_response(resp_obj, file_path, progress_callback)
+        finally:
+            await resp_obj.aclose()
+        return
+
+    async def iter_export_api_response(self, request_url, config, request_headers):
+        """
+        Internal method to handle HTTP request, yielding the response in chunks of export_chunk_size bytes.
+        The response is closed when the generator is closed, even if it was not read to the end.
+        """
+        resp_obj = await self.open_export_response(request_url, config, request_headers)
+        try:
+            async for chunk in resp_obj.aiter_bytes(chunk_size=self.export_chunk_size):
+                yield chunk
+        finally:
+            await resp_obj.aclose()
+
+    async def open_export_response(self, request_url, config, request_headers):
+        """
+        Internal method to send the export request, and to return the streamed response once it has succeeded.
+        """
+        request_url = self.analytics_server_url + request_url
+        config_data = None
+        if bool(config):
+            config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
+
+        access_token = await self.get_access_token()
+
+        resp_obj = await self.submit_export_request(request_url, config_data, request_headers, access_token)
+
+        if not (str(resp_obj.status_code).startswith("2")):
+            error_resp_obj = await self.read_error_response(resp_obj)
+            if(self.is_oauth_expired(error_resp_obj)):
+                access_token = await self.refresh_access_token(access_token)
+                resp_obj = await self.submit_export_request(request_url, config_data, request_headers, access_token)
+                if not (str(resp_obj.status_code).startswith("2")):
+                    error_resp_obj = await self.read_error_response(resp_obj)
+                    raise ServerError(error_resp_obj.resp_content, False)
+            else:
+                raise ServerError(error_resp_obj.resp_content, False)
+        return resp_obj
+
+    async def write_export_response(self, resp_obj, file_path, progress_callback=None):
+        """
+        Internal method to stream the export response to the file in chunks of export_chunk_size bytes,
+        so that memory usage stays bounded irrespective of the export size.
+        The progress callback can either be a plain function or a coroutine function.
+        The partially written file is removed if the download fails or is cancelled.
+        """
+        total_bytes = self.get_export_content_length(resp_obj)
+        bytes_written = 0
+        try:
+            with open(file_path, "wb") as file:
+                async for chunk in resp_obj.aiter_bytes(chunk_size=self.export_chunk_size):
+                    file.write(chunk)
+                    bytes_written += len(chunk)
+                    if progress_callback != None:
+                        result = progress_callback(bytes_written, total_bytes)
+                        if inspect.isawaitable(result):
+                            await result
+        except BaseException:
+            remove_partial_file(file_path)
+            raise
+
+    def get_export_content_length(self, resp_obj):
+        """
+        Internal method to get the size of the export response body, or None if it is not known upfront.
+        """
+        content_length = resp_obj.headers.get("Content-Length")
+        # Content-Length is the size on the wire, which does not match the decoded size for encoded responses.
+        if content_length == None or resp_obj.headers.get("Content-Encoding"):
+            return None
+        return int(content_length)
+
+    async def read_error_response(self, resp_obj):
+        """
+        Internal method to read and close a streamed response that did not succeed.
+        """
+        try:
+            await resp_obj.aread()
+        finally:
+            await resp_obj.aclose()
+        return response_obj(resp_obj)
+
+
+    async def submit_export_request(self, request_url, parameters, request_headers = {}, access_token = None):
+        """
+        Internal method to send request to server.
+        """
+        if request_headers == None:
+            request_headers = {}
+
+        if access_token != None:
+            request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
+
+        request_headers["User-Agent"] = self.user_agent
+
+        async def send_request():
+            await self.wait_for_request_slot("GET", request_url, request_headers)
+            req_obj = self.get_request_obj(request_url)
+            request = req_obj.build_request("GET", request_url, params = parameters, headers = request_headers)
+            return await req_obj.send(request, stream = True)
+
+        return await self.send_with_retry("GET", request_url, send_request)
+
+    async def send_api_request(self, request_method, request_url, config, request_headers, is_json_response = True):
+        """
+        Internal method to handle HTTP request.
+        """
+        request_url = self.analytics_server_url + request_url
+        config_data = None
+        if bool(config):
+            config_data = "CONFIG=" + urllib.parse.quote_plus(json.dumps(config))
+
+        access_token = await self.get_access_token()
+
+        resp_obj = await self.submit_request(request_method, request_url, config_data, request_headers, access_token)
+
+        if not (str(resp_obj.status_code).startswith("2")):
+            if(self.is_oauth_expired(resp_obj)):
+                access_token = await self.refresh_access_token(access_token)
+                resp_obj = await self.submit_request(request_method, request_url, config_data, request_headers, access_token)
+                if not (str(resp_obj.status_code).startswith("2")):
+                    raise ServerError(resp_obj.resp_content, False)
+            else:
+                raise ServerError(resp_obj.resp_content, False)
+
+        #API success - No response case
+        if (str(resp_obj.status_code) != "200"):
+            return
+
+        response = resp_obj.resp_content
+        if is_json_response:
+            response = json.loads(response)
+        return response
+
+
+    async def submit_request(self, request_method, request_url, parameters, request_headers = {}, access_token = None):
+        """
+        Internal method to send request to server.
+        """
+        if request_headers == None:
+            request_headers = {}
+
+        if access_token != None:
+            request_headers["Authorization"] = "Zoho-oauthtoken " + access_token
+
+        request_headers["User-Agent"] = self.user_agent
+
+        async def send_request():
+            await self.wait_for_request_slot(request_method, request_url, request_headers)
+            req_obj = self.get_request_obj(request_url)
+            return await req_obj.request(request_method, request_url, params = parameters, headers = request_headers)
+
+        resp_obj = await self.send_with_retry(request_method, request_url, send_request)
+        return response_obj(resp_obj)
+
+    async def send_with_retry(self, request_method, request_url, send_request, is_idempotent = None, retry_policy = None):
+        """
+        Internal method to send a request through the send_request coroutine function, and to send it again
+        for as long as the retry policy allows it.
+        @param is_idempotent: Whether the request can safely be applied twice. Decided by the retry policy
+        from the method and url if C{None}.
+        @param retry_policy: The L{RetryPolicy} to follow. Defaults to the retry_policy of the client.
+        """
+        if retry_policy == None:
+            retry_policy = self.retry_policy
+        if is_idempotent == None:
+            is_idempotent = retry_policy.is_idempotent(request_method, request_url)
+
+        attempt = 1
+        while True:
+            try:
+                resp_obj = await send_request()
+            except httpx.TransportError as ex:
+                if not retry_policy.should_retry_error(is_idempotent, self.is_request_unsent(ex), attempt):
+                    raise
+                delay = retry_policy.get_delay(attempt)
+            else:
+                if not retry_policy.should_retry_response(resp_obj.status_code, is_idempotent, attempt):
+                    return resp_obj
+                delay = retry_policy.get_delay(attempt, get_retry_after(resp_obj.headers))
+                if delay == None:
+                    return resp_obj
+                await resp_obj.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def is_request_unsent(self, ex):
+        """
+        Internal method to check whether the request failed before it reached the server.
+        """
+        return isinstance(ex, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+    async def wait_for_request_slot(self, request_method, request_url, request_headers):
+        """
+        Internal method to wait until the request scheduler allows the request to be sent for its org.
+        Requests without an org (for example the OAuth requests) are not scheduled.
+        """
+        org_id = request_headers.get("ZANALYTICS-ORGID")
+        if self.request_scheduler == None or org_id == None:
+            return
+        bucket = self.request_scheduler.get_bucket(org_id, request_method, request_url)
+        if bucket == None:
+            return
+        is_background = request_priority.get() == BACKGROUND_PRIORITY
+        is_waiting = False
+        try:
+            while True:
+                wait_time = self.request_scheduler.take_token(bucket, is_background)
+                if wait_time == 0:
+                    return
+                if not is_waiting and not is_background:
+                    self.request_scheduler.add_waiter(bucket)
+                    is_waiting = True
+                await asyncio.sleep(wait_time)
+        finally:
+            if is_waiting:
+                self.request_scheduler.remove_waiter(bucket)
+
+    def get_request_obj(self, request_url):
+        """
+        Internal method to get the pooled client for the host of the given url.
+        Idle keep-alive connections are closed by httpx after pool_idle_timeout seconds.
+        """
+        url_parts = urllib.parse.urlsplit(request_url)
+        host_key = url_parts.scheme + "://" + url_parts.netloc
+
+        req_obj = self.clients.get(host_key)
+        if req_obj is None or req_obj.is_closed:
+            req_obj = self.create_request_obj()
+            self.clients[host_key] = req_obj
+        return req_obj
+
+    def create_request_obj(self):
+        """
+        Internal method to create a new keep-alive client with the configured pool size and proxy settings.
+        """
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.pool_maxsize,
+            keepalive_expiry=self.pool_idle_timeout
+        )
+
+        proxy = None
+        if self.proxy:
+            proxy_url = "http://" + self.proxy_host + ":" + self.proxy_port
+            if self.proxy_user_name != None and self.proxy_password != None:
+                proxy = httpx.Proxy(proxy_url, auth=(self.proxy_user_name, self.proxy_password))
+            else:
+                proxy = httpx.Proxy(proxy_url)
+
+        # No client side timeout, same as the requests based client.
+        return httpx.AsyncClient(limits=limits, proxy=proxy, verify=not self.exclude_ssl, timeout=None)
+
+    async def aclose(self):
+        """
+        Closes all the pooled clients held by the client.
+        """
+        clients = list(self.clients.values()) + self.retired_clients
+        self.clients.clear()
+        self.retired_clients = []
+        for client in clients:
+            await client.aclose()
+
+
+    def is_oauth_expired(self, resp_obj):
+        """
+        Internal method to check whether the accesstoken expired or not.
+        """
+        try:
+            resp_content = json.loads(resp_obj.resp_content)
+            err_code = resp_content["data"]["errorCode"]
+            return err_code == 8535
+        except Exception:
+                return False
+
+
+    async def get_access_token(self):
+        """
+        Internal method to get a valid access token.
+        The token is regenerated in the foreground only when it is missing or about to expire. Once it is within
+        token_refresh_margin seconds of expiry it is regenerated in the background, and callers keep using the
+        current token meanwhile.
+        """
+        access_token = self.access_token
+        remaining_time = self.get_token_remaining_time()
+        if access_token == None or remaining_time <= self.token_expiry_margin:
+            return await self.refresh_access_token(access_token)
+        if remaining_time <= self.token_refresh_margin:
+            self.start_background_token_refresh(access_token)
+        return access_token
+
+    def get_token_remaining_time(self):
+        """
+        Internal method to get the number of seconds left before the access token expires.
+        """
+        if self.access_token_expiry == None:
+            return math.inf
+        return self.access_token_expiry - time.time()
+
+    async def refresh_access_token(self, stale_token):
+        """
+        Internal method to regenerate the access token once the given token is found to be stale.
+        Concurrent callers are collapsed into a single regeneration, the callers waiting on the lock
+        get the token that was regenerated meanwhile.
+        """
+        async with self.token_lock:
+            if self.access_token != stale_token and self.access_token != None \
+                    and self.get_token_remaining_time() > self.token_expiry_margin:
+                return self.access_token
+            await self.load_or_regenerate_access_token(stale_token)
+            return self.access_token
+
+    async def load_or_regenerate_access_token(self, stale_token):
+        """
+        Internal method to take the access token from the token cache when another process has already
+        regenerated it, and to regenerate and cache it otherwise.
+        """
+        if self.token_cache == None:
+            await self.regenerate_analytics_oauth_token()
+            return
+
+        # Polls for the cross-process lock, so that the event loop is not blocked while another process holds it.
+        try:
+            lock_fd = self.token_cache.acquire_lock(blocking=False)
+            while lock_fd == None:
+                await asyncio.sleep(0.05)
+                lock_fd = self.token_cache.acquire_lock(blocking=False)
+        except OSError:
+            # An unusable cache directory should not stop the client from authenticating.
+            await self.regenerate_analytics_oauth_token()
+            return
+
+        try:
+            cached_token, cached_expiry = self.token_cache.read()
+            if cached_token != None and cached_token != stale_token \
+                    and cached_expiry - time.time() > self.token_expiry_margin:
+                self.access_token = cached_token
+                self.access_token_expiry = cached_expiry
+                return
+
+            await self.regenerate_analytics_oauth_token()
+            if self.access_token_expiry != None:
+                try:
+                    self.token_cache.write(self.access_token, self.access_token_expiry)
+                except OSError:
+                    pass
+        finally:
+            self.token_cache.release_lock(lock_fd)
+
+    def start_background_token_refresh(self, stale_token):
+        """
+        Internal method to regenerate the access token in a background task, unless one is already running.
+        """
+        if self.token_refresh_task != None and not self.token_refresh_task.done():
+            return
+        self.token_refresh_task = asyncio.ensure_future(self.refresh_access_token_in_background(stale_token))
+
+    async def refresh_access_token_in_background(self, stale_token):
+        """
+        Internal method to regenerate the access token ahead of its expiry.
+        """
+        try:
+            await self.refresh_access_token(stale_token)
+        except Exception:
+            # Failures are not fatal here, the token is regenerated in the foreground once it is about to expire.
+            pass
+
+
+    async def regenerate_analytics_oauth_token(self):
+        """
+        Internal method for getting OAuth token.
+        """
+        oauth_params = {}
+        oauth_params["client_id"] = self.client_id
+        oauth_params["client_secret"] = self.client_secret
+        oauth_params["refresh_token"] = self.refresh_token
+        oauth_params["grant_type"] = "refresh_token"
+        request_time = time.time()
+        oauth_params = urllib.parse.urlencode(oauth_params)
+        req_url = self.accounts_server_url + "/oauth/v2/token"
+        oauth_resp_obj = await self.submit_request("POST", req_url, oauth_params)
+
+        if(oauth_resp_obj.status_code == 200):
+            oauth_json_resp = json.loads(oauth_resp_obj.resp_content)
+            if("access_token" in oauth_json_resp):
+                self.access_token = oauth_json_resp["access_token"]
+                expires_in = oauth_json_resp.get("expires_in")
+                self.access_token_expiry = request_time + float(expires_in) if expires_in else None
+                return
+
+        raise ServerError(oauth_resp_obj.resp_content, True)
@@ -1,6 +1,8 @@
 import os
-from AnalyticsClient import AnalyticsClient
+from AnalyticsClient import AnalyticsClient, RetryPolicy, RequestScheduler
+from AsyncAnalyticsClient import AsyncAnalyticsClient
 from ZA_Config import ZA_Config
+from utils.token_cache import TokenCache
 
 # Need to use pydantic to add validation
 class Config:
@@ -12,6 +14,43 @@ class Config:
     ACCOUNTS_SERVER_URL = os.getenv("ACCOUNTS_SERVER_URL", "https://accounts.zoho.com")
     ANALYTICS_SERVER_URL = os.getenv("ANALYTICS_SERVER_URL", "https://analyticsapi.zoho.com")
     IS_ONPREMISE = os.getenv("IS_ONPREMISE", "false").lower() == "true"
+    HTTP_POOL_SIZE = int(os.getenv("ANALYTICS_HTTP_POOL_SIZE", "10"))
+    HTTP_IDLE_TIMEOUT = float(os.getenv("ANALYTICS_HTTP_IDLE_TIMEOUT", "300"))
+    TOKEN_CACHE_ENABLED = os.getenv("ANALYTICS_TOKEN_CACHE", "true").lower() == "true"
+    MAX_RETRIES = int(os.getenv("ANALYTICS_MAX_RETRIES", "3"))
+    RETRY_MAX_DELAY = float(os.getenv("ANALYTICS_RETRY_MAX_DELAY", "30"))
+    METADATA_RATE_LIMIT = float(os.getenv("ANALYTICS_METADATA_RATE_LIMIT", "10"))
+    POLL_RATE_LIMIT = float(os.getenv("ANALYTICS_POLL_RATE_LIMIT", "5"))
+    BULK_RATE_LIMIT = float(os.getenv("ANALYTICS_BULK_RATE_LIMIT", "5"))
+    RATE_LIMIT_BURST = float(os.getenv("ANALYTICS_RATE_LIMIT_BURST", "10"))
+    CACHE_DIR = os.path.join(MCP_DATA_DIR, ".analytics_mcp_cache") if MCP_DATA_DIR else None
+
+
+def configure_analytics_client(client):
+    """
+    Applies the data center, SSL, connection pool, token cache, retry and rate limit settings from the environment
+    to the given client.
+    """
+    if Config.ACCOUNTS_SERVER_URL is None or Config.ANALYTICS_SERVER_URL is None:
+        raise RuntimeError(
+            f"ACCOUNTS_SERVER_URL (or) ANALYTICS_SERVER_URL environment variable is not set. "
+            f"Please set it to your {ZA_Config.PRODUCT_NAME} accounts server URL and analytics server URL respectively."
+        )
+    client.accounts_server_url = Config.ACCOUNTS_SERVER_URL
+    client.analytics_server_url = Config.ANALYTICS_SERVER_URL
+
+    client.exclude_ssl = True if Config.IS_ONPREMISE else False
+    client.user_agent = ZA_Config.USER_AGENT_NAME
+    client.pool_maxsize = Config.HTTP_POOL_SIZE
+    client.pool_idle_timeout = Config.HTTP_IDLE_TIMEOUT
+    if Config.TOKEN_CACHE_ENABLED and Config.CACHE_DIR:
+        client.token_cache = TokenCache(Config.CACHE_DIR, Config.CLIENT_ID, Config.REFRESH_TOKEN, Config.ACCOUNTS_SERVER_URL)
+    client.retry_policy = RetryPolicy(max_attempts=Config.MAX_RETRIES + 1, max_delay=Config.RETRY_MAX_DELAY)
+    client.request_scheduler = RequestScheduler({
+        "metadata": Config.METADATA_RATE_LIMIT,
+        "poll": Config.POLL_RATE_LIMIT,
+        "bulk": Config.BULK_RATE_LIMIT
+    }, Config.RATE_LIMIT_BURST)
 
 
 analytics_client: AnalyticsClient  = None
@@ -24,14 +63,18 @@ def get_analytics_client_instance() -> AnalyticsClient:
     global analytics_client
     if not analytics_client:
         analytics_client = AnalyticsClient(Config.CLIENT_ID, Config.CLIENT_SECRET, Config.REFRESH_TOKEN)
-        if Config.ACCOUNTS_SERVER_URL is None or Config.ANALYTICS_SERVER_URL is None:
-            raise RuntimeError(
-                f"ACCOUNTS_SERVER_URL (or) ANALYTICS_SERVER_URL environment variable is not set. "
-                f"Please set it to your {Config.PRODUCT_NAME} accounts server URL and analytics server URL respectively."
-            )
-        analytics_client.accounts_server_url = Config.ACCOUNTS_SERVER_URL
-        analytics_client.analytics_server_url = Config.ANALYTICS_SERVER_URL
-
-        analytics_client.exclude_ssl = True if Config.IS_ONPREMISE else False
-        analytics_client.user_agent = ZA_Config.USER_AGENT_NAME
-    return analytics_client
\ No newline at end of file
+        configure_analytics_client(analytics_client)
+    return analytics_client
+
+
+async_analytics_client: AsyncAnalyticsClient = None
+def get_async_analytics_client_instance() -> AsyncAnalyticsClient:
+    """
+    Returns a singleton instance of the AsyncAnalyticsClient configured for the proper data center.
+    The tools use this client, so that a slow request does not block the other in-flight tool calls.
+    """
+    global async_analytics_client
+    if not async_analytics_client:
+        async_analytics_client = AsyncAnalyticsClient(Config.CLIENT_ID, Config.CLIENT_SECRET, Config.REFRESH_TOKEN)
+        configure_analytics_client(async_analytics_client)
+    return async_analytics_client
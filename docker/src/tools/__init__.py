@@ -1,4 +1,5 @@
 from . import metadata_tools
 from . import data_tools
 from . import modelling_tools
-from . import row_tools
\ No newline at end of file
+from . import row_tools
+from . import monitoring
\ No newline at end of file
@@ -1,12 +1,15 @@
 from mcp_instance import mcp
-from config import Config, get_analytics_client_instance
+from config import Config, get_async_analytics_client_instance
 import os
 import json
 import urllib
-import requests
+import httpx
 import pandas as pd
 from utils.common import retry_with_fallback
-from utils.data_utils import import_data_implementation, export_view_implementation, query_data_implementation
+from utils.data_utils import import_data_implementation, export_view_implementation, query_data_implementation, query_data_batch_implementation, query_data_paged_implementation, fetch_query_page_implementation, get_job_status_implementation, get_job_result_implementation, cancel_job_implementation, QUERY_DATA_ROW_LIMIT, QUERY_DATA_BATCH_SIZE_LIMIT
+from utils.result_store import QUERY_DATA_HANDLE_MAX_ROWS
+from utils.sql_utils import push_down_row_limit
+from utils.progress import reporting_progress
 import traceback
 from fastmcp.server.dependencies import get_context
 from utils.decorators import with_dynamic_doc
@@ -107,15 +110,22 @@ async def download_file(file_url: str) -> str:
         downloaded_path = os.path.join(download_dir, filename)
 
         # Get SSL verification setting from analytics client
-        analytics_client = get_analytics_client_instance()
+        analytics_client = get_async_analytics_client_instance()
         verify_ssl = not analytics_client.exclude_ssl
 
-        response = requests.get(file_url, stream=True, verify=verify_ssl)
-        response.raise_for_status()
+        async with httpx.AsyncClient(verify=verify_ssl, follow_redirects=True, timeout=None) as client:
+            async with client.stream("GET", file_url) as response:
+                response.raise_for_status()
 
-        with open(downloaded_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+                try:
+                    with open(downloaded_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(chunk_size=8192):
+                            f.write(chunk)
+                except BaseException:
+                    # A partial download, for example of a cancelled call, must not be mistaken for the file.
+                    if os.path.exists(downloaded_path):
+                        os.remove(downloaded_path)
+                    raise
 
         return f"File downloaded successfully and saved to {downloaded_path}"
     
@@ -157,7 +167,7 @@ async def import_data(workspace_id: str, table_id: str, data: list[dict] | None
         if not org_id:
             org_id = Config.ORG_ID
         
-        return retry_with_fallback([org_id], workspace_id, "WORKSPACE", import_data_implementation, workspace_id=workspace_id, file_path=file_path, table_id=table_id, file_type=file_type, data=data)
+        return await retry_with_fallback([org_id], workspace_id, "WORKSPACE", import_data_implementation, workspace_id=workspace_id, file_path=file_path, table_id=table_id, file_type=file_type, data=data)
     except Exception as e:
         ctx = get_context()
         await ctx.error(traceback.format_exc())
@@ -172,6 +182,7 @@ async def import_data(workspace_id: str, table_id: str, data: list[dict] | None
 
     <important_notes>
         Mostly prefer html for charts and dashboards, and csv for tables.
+        Exporting a large dashboard can take a while. If the export takes too long, or if run_in_background is true, it continues in the background and a job handle is returned, whose result can be collected later using the get_job_result tool.
     </important_notes>
     
     <arguments>
@@ -180,14 +191,16 @@ async def import_data(workspace_id: str, table_id: str, data: list[dict] | None
         response_file_format (str): The format in which to export the objects. Supported formats are ["csv","json","xml","xls","pdf","html","image"].
         response_file_path (str): The path where the exported file will be saved.
         org_id (str | None): The ID of the organization to which the workspace belongs to. If not provided, it defaults to the organization ID from the configuration.
+        run_in_background (bool): Whether to return a job handle right away instead of waiting for the export. Defaults to false.
     <arguments>               
 """)
-async def export_view(workspace_id: str, view_id: str, response_file_format: str, response_file_path: str, org_id: str | None = None) -> str:
+async def export_view(workspace_id: str, view_id: str, response_file_format: str, response_file_path: str, org_id: str | None = None, run_in_background: bool = False) -> str:
 
     try:
         if not org_id:
             org_id = Config.ORG_ID
-        return retry_with_fallback([org_id], workspace_id, "WORKSPACE", export_view_implementation, response_file_format=response_file_format, response_file_path=response_file_path, workspace_id=workspace_id, view_id=view_id)
+        with reporting_progress(get_context()):
+            return await export_view_implementation(org_id, response_file_format, response_file_path, workspace_id, view_id, run_in_background)
     except Exception as e:
         ctx = get_context()
         await ctx.error(traceback.format_exc())
@@ -210,26 +223,210 @@ async def export_view(workspace_id: str, view_id: str, response_file_format: str
     - If table or column names contain spaces or special characters, enclose them in double quotes (e.g., `"Column Name"`).
     - Do not use more than one level of nested sub-queries.
     - Instead of doing n queries, try to combine them into a single query using joins or unions or sub-queries, while ensuring the query remains efficient.
+    - A LIMIT is added to the query automatically when it is safe, so there is no need to add one just to reduce the result size.
+    - If more than the top 20 rows are needed, set paged to true. The result is then kept for a while under a handle, and the remaining rows can be read using the fetch_query_page tool without running the query again.
+    - If the query takes too long, or if run_in_background is true, it continues in the background and a job handle is returned instead of the result. Do not run the query again, collect its result later using the get_job_result tool.
     </important_notes>
 
     <arguments>
         workspace_id (str): The ID of the workspace where the query will be executed.
         sql_query (str): The SQL query to be executed.
         org_id (str | None): The ID of the organization to which the workspace belongs to. If not provided, it defaults to the organization ID from the configuration.
+        paged (bool): Whether to keep the full result for the fetch_query_page tool. Defaults to false.
+        run_in_background (bool): Whether to return a job handle right away instead of waiting for the result. Defaults to false.
     </arguments>
 
     <returns>
         Result of the SQL query in a comma-separated (list of list) format of the top 20 rows alone, the first row contains the column names. 
+        If paged is true, returns a dictionary with the result handle, the column names, the top 20 rows, the total number of rows, whether more rows are available and whether the result was truncated.
         If an error occurs, returns an error message.
     </returns>
 """)
-async def query_data(workspace_id: str, sql_query: str, org_id: str | None = None) -> list[dict]:
+async def query_data(workspace_id: str, sql_query: str, org_id: str | None = None, paged: bool = False, run_in_background: bool = False) -> list[dict]:
 
     if not org_id:
         org_id = Config.ORG_ID
     try:
-        return retry_with_fallback([org_id], workspace_id, "WORKSPACE", query_data_implementation, workspace_id=workspace_id, sql_query=sql_query)
+        ctx = get_context()
+        # A paged result is fetched with one row more than is kept, so that a result cut off at the limit is known to be truncated.
+        row_limit = QUERY_DATA_HANDLE_MAX_ROWS + 1 if paged else QUERY_DATA_ROW_LIMIT
+        sql_query, is_limit_pushed_down = push_down_row_limit(sql_query, row_limit)
+        if is_limit_pushed_down:
+            await ctx.info(f"Row limit pushed down into the query: {sql_query}")
+        else:
+            await ctx.info("Row limit not pushed down, the query is run as is")
+        with reporting_progress(ctx):
+            if paged:
+                return await retry_with_fallback([org_id], workspace_id, "WORKSPACE", query_data_paged_implementation, workspace_id=workspace_id, sql_query=sql_query, run_in_background=run_in_background)
+            return await retry_with_fallback([org_id], workspace_id, "WORKSPACE", query_data_implementation, workspace_id=workspace_id, sql_query=sql_query, run_in_background=run_in_background)
+    except Exception as e:
+        ctx = get_context()
+        await ctx.error(traceback.format_exc())
+        return f"An error occurred while executing the query: {e}"
+
+
+@mcp.tool()
+@with_dynamic_doc("""
+    <use_case>
+    1. Returns a page of rows from the result of a query that was run using the query_data tool with paged set to true.
+    2. Use this when the rows beyond the first page of a query result are needed, instead of running the query again.
+    </use_case>
+
+    <important_notes>
+    - The number of rows per page is capped (100 by default), so request large results page by page.
+    - Result handles expire after a while. If the handle has expired, run the query again using the query_data tool.
+    </important_notes>
+
+    <arguments>
+        handle (str): The result handle returned by the query_data tool.
+        offset (int): The number of rows to skip, not counting the column names row.
+        limit (int | None): The number of rows to return. If not provided, it defaults to 20.
+    </arguments>
+
+    <returns>
+        A dictionary with the result handle, the column names, the offset, the rows of the page, the total number of rows, whether more rows are available and whether the result was truncated.
+        If an error occurs, returns an error message.
+    </returns>
+""")
+async def fetch_query_page(handle: str, offset: int = 0, limit: int | None = None) -> dict:
+
+    try:
+        return await fetch_query_page_implementation(handle, offset, limit)
+    except Exception as e:
+        ctx = get_context()
+        await ctx.error(traceback.format_exc())
+        return f"An error occurred while fetching the query result page: {e}"
+
+
+@mcp.tool()
+@with_dynamic_doc("""
+    <use_case>
+    1. Executes several independent SQL queries on the specified workspace at the same time, and returns the top 20 rows of each query.
+    2. Use this instead of calling query_data repeatedly when several results are needed to answer a question, for example a few different aggregates. The batch takes about as long as its slowest query.
+    </use_case>
+
+    <important_notes>
+    - The same rules as for the query_data tool apply to every query.
+    - Only queries that do not depend on the result of each other can be batched.
+    - At most 20 queries can be run in a batch.
+    - A failed query does not fail the batch, its error is returned in place of its result.
+    </important_notes>
+
+    <arguments>
+        workspace_id (str): The ID of the workspace where the queries will be executed.
+        sql_queries (list[str]): The SQL queries to be executed.
+        org_id (str | None): The ID of the organization to which the workspace belongs to. If not provided, it defaults to the organization ID from the configuration.
+    </arguments>
+
+    <returns>
+        A list with one dictionary per query, in the order of the queries, containing the query as given and either its result or its error. When a row limit was added to the query to run it, the query as run is returned as executed_sql_query.
+        The result is in a comma-separated (list of list) format of the top 20 rows alone, the first row contains the column names.
+        If an error occurs, returns an error message.
+    </returns>
+""")
+async def query_data_batch(workspace_id: str, sql_queries: list[str], org_id: str | None = None) -> list[dict]:
+
+    if not org_id:
+        org_id = Config.ORG_ID
+    try:
+        if not sql_queries:
+            return "No queries provided. Please provide at least one SQL query."
+        if len(sql_queries) > QUERY_DATA_BATCH_SIZE_LIMIT:
+            return f"Too many queries in the batch. Please provide at most {QUERY_DATA_BATCH_SIZE_LIMIT} queries."
+        ctx = get_context()
+        limited_queries = [push_down_row_limit(sql_query, QUERY_DATA_ROW_LIMIT) for sql_query in sql_queries]
+        pushed_down_count = sum(is_limit_pushed_down for _, is_limit_pushed_down in limited_queries)
+        await ctx.info(f"Row limit pushed down into {pushed_down_count} of {len(sql_queries)} queries")
+        with reporting_progress(ctx):
+            results = await retry_with_fallback([org_id], workspace_id, "WORKSPACE", query_data_batch_implementation, workspace_id=workspace_id, sql_queries=[sql_query for sql_query, _ in limited_queries])
+        for result, sql_query, (limited_query, is_limit_pushed_down) in zip(results, sql_queries, limited_queries):
+            result["sql_query"] = sql_query
+            if is_limit_pushed_down:
+                result["executed_sql_query"] = limited_query
+        return results
+    except Exception as e:
+        ctx = get_context()
+        await ctx.error(traceback.format_exc())
+        return f"An error occurred while executing the queries: {e}"
+
+
+@mcp.tool()
+async def get_job_status(handle: str) -> dict:
+    """
+    <use_case>
+    1. Returns the status of a background job, i.e. a query or an export that continues in the background after the query_data or export_view tool returned its job handle.
+    </use_case>
+
+    <important_notes>
+    - Job handles expire a while after the job is finished.
+    </important_notes>
+
+    <arguments>
+        handle (str): The job handle returned by the query_data or export_view tool.
+    </arguments>
+
+    <returns>
+        A dictionary with the job handle, the kind of job, its description, its status ("running", "completed", "failed" or "cancelled") and the elapsed time in seconds.
+        If an error occurs, returns an error message.
+    </returns>
+    """
+    try:
+        return get_job_status_implementation(handle)
+    except Exception as e:
+        ctx = get_context()
+        await ctx.error(traceback.format_exc())
+        return f"An error occurred while getting the job status: {e}"
+
+
+@mcp.tool()
+async def get_job_result(handle: str) -> list[dict]:
+    """
+    <use_case>
+    1. Returns the result of a completed background job, i.e. a query or an export that continued in the background after the query_data or export_view tool returned its job handle.
+    </use_case>
+
+    <important_notes>
+    - If the job is still running, a message saying so is returned. Check again later instead of running the query or export again.
+    - Job handles expire a while after the job is finished.
+    </important_notes>
+
+    <arguments>
+        handle (str): The job handle returned by the query_data or export_view tool.
+    </arguments>
+
+    <returns>
+        The result that the query_data or export_view tool would have returned for the job.
+        If the job is still running, has failed or has expired, or if an error occurs, returns a message.
+    </returns>
+    """
+    try:
+        return get_job_result_implementation(handle)
+    except Exception as e:
+        ctx = get_context()
+        await ctx.error(traceback.format_exc())
+        return f"An error occurred while getting the job result: {e}"
+
+
+@mcp.tool()
+async def cancel_job(handle: str) -> str:
+    """
+    <use_case>
+    1. Cancels a background job, i.e. a query or an export that continues in the background after the query_data or export_view tool returned its job handle.
+    2. Use this when the result of the job is no longer needed, so that it stops using the server capacity.
+    </use_case>
+
+    <arguments>
+        handle (str): The job handle returned by the query_data or export_view tool.
+    </arguments>
+
+    <returns>
+        A string indicating whether the job was cancelled.
+        If an error occurs, returns an error message.
+    </returns>
+    """
+    try:
+        return cancel_job_implementation(handle)
     except Exception as e:
         ctx = get_context()
         await ctx.error(traceback.format_exc())
-        return f"An error occurred while executing the query: {e}"
\ No newline at end of file
+        return f"An error occurred while cancelling the job: {e}"
@@ -1,6 +1,8 @@
 from mcp_instance import mcp
-from config import Config, get_analytics_client_instance
+from config import Config, get_async_analytics_client_instance
 from utils.metadata_util import filter_and_limit_workspaces, get_views
+from utils.metadata_cache import get_workspaces, get_owned_workspaces, get_cached_view_columns, get_view_details as get_cached_view_details
+from utils.view_ranker import ViewRanker
 import os
 from utils.common import retry_with_fallback
 from utils.decorators import with_dynamic_doc
@@ -8,9 +10,14 @@ from fastmcp import Context
 from fastmcp.server.dependencies import get_context
 import math
 import json
+import asyncio
 import traceback
 
 WORKSPACE_RESULT_LIMIT = os.getenv("ANALYTICS_WORKSPACE_LIST_RESULT_SIZE") or 20
+SEARCH_VIEWS_SAMPLING_CONCURRENCY = int(os.getenv("SEARCH_VIEWS_SAMPLING_CONCURRENCY", "4"))
+SEARCH_VIEWS_PRERANK_TOP_N = int(os.getenv("SEARCH_VIEWS_PRERANK_TOP_N", "60"))
+# Number of views each batch is narrowed down to, as asked in the ranking prompt.
+SEARCH_VIEWS_BATCH_TOP_N = 5
 
 @mcp.tool()
 async def get_workspaces_list(include_shared_workspaces: bool, contains_str: str | None = None) -> list[dict]:
@@ -36,12 +43,11 @@ async def get_workspaces_list(include_shared_workspaces: bool, contains_str: str
     </returns>
     """
     try:
-        analytics_client = get_analytics_client_instance()
         if not include_shared_workspaces:
-            workspaces = analytics_client.get_owned_workspaces()
+            workspaces = await get_owned_workspaces()
             return filter_and_limit_workspaces(workspaces, contains_str, owned_flag=True, limit=WORKSPACE_RESULT_LIMIT)
         else:
-            workspaces = analytics_client.get_workspaces()
+            workspaces = await get_workspaces()
             owned_result = filter_and_limit_workspaces(
                 workspaces.get("ownedWorkspaces", []), contains_str, owned_flag=True, limit=WORKSPACE_RESULT_LIMIT
             )
@@ -81,8 +87,7 @@ async def get_view_details(view_id: str) -> dict:
     </returns>
     """
     try:    
-        analytics_client = get_analytics_client_instance()
-        view_details = analytics_client.get_view_details(view_id, config={"withInvolvedMetaInfo": True})
+        view_details = await get_cached_view_details(view_id, config={"withInvolvedMetaInfo": True})
         view_details.pop('orgId')
         view_details.pop('createdByZuId')
         view_details.pop('lastDesignModifiedByZuId')
@@ -100,6 +105,54 @@ async def get_view_details(view_id: str) -> dict:
         return f"An error occurred while fetching view details: {str(e)}"
 
 
+async def rank_views_batch(ctx, sampling_semaphore, natural_language_query, views_in_batch, epoch, batch_number, number_of_batches, epoch_view_count):
+    """
+    Asks the client's LLM to rank a batch of views against the query, and returns the ids of the most relevant views.
+    At most SEARCH_VIEWS_SAMPLING_CONCURRENCY batches are sampled at a time.
+    """
+    prompt = f"""
+    You are an expert at identifying and ranking relevant views (tables, reports, dashboards) based on natural language queries.
+    
+    EPOCH {epoch} - BATCH {batch_number + 1}/{number_of_batches}
+    Current views number in this epoch: {epoch_view_count}
+    Views number in this batch: {len(views_in_batch)}
+    
+    Your task: Analyze the following views and rank them by relevance to the query. Return the TOP 5 MOST RELEVANT views from this batch based on your ranking.
+    
+    Views in this batch:
+    {views_in_batch}
+    
+    Natural language query: `{natural_language_query}`
+    
+    Instructions:
+    1. Rank ALL views in this batch by relevance to the query
+    2. Select the TOP 5 most relevant views based on your rankingk
+    3. If there are fewer than 5 views in the batch, return only the relevant views from them
+    4. Consider view names, descriptions, and how well they match the query intent
+    5. The output provided should be a properly escaped json and should not contain other formatting characters like new lines.
+    
+    Strictly provide your output in the following JSON format:
+    {{"relevant_views":[<list-of-top-5-view-ids-in-order-of-relevance>]}}
+    """
+
+    async with sampling_semaphore:
+        response_string = await ctx.sample(prompt)
+
+    if response_string.type != "text":
+        raise ValueError("Error in processing the RAG response, the response is not text.")
+
+    log_message = {
+        "epoch": epoch,
+        "batch": batch_number + 1,
+        "prompt": prompt,
+        "response": response_string.text,
+    }
+    await ctx.info(json.dumps(log_message, indent=2))
+
+    response_json = json.loads(response_string.text)
+    return response_json.get("relevant_views", [])
+
+
 @mcp.tool()
 @with_dynamic_doc(
     """
@@ -109,8 +162,9 @@ async def get_view_details(view_id: str) -> dict:
     </use_case>
 
     <important_notes>
-        - If view_contains_str is provided, performs simple string matching on view names.
+        - If view_contains_str is provided, performs a ranked search on the view names, descriptions and known columns, which tolerates partial words and typos, and returns the best matches first.
         - If view_contains_str is None and natural_language_query is provided with ctx available, performs intelligent RAG-based search using natural language.
+        - The RAG-based search only considers the views whose names, descriptions and columns best match the words of the query, and returns the best matches right away when one view clearly stands out.
         - If both view_contains_str and natural_language_query are provided, view_contains_str takes precedence and RAG search is not performed.
         - If both are None, returns returns the views without filtering. If there are too many views, it will return an error message.
         - If not specified explicitly, use [0, 6] as default allowedViewTypesIds, which includes Table and Query Table.
@@ -119,7 +173,7 @@ async def get_view_details(view_id: str) -> dict:
     <arguments>
         - workspace_id (str): The ID of the workspace to search in.
         - natural_language_query (str | None): Natural language query for intelligent search. Ignored if view_contains_str is provided.
-        - view_contains_str (str | None): String to filter views by name matching. Takes precedence over natural_language_query.
+        - view_contains_str (str | None): Keywords to search the views with. Takes precedence over natural_language_query.
         - allowedViewTypesIds (list[int] | None): Optional list of view type IDs to filter results.
             Different types of views available in {PRODUCT_NAME} are:
             (view type_id, view_type_name)
@@ -151,11 +205,11 @@ async def search_views(
             org_id = Config.ORG_ID
 
         if (view_contains_str is not None and view_contains_str.strip() != "") or (natural_language_query is None or natural_language_query.strip() == ""):
-            return retry_with_fallback([org_id], workspace_id, "WORKSPACE", get_views,workspace_id=workspace_id, allowedViewTypesIds=allowedViewTypesIds, contains_str=view_contains_str, from_relevant_views_tool=False)
+            return await retry_with_fallback([org_id], workspace_id, "WORKSPACE", get_views,workspace_id=workspace_id, allowedViewTypesIds=allowedViewTypesIds, contains_str=view_contains_str, from_relevant_views_tool=False)
 
         else:
-            view_list = retry_with_fallback([org_id], workspace_id, "WORKSPACE",get_views,workspace_id=workspace_id, allowedViewTypesIds=[0, 6], contains_str=None, from_relevant_views_tool=True)
-            if view_list is None or len(view_list) == 0:
+            view_list = await retry_with_fallback([org_id], workspace_id, "WORKSPACE",get_views,workspace_id=workspace_id, allowedViewTypesIds=[0, 6], contains_str=None, from_relevant_views_tool=True)
+            if not isinstance(view_list, list) or len(view_list) == 0:
                 return "No views found in the workspace."
 
 
@@ -173,68 +227,54 @@ async def search_views(
             epoch = 1
 
             sample_supported = True
-
-            # Epoch-based filtering
             ctx = get_context()
+
+            # Lexical pre-ranking, so that only the best candidates are sampled
+            if len(current_view_list) > 15 and SEARCH_VIEWS_PRERANK_TOP_N > 0:
+                view_ranker = ViewRanker(transformed_view_list, get_cached_view_columns(set(view_id_to_details)))
+                ranked_view_ids, is_unambiguous = view_ranker.rank(natural_language_query, SEARCH_VIEWS_PRERANK_TOP_N)
+                current_view_list = [view_id_to_details[view_id] for view_id in ranked_view_ids]
+                if is_unambiguous:
+                    await ctx.info(f"The best lexical match {ranked_view_ids[0]} is unambiguous, returning the top {batch_size} views without sampling")
+                    return current_view_list[:batch_size]
+                await ctx.info(f"Pre-ranked {len(transformed_view_list)} views down to {len(current_view_list)} candidates")
+
+            # Epoch-based filtering, the batches of an epoch are ranked concurrently
+            sampling_semaphore = asyncio.Semaphore(SEARCH_VIEWS_SAMPLING_CONCURRENCY)
             while len(current_view_list) > 15 and epoch <= max_epochs and sample_supported:
                 await ctx.info(f"Starting Epoch {epoch} with {len(current_view_list)} views")
 
-                filtered_view_list = []
                 number_of_batches = math.ceil(len(current_view_list) / batch_size)
+                batches = [current_view_list[batch_number * batch_size : (batch_number + 1) * batch_size] for batch_number in range(number_of_batches)]
+                batch_results = await asyncio.gather(*[
+                    rank_views_batch(ctx, sampling_semaphore, natural_language_query, views_in_batch, epoch, batch_number, number_of_batches, len(current_view_list))
+                    for batch_number, views_in_batch in enumerate(batches)
+                ], return_exceptions=True)
+
+                # The batches are merged in their order, so the result does not depend on which batch finished first
+                batch_errors = [batch_result for batch_result in batch_results if isinstance(batch_result, Exception)]
+                if epoch == 1 and len(batch_errors) == number_of_batches:
+                    await ctx.error("".join(traceback.format_exception(batch_errors[0])))
+                    await ctx.info("Sampling is not supported in this environment")
+                    sample_supported = False
+                    break
+                for batch_error in batch_errors:
+                    await ctx.error("".join(traceback.format_exception(batch_error)))
 
-                for batch_number in range(number_of_batches):
-                    views_in_batch = current_view_list[batch_number * batch_size : (batch_number + 1) * batch_size]
-
-                    prompt = f"""
-                    You are an expert at identifying and ranking relevant views (tables, reports, dashboards) based on natural language queries.
-                    
-                    EPOCH {epoch} - BATCH {batch_number + 1}/{number_of_batches}
-                    Current views number in this epoch: {len(current_view_list)}
-                    Views number in this batch: {len(views_in_batch)}
-                    
-                    Your task: Analyze the following views and rank them by relevance to the query. Return the TOP 5 MOST RELEVANT views from this batch based on your ranking.
-                    
-                    Views in this batch:
-                    {views_in_batch}
-                    
-                    Natural language query: `{natural_language_query}`
-                    
-                    Instructions:
-                    1. Rank ALL views in this batch by relevance to the query
-                    2. Select the TOP 5 most relevant views based on your rankingk
-                    3. If there are fewer than 5 views in the batch, return only the relevant views from them
-                    4. Consider view names, descriptions, and how well they match the query intent
-                    5. The output provided should be a properly escaped json and should not contain other formatting characters like new lines.
-                    
-                    Strictly provide your output in the following JSON format:
-                    {{"relevant_views":[<list-of-top-5-view-ids-in-order-of-relevance>]}}
-                    """
-
-                    try:
-                        response_string = await ctx.sample(prompt)
-                    except Exception as e:
-                        ctx.error(traceback.format_exc())
-                        if batch_number == 0 and epoch == 1:
-                            await ctx.info("Sampling is not supported in this environment")
-                            sample_supported = False
-                        break
-
-
-                    if response_string.type != "text":
-                        return "Error in processing the RAG response. Please try again."
-
-                    log_message = {
-                        "epoch": epoch,
-                        "batch": batch_number + 1,
-                        "prompt": prompt,
-                        "response": response_string.text,
-                    }
-                    await ctx.info(json.dumps(log_message, indent=2))
-
-                    response_json = json.loads(response_string.text)
-
-                    for view_id in response_json.get("relevant_views", []):
-                        if view_id in view_id_to_details:
+                filtered_view_list = []
+                added_view_ids = set()
+                for views_in_batch, batch_result in zip(batches, batch_results):
+                    if isinstance(batch_result, Exception):
+                        # A failed batch keeps its leading views instead of failing the epoch
+                        relevant_view_ids = [view["viewId"] for view in views_in_batch[:SEARCH_VIEWS_BATCH_TOP_N]]
+                    elif isinstance(batch_result, BaseException):
+                        raise batch_result
+                    else:
+                        relevant_view_ids = batch_result
+
+                    for view_id in relevant_view_ids:
+                        if view_id in view_id_to_details and view_id not in added_view_ids:
+                            added_view_ids.add(view_id)
                             view_details = {
                                 'viewId': view_id,
                                 'viewName': view_id_to_details[view_id]['viewName'],
@@ -242,17 +282,13 @@ async def search_views(
                             }
                             filtered_view_list.append(view_details)
 
-
-                if not sample_supported:
-                    break
-
-                await ctx.info(f"Epoch {epoch} completed. Reduced from {len(current_view_list)} to {len(filtered_view_list)} views")
+                await ctx.info(f"Epoch {epoch} completed. Reduced from {len(current_view_list)} to {len(filtered_view_list)} views ({len(batch_errors)} of {number_of_batches} batches failed)")
                 current_view_list = filtered_view_list
                 epoch += 1
 
             if not sample_supported:
-                await ctx.info("Using fallback mechanism: Returning first 20 views from the workspace")
-                return transformed_view_list[:20]
+                await ctx.info("Using fallback mechanism: Returning the first 20 candidate views from the workspace")
+                return current_view_list[:20]
 
             await ctx.info(f"Final result: {len(current_view_list)} views after {epoch - 1} epochs")
             return current_view_list
@@ -260,5 +296,6 @@ async def search_views(
 
 
     except Exception as e:
-        ctx.error(traceback.format_exc())
-        return f"An error occurred while fetching views: {e}"
\ No newline at end of file
+        ctx = get_context()
+        await ctx.error(traceback.format_exc())
+        return f"An error occurred while fetching views: {e}"
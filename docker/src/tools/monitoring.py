@@ -0,0 +1,11 @@
+from mcp_instance import mcp
+import json
+from utils.cache import get_cache_stats
+
+
+@mcp.resource("analytics://cache/stats", mime_type="application/json")
+def cache_stats() -> str:
+    """
+    Size, hit, miss, eviction and invalidation counts of the in-memory caches of the server, for monitoring.
+    """
+    return json.dumps(get_cache_stats(), indent=2)
@@ -0,0 +1,130 @@
+import time
+from collections import OrderedDict
+
+# All the caches by name, so that their stats can be reported together.
+CACHES = {}
+
+
+class TTLCache:
+    """
+    In-memory LRU cache holding at most max_entries entries, each of which expires ttl seconds after it is stored.
+    Entries can be tagged, so that all the entries of a tag (for example a workspace) are invalidated at once.
+    on_remove is called with the key and value of every entry that leaves the cache, if the value holds resources.
+    Hit, miss, eviction and invalidation counts are kept for monitoring.
+    """
+
+    def __init__(self, name, max_entries, ttl, on_remove=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.on_remove = on_remove
+        self.entries = OrderedDict()
+        self.tag_keys = {}
+        self.tag_versions = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        CACHES[name] = self
+
+    def get(self, key):
+        """
+        Returns the cached value, or None if the key is not cached or has expired.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expiry_time, tags = entry
+        if time.monotonic() >= expiry_time:
+            self.remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def get_entries(self):
+        """
+        Returns the (key, value, tags) tuples of the entries that have not expired, from the least recently used.
+        """
+        current_time = time.monotonic()
+        return [(key, value, tags) for key, (value, expiry_time, tags) in self.entries.items() if current_time < expiry_time]
+
+    def get_version(self, tags):
+        """
+        Returns the current version of the tags. Pass it to set, so that a value computed while one of the tags was
+        invalidated is not cached.
+        """
+        return tuple(self.tag_versions.get(tag, 0) for tag in tags)
+
+    def set(self, key, value, tags=(), version=None):
+        if self.max_entries <= 0 or self.ttl <= 0:
+            return
+        if version is not None and version != self.get_version(tags):
+            return
+        if key in self.entries:
+            self.remove(key)
+        self.entries[key] = (value, time.monotonic() + self.ttl, tuple(tags))
+        for tag in tags:
+            self.tag_keys.setdefault(tag, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            self.remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def remove(self, key):
+        value, expiry_time, tags = self.entries.pop(key)
+        for tag in tags:
+            keys = self.tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tag_keys[tag]
+        if self.on_remove is not None:
+            self.on_remove(key, value)
+
+    def purge_expired(self):
+        """
+        Removes the expired entries, which are otherwise only removed when they are looked up.
+        """
+        current_time = time.monotonic()
+        for key in [key for key, entry in self.entries.items() if current_time >= entry[1]]:
+            self.remove(key)
+            self.expirations += 1
+
+    def invalidate(self, tag):
+        """
+        Removes all the entries of the tag, and returns the number of removed entries.
+        """
+        self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
+        keys = list(self.tag_keys.get(tag, ()))
+        for key in keys:
+            self.remove(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self):
+        for tag in list(self.tag_keys):
+            self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
+        for key in list(self.entries):
+            self.remove(key)
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "maxEntries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hits / lookups if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
+
+
+def get_cache_stats():
+    return {name: cache.get_stats() for name, cache in CACHES.items()}
@@ -0,0 +1,42 @@
+import json
+import time
+from utils.private_cache import private_cache_path, write_private_json
+
+# Snapshots written with another format version are ignored.
+CATALOG_SNAPSHOT_VERSION = 1
+
+
+class CatalogSnapshot:
+    """
+    Persists the cached metadata on disk, so that a new server process starts with the catalog learnt by the previous
+    one instead of fetching it again.
+    Every account has its own snapshot, see private_cache_path.
+    """
+
+    def __init__(self, cache_dir, client_id, refresh_token, analytics_server_url):
+        self.snapshot_path = private_cache_path(cache_dir, "catalog", analytics_server_url, client_id, refresh_token)
+
+    def read(self, max_age):
+        """
+        Returns the (key, value, tags) tuples of the snapshot, or an empty list if there is no usable snapshot, i.e. if
+        it is missing, unreadable, of another format version or older than max_age seconds.
+        """
+        try:
+            with open(self.snapshot_path, "r") as file:
+                snapshot = json.load(file)
+            if snapshot["version"] != CATALOG_SNAPSHOT_VERSION or time.time() - float(snapshot["savedAt"]) > max_age:
+                return []
+            return [(tuple(key), value, tuple(tags)) for key, value, tags in snapshot["entries"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+
+    def write(self, entries):
+        """
+        Replaces the snapshot with the (key, value, tags) tuples.
+        """
+        snapshot = {
+            "version": CATALOG_SNAPSHOT_VERSION,
+            "savedAt": time.time(),
+            "entries": [[list(key), value, list(tags)] for key, value, tags in entries]
+        }
+        write_private_json(self.snapshot_path, snapshot)
@@ -1,76 +1,381 @@
-from config import get_analytics_client_instance
+from config import get_async_analytics_client_instance
+from utils.query_cache import query_result_cache, get_query_cache_key, invalidates_query_results
+from utils.result_store import query_result_store, QUERY_DATA_HANDLE_MAX_ROWS, QUERY_DATA_MAX_PAGE_SIZE
+from utils.job_registry import job_registry, JOB_BACKGROUND_TIMEOUT
+from utils.progress import get_progress_reporter
+from utils.single_flight import SingleFlight
+from utils.common import retry_with_fallback
+from AnalyticsClient import reserved_requests
+from contextlib import aclosing
+import asyncio
+import codecs
 import time
 import csv
 import os
 
-QUERY_DATA_ROW_LIMIT = os.getenv("QUERY_DATA_RESULT_ROW_LIMITS") or 20
-QUERY_DATA_POLLING_INTERVAL = os.getenv("QUERY_DATA_POLLING_INTERVAL") or 4
-QUERY_DATA_QUEUE_TIMEOUT = os.getenv("QUERY_DATA_QUEUE_TIMEOUT") or 120
-QUERY_DATA_QUERY_EXECUTION_TIMEOUT = os.getenv("QUERY_DATA_QUERY_EXECUTION_TIMEOUT") or 30
-
-
-def poll_job_completion(bulk, job_id, status_messages, polling_interval=None, queue_timeout=None, execution_timeout=None):
-    if polling_interval is None:
-        polling_interval = QUERY_DATA_POLLING_INTERVAL
-    if queue_timeout is None:
-        queue_timeout = QUERY_DATA_QUEUE_TIMEOUT
-    if execution_timeout is None:
-        execution_timeout = QUERY_DATA_QUERY_EXECUTION_TIMEOUT
-    start_time = time.time()
-    processing_start_time = None
+QUERY_DATA_ROW_LIMIT = int(os.getenv("QUERY_DATA_RESULT_ROW_LIMITS", "20"))
+QUERY_DATA_POLLING_INTERVAL = float(os.getenv("QUERY_DATA_POLLING_INTERVAL", "4"))
+QUERY_DATA_INITIAL_POLLING_INTERVAL = float(os.getenv("QUERY_DATA_INITIAL_POLLING_INTERVAL", "0.25"))
+QUERY_DATA_QUEUE_TIMEOUT = float(os.getenv("QUERY_DATA_QUEUE_TIMEOUT", "120"))
+QUERY_DATA_QUERY_EXECUTION_TIMEOUT = float(os.getenv("QUERY_DATA_QUERY_EXECUTION_TIMEOUT", "30"))
+QUERY_DATA_BATCH_SIZE_LIMIT = int(os.getenv("QUERY_DATA_BATCH_SIZE_LIMIT", "20"))
+
+QUERY_STATUS_MESSAGES = {
+    'error': "Some internal error ocurred (Not likely due to the query). Please try again later.",
+    'queue_timeout': "Query Job accepted, but queue processing is slow. Please try again later.",
+    'execution_timeout': "Query is taking too long to execute, maybe due to the complexity. Please try a simpler query"
+}
+EXPORT_JOB_STATES = {'1001': "queued", '1002': "in progress", '1003': "failed", '1004': "completed"}
+DASHBOARD_EXPORT_STATUS_MESSAGES = {
+    'error': "Some internal error ocurred. Please try again later.",
+    'queue_timeout': "Dashboard export Job accepted, but queue processing is slow. Please try again later.",
+    'execution_timeout': "Dashboard is taking too long to export, maybe due to the complexity. Please try a again later."
+}
+
+
+class PollingBackoff:
+    """
+    Decides the wait before the next status check of an export job, from the jobCode of the last check.
+    The first check is made right after the job is submitted, and the wait then grows exponentially up to max_interval.
+    A queued job (1001) backs off faster, since it has not even started. When the job starts running (1002), the wait
+    is reset to the initial interval, because most jobs finish shortly after they leave the queue.
+    """
+    QUEUED_BACKOFF_FACTOR = 2
+    RUNNING_BACKOFF_FACTOR = 1.5
+
+    def __init__(self, initial_interval=None, max_interval=None):
+        self.initial_interval = QUERY_DATA_INITIAL_POLLING_INTERVAL if initial_interval is None else initial_interval
+        self.max_interval = QUERY_DATA_POLLING_INTERVAL if max_interval is None else max_interval
+        self.interval = None
+        self.job_code = None
+
+    def next_interval(self, job_code):
+        if self.interval is None or (job_code == '1002' and self.job_code != '1002'):
+            self.interval = self.initial_interval
+        elif job_code == '1001':
+            self.interval = self.interval * self.QUEUED_BACKOFF_FACTOR
+        else:
+            self.interval = self.interval * self.RUNNING_BACKOFF_FACTOR
+        self.interval = min(self.interval, self.max_interval)
+        self.job_code = job_code
+        return self.interval
+
+
+class ExportJobTimeout(Exception):
+    """
+    Raised by poll_job_completion in place of returning the timeout message, for the callers that hand the job over to
+    a background job when it times out.
+    """
+
+    def __init__(self, job_id, message):
+        super().__init__(message)
+        self.job_id = job_id
+
+
+class ExportJobWatch:
+    """
+    Follows the status checks of an export job, and decides from the jobCode of each check whether the job is done and
+    when it should be checked next. polling_interval is the longest wait between two status checks, see PollingBackoff.
+    """
+
+    def __init__(self, status_messages, polling_interval=None, queue_timeout=None, execution_timeout=None):
+        self.status_messages = status_messages
+        self.queue_timeout = QUERY_DATA_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        self.execution_timeout = QUERY_DATA_QUERY_EXECUTION_TIMEOUT if execution_timeout is None else execution_timeout
+        self.backoff = PollingBackoff(max_interval=polling_interval)
+        self.start_time = time.time()
+        self.processing_start_time = None
+        self.next_check_time = self.start_time
+        self.is_timed_out = False
+
+    def check(self, job_code):
+        """
+        Returns whether the job is done, along with the matching status message if it failed or timed out.
+        """
+        current_time = time.time()
+        if job_code == '1004': # code for JOB COMPLETED
+            return True, None
+        elif job_code == '1003': # code for ERROR OCCURRED
+            return True, self.status_messages.get('error', "Some internal error occurred. Please try again later.")
+        elif job_code == '1001': # code for JOB NOT INITIATED
+            if current_time - self.start_time > self.queue_timeout:
+                self.is_timed_out = True
+                return True, self.status_messages.get('queue_timeout', "Job accepted, but queue processing is slow. Please try again later.")
+        elif job_code == '1002': # code for JOB IN PROGRESS
+            if self.processing_start_time is None:
+                self.processing_start_time = current_time
+            elif current_time - self.processing_start_time > self.execution_timeout:
+                self.is_timed_out = True
+                return True, self.status_messages.get('execution_timeout', "Job is taking too long to execute. Please try again later.")
+        self.next_check_time = current_time + self.backoff.next_interval(job_code)
+        return False, None
+
+
+async def poll_job_completion(bulk, job_id, status_messages, polling_interval=None, queue_timeout=None, execution_timeout=None, hand_over_on_timeout=False):
+    """
+    Waits for the export job to complete, and returns None once it is completed or the matching status message if it
+    failed or timed out. If hand_over_on_timeout is set, ExportJobTimeout is raised when the job times out.
+    Every change of the job state is logged, and the time spent waiting is reported as progress.
+    """
+    watch = ExportJobWatch(status_messages, polling_interval, queue_timeout, execution_timeout)
+    reporter = get_progress_reporter()
+    job_code = None
     while True:
-        job_details = bulk.get_export_job_details(job_id)
+        job_details = await bulk.get_export_job_details(job_id)
+        if job_details['jobCode'] != job_code:
+            job_code = job_details['jobCode']
+            await reporter.log(f"Export job {job_id} is {EXPORT_JOB_STATES.get(job_code, job_code)}")
+        await reporter.report(round(time.time() - watch.start_time, 1))
+        is_done, error_message = watch.check(job_code)
+        if is_done:
+            if watch.is_timed_out and hand_over_on_timeout:
+                raise ExportJobTimeout(job_id, error_message)
+            return error_message
+        await asyncio.sleep(max(0, watch.next_check_time - time.time()))
+
+
+async def poll_jobs_completion(bulk, job_ids, status_messages):
+    """
+    Waits for all the export jobs in a single loop, in which every job is checked when its own backoff is due.
+    Returns the outcome of every job by id: None once it is completed, the matching status message if it failed or
+    timed out, or the exception raised while checking it. The number of finished jobs is reported as progress.
+    """
+    watches = {job_id: ExportJobWatch(status_messages) for job_id in job_ids}
+    reporter = get_progress_reporter()
+    outcomes = {}
+    while watches:
         current_time = time.time()
-        if job_details['jobCode'] == '1004': # code for JOB COMPLETED
-            break
-        elif job_details['jobCode'] == '1003': # code for ERROR OCCURRED
-            return status_messages.get('error', "Some internal error occurred. Please try again later.")
-        elif job_details['jobCode'] == '1001': # code for JOB NOT INITIATED
-            if current_time - start_time > queue_timeout:
-                return status_messages.get('queue_timeout', "Job accepted, but queue processing is slow. Please try again later.")
-        elif job_details['jobCode'] == '1002': # code for JOB IN PROGRESS
-            if processing_start_time is None:
-                processing_start_time = current_time
-            elif current_time - processing_start_time > execution_timeout:
-                return status_messages.get('execution_timeout', "Job is taking too long to execute. Please try again later.")
-        time.sleep(polling_interval)
-    return None
-
-
-def query_data_implementation(org_id, workspace_id, sql_query):
+        due_job_ids = [job_id for job_id, watch in watches.items() if watch.next_check_time <= current_time]
+        all_job_details = await asyncio.gather(*(bulk.get_export_job_details(job_id) for job_id in due_job_ids),
+                                               return_exceptions=True)
+        for job_id, job_details in zip(due_job_ids, all_job_details):
+            if isinstance(job_details, Exception):
+                is_done, outcome = True, job_details
+            else:
+                is_done, outcome = watches[job_id].check(job_details['jobCode'])
+            if is_done:
+                outcomes[job_id] = outcome
+                del watches[job_id]
+        await reporter.report(len(outcomes), len(job_ids))
+        if watches:
+            await asyncio.sleep(max(0, min(watch.next_check_time for watch in watches.values()) - time.time()))
+    return outcomes
+
+
+def hand_over_job(kind, description, func, *args, **kwargs):
+    """
+    Continues func in a background job, and returns the message that points to its handle, or None if too many
+    background jobs are running.
+    """
+    job = job_registry.start(kind, description, func, *args, **kwargs)
+    if job is None:
+        return None
+    return (f"The {kind} continues in the background as the job {job.handle}. Use the get_job_status tool to check on "
+            f"it, and the get_job_result tool to get its result once it is completed.")
+
+
+async def wait_for_export_job(kind, description, bulk, job_id, status_messages, run_in_background, download, *args):
+    """
+    Waits for the export job, and returns the result of download(bulk, job_id, *args).
+    The job is handed over to a background job instead, right away if run_in_background is set or once it times out,
+    so that the work already done by the server is not lost. This falls back to waiting, or to the timeout message,
+    when too many background jobs are running.
+    """
+    if run_in_background:
+        message = hand_over_job(kind, description, finish_export_job, bulk, job_id, status_messages, download, *args)
+        if message:
+            return message
     try:
-        file_path = "/tmp/query_data_result.csv"
-        analytics_client = get_analytics_client_instance()
-        bulk = analytics_client.get_bulk_instance(org_id, workspace_id)
-        job_id = bulk.initiate_bulk_export_using_sql(sql_query, "CSV")
-        status_messages = {
-            'error': "Some internal error ocurred (Not likely due to the query). Please try again later.",
-            'queue_timeout': "Query Job accepted, but queue processing is slow. Please try again later.",
-            'execution_timeout': "Query is taking too long to execute, maybe due to the complexity. Please try a simpler query"
-        }
-        error_message = poll_job_completion(bulk, job_id, status_messages)
-        if error_message:
-            return error_message
-        file_path = "/tmp/" + job_id + ".csv"
-        bulk = analytics_client.get_bulk_instance(org_id, workspace_id)
-        bulk.export_bulk_data(job_id, file_path)
-        result = []
-        with open(file_path, 'r', newline='') as file:
-            reader = csv.reader(file)
-            for i, row in enumerate(reader):
-                if i >= QUERY_DATA_ROW_LIMIT:
-                    break
-                result.append(row)        
-        return result[:QUERY_DATA_ROW_LIMIT]
-    except Exception as e:
-        raise e
-    finally:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-    
-
-def import_data_implementation(org_id, workspace_id, file_path, table_id, file_type, data):
-    analytics_client = get_analytics_client_instance()
+        error_message = await poll_job_completion(bulk, job_id, status_messages, hand_over_on_timeout=True)
+    except ExportJobTimeout as timeout:
+        message = hand_over_job(kind, description, finish_export_job, bulk, job_id, status_messages, download, *args)
+        return message or str(timeout)
+    if error_message:
+        return error_message
+    return await download(bulk, job_id, *args)
+
+
+async def finish_export_job(bulk, job_id, status_messages, download, *args):
+    """
+    Background part of wait_for_export_job, which waits for the job for up to JOB_BACKGROUND_TIMEOUT.
+    """
+    error_message = await poll_job_completion(bulk, job_id, status_messages, queue_timeout=JOB_BACKGROUND_TIMEOUT,
+                                              execution_timeout=JOB_BACKGROUND_TIMEOUT)
+    if error_message:
+        return error_message
+    return await download(bulk, job_id, *args)
+
+
+async def read_csv_rows(chunks, row_limit):
+    """
+    Parses CSV rows from an async iterable of utf-8 encoded chunks, and stops reading once row_limit rows are parsed.
+    A line is only parsed once all its quotes are closed, since a quoted value can contain line breaks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    rows = []
+    pending_text = ""
+    record = ""
+    async for chunk in chunks:
+        lines = (pending_text + decoder.decode(chunk)).split("\n")
+        pending_text = lines.pop()
+        for line in lines:
+            record += line + "\n"
+            if record.count('"') % 2 == 0:
+                rows.extend(csv.reader([record]))
+                record = ""
+                if len(rows) >= row_limit:
+                    return rows[:row_limit]
+    record += pending_text + decoder.decode(b"", final=True)
+    if record:
+        rows.extend(csv.reader([record]))
+    return rows[:row_limit]
+
+
+# Identical queries that run at the same time share one export job.
+query_flights = SingleFlight()
+
+
+async def query_data_implementation(org_id, workspace_id, sql_query, run_in_background=False):
+    cache_key = get_query_cache_key(org_id, workspace_id, sql_query)
+    cached_rows = query_result_cache.get(cache_key)
+    if cached_rows is not None:
+        return [list(row) for row in cached_rows]
+    # A query that arrives after a write to the workspace must not join a flight that started before it.
+    cache_version = query_result_cache.get_version([workspace_id])
+    return await query_flights.run((cache_key, cache_version, run_in_background), run_query, org_id, workspace_id,
+                                   sql_query, cache_key, cache_version, run_in_background)
+
+
+async def run_query(org_id, workspace_id, sql_query, cache_key, cache_version, run_in_background):
+    analytics_client = get_async_analytics_client_instance()
+    bulk = analytics_client.get_bulk_instance(org_id, workspace_id)
+    job_id = await bulk.initiate_bulk_export_using_sql(sql_query, "CSV")
+    return await wait_for_export_job("query", sql_query, bulk, job_id, QUERY_STATUS_MESSAGES, run_in_background,
+                                     download_query_rows, workspace_id, cache_key, cache_version)
+
+
+async def download_query_rows(bulk, job_id, workspace_id, cache_key, cache_version):
+    # The result is parsed while it is downloaded, and the connection is closed once the row limit is reached.
+    async with aclosing(bulk.iter_bulk_data(job_id)) as chunks:
+        rows = await read_csv_rows(chunks, QUERY_DATA_ROW_LIMIT)
+    query_result_cache.set(cache_key, rows, [workspace_id], cache_version)
+    return rows
+
+
+async def query_data_batch_implementation(org_id, workspace_id, sql_queries):
+    """
+    Runs the queries together: all the export jobs are submitted up front, polled in a single loop and downloaded
+    concurrently, so that the batch takes about as long as its slowest query. Returns a result or an error per query,
+    in the order of the queries.
+    The submits, and once the queries have run the downloads, are reserved from the bulk rate limit of the org, so that
+    they are sent as a burst while the rate limit has room for them. Any requests beyond that room are paced by the rate
+    limit. Nothing is reserved while the jobs are polled, which leaves the burst to the other calls in the meantime.
+    """
+    analytics_client = get_async_analytics_client_instance()
+    bulk = analytics_client.get_bulk_instance(org_id, workspace_id)
+    cache_version = query_result_cache.get_version([workspace_id])
+    results = {}
+    pending_queries = {}
+    for sql_query in sql_queries:
+        cache_key = get_query_cache_key(org_id, workspace_id, sql_query)
+        if cache_key in results or cache_key in pending_queries:
+            continue
+        cached_rows = query_result_cache.get(cache_key)
+        if cached_rows is not None:
+            results[cache_key] = {"result": [list(row) for row in cached_rows]}
+        else:
+            pending_queries[cache_key] = sql_query
+
+    with reserved_requests(analytics_client.request_scheduler, org_id, "bulk", len(pending_queries)):
+        job_ids = await asyncio.gather(*(bulk.initiate_bulk_export_using_sql(sql_query, "CSV")
+                                         for sql_query in pending_queries.values()), return_exceptions=True)
+    if job_ids and all(isinstance(job_id, Exception) for job_id in job_ids):
+        # Every submission failing usually means that the workspace is not in the organization, which is retried.
+        raise job_ids[0]
+    submitted_jobs = {}
+    for cache_key, job_id in zip(pending_queries, job_ids):
+        if isinstance(job_id, Exception):
+            results[cache_key] = {"error": f"An error occurred while executing the query: {job_id}"}
+        else:
+            submitted_jobs[cache_key] = job_id
+
+    outcomes = await poll_jobs_completion(bulk, list(submitted_jobs.values()), QUERY_STATUS_MESSAGES)
+    completed_jobs = {}
+    for cache_key, job_id in submitted_jobs.items():
+        outcome = outcomes[job_id]
+        if isinstance(outcome, Exception):
+            results[cache_key] = {"error": f"An error occurred while executing the query: {outcome}"}
+        elif outcome:
+            results[cache_key] = {"error": outcome}
+        else:
+            completed_jobs[cache_key] = job_id
+
+    async def download_rows(job_id):
+        async with aclosing(bulk.iter_bulk_data(job_id)) as chunks:
+            return await read_csv_rows(chunks, QUERY_DATA_ROW_LIMIT)
+
+    with reserved_requests(analytics_client.request_scheduler, org_id, "bulk", len(completed_jobs)):
+        all_rows = await asyncio.gather(*(download_rows(job_id) for job_id in completed_jobs.values()),
+                                        return_exceptions=True)
+    for cache_key, rows in zip(completed_jobs, all_rows):
+        if isinstance(rows, Exception):
+            results[cache_key] = {"error": f"An error occurred while downloading the query result: {rows}"}
+        else:
+            query_result_cache.set(cache_key, rows, [workspace_id], cache_version)
+            results[cache_key] = {"result": [list(row) for row in rows]}
+
+    batch_results = []
+    for sql_query in sql_queries:
+        result = results[get_query_cache_key(org_id, workspace_id, sql_query)]
+        batch_results.append({"sql_query": sql_query, **result})
+    return batch_results
+
+
+async def query_data_paged_implementation(org_id, workspace_id, sql_query, run_in_background=False):
+    analytics_client = get_async_analytics_client_instance()
+    bulk = analytics_client.get_bulk_instance(org_id, workspace_id)
+    job_id = await bulk.initiate_bulk_export_using_sql(sql_query, "CSV")
+    return await wait_for_export_job("query", sql_query, bulk, job_id, QUERY_STATUS_MESSAGES, run_in_background,
+                                     spill_query_result)
+
+
+async def spill_query_result(bulk, job_id):
+    # The result is spilled to a local file, so that the later pages are served without running the query again.
+    get_progress_reporter().start_phase()
+    async with aclosing(bulk.iter_bulk_data(job_id)) as chunks:
+        handle, result = await query_result_store.create(chunks, QUERY_DATA_HANDLE_MAX_ROWS)
+    return get_query_page(handle, result, 0, QUERY_DATA_ROW_LIMIT)
+
+
+def get_query_page(handle, result, offset, limit):
+    rows = result.read_rows(offset, limit)
+    return {
+        "handle": handle,
+        "columns": result.get_columns(),
+        "offset": offset,
+        "rows": rows,
+        "total_rows": result.row_count,
+        "has_more": offset + len(rows) < result.row_count,
+        "is_truncated": result.is_truncated
+    }
+
+
+async def fetch_query_page_implementation(handle, offset, limit):
+    if offset < 0:
+        return "Offset cannot be negative."
+    if limit is None:
+        limit = QUERY_DATA_ROW_LIMIT
+    if limit <= 0:
+        return "Limit must be a positive number."
+    result = query_result_store.get(handle)
+    if result is None:
+        return f"Result handle {handle} is unknown or has expired. Please run the query again using the query_data tool with paged set to true."
+    return get_query_page(handle, result, offset, min(limit, QUERY_DATA_MAX_PAGE_SIZE))
+
+
+@invalidates_query_results
+async def import_data_implementation(org_id, workspace_id, file_path, table_id, file_type, data):
+    analytics_client = get_async_analytics_client_instance()
     bulk = analytics_client.get_bulk_instance(org_id, workspace_id)
     if file_path:
         if file_path.startswith("https"):
@@ -79,37 +384,87 @@ def import_data_implementation(org_id, workspace_id, file_path, table_id, file_t
             return f"File {file_path} does not exist. Please provide a valid local file path."
         if file_type not in ["csv", "json"]:
             return "Invalid file type. Please provide 'csv' or 'json'."
-        result = bulk.import_data(table_id, "append", file_type, "true", file_path, config={"delimiter":'0'})
+        result = await bulk.import_data(table_id, "append", file_type, "true", file_path, config={"delimiter":'0'})
         return result
     if not data:
         return "No data provided to import. Please provide either 'data' or 'local_file_path'."
-    result = bulk.import_raw_data(table_id, "append", "json", "true", data, config={"delimiter":'0'})
+    result = await bulk.import_raw_data(table_id, "append", "json", "true", data, config={"delimiter":'0'})
     return result
 
 
-def export_view_implementation(org_id, response_file_format, response_file_path, workspace_id, view_id):
+async def export_view_implementation(org_id, response_file_format, response_file_path, workspace_id, view_id, run_in_background=False):
     if response_file_format not in ["csv", "json", "xml", "xls", "pdf", "html", "image"]:
         return "Invalid response file format. Supported formats are ['csv', 'json', 'xml', 'xls', 'pdf', 'html', 'image']."
 
-    analytics_client = get_analytics_client_instance()
+    # The export falls back to the organization of the workspace. With run_in_background, the fallback runs in the
+    # background job too, since the workspace is only known to be in an organization once the server accepted the export.
+    export_args = {"response_file_format": response_file_format, "response_file_path": response_file_path,
+                   "workspace_id": workspace_id, "view_id": view_id}
+    if run_in_background:
+        description = f"Export of view {view_id} to {response_file_path}"
+        message = hand_over_job("export", description, retry_with_fallback, [org_id], workspace_id, "WORKSPACE",
+                                export_view_data, is_background=True, **export_args)
+        if message:
+            return message
+    return await retry_with_fallback([org_id], workspace_id, "WORKSPACE", export_view_data, is_background=False,
+                                     **export_args)
+
+
+async def export_view_data(org_id, response_file_format, response_file_path, workspace_id, view_id, is_background):
+    analytics_client = get_async_analytics_client_instance()
     bulk = analytics_client.get_bulk_instance(org_id, workspace_id)
     try:
-        bulk.export_data(view_id, response_file_format, response_file_path)
+        await bulk.export_data(view_id, response_file_format, response_file_path,
+                               progress_callback=get_progress_reporter().report)
     except Exception as e:
         if hasattr(e, 'errorCode') and e.errorCode == 8133:
             if response_file_format != "pdf":
                 return f"Exporting view {view_id} in {response_file_format} format is not supported. Please use 'pdf' format for dashboards."
-            job_id = bulk.initiate_bulk_export(view_id, response_format="pdf", config={"dashboardLayout":1})
-            status_messages = {
-                'error': "Some internal error ocurred. Please try again later.",
-                'queue_timeout': "Dashboard export Job accepted, but queue processing is slow. Please try again later.",
-                'execution_timeout': "Dashboard is taking too long to export, maybe due to the complexity. Please try a again later."
-            }
-            error_message = poll_job_completion(bulk, job_id, status_messages)
-            if error_message:
-                return error_message
-            bulk.export_bulk_data(job_id, response_file_path)
+            job_id = await bulk.initiate_bulk_export(view_id, response_format="pdf", config={"dashboardLayout":1})
+            if is_background:
+                return await finish_export_job(bulk, job_id, DASHBOARD_EXPORT_STATUS_MESSAGES, download_export_file,
+                                               response_file_format, response_file_path)
+            description = f"Export of view {view_id} to {response_file_path}"
+            return await wait_for_export_job("export", description, bulk, job_id, DASHBOARD_EXPORT_STATUS_MESSAGES, False,
+                                             download_export_file, response_file_format, response_file_path)
         else:
             raise e
     return f"Object exported successfully to {response_file_path} in {response_file_format} format."
 
+
+async def download_export_file(bulk, job_id, response_file_format, response_file_path):
+    get_progress_reporter().start_phase()
+    await bulk.export_bulk_data(job_id, response_file_path, get_progress_reporter().report)
+    return f"Object exported successfully to {response_file_path} in {response_file_format} format."
+
+
+def get_job_status_implementation(handle):
+    job = job_registry.get(handle)
+    if job is None:
+        return f"Job {handle} is unknown or has expired."
+    return job.get_details()
+
+
+def cancel_job_implementation(handle):
+    job = job_registry.get(handle)
+    if job is None:
+        return f"Job {handle} is unknown or has expired."
+    if job.task.done():
+        return f"Job {handle} is already {job.status}."
+    job.task.cancel()
+    return f"Job {handle} was cancelled."
+
+
+def get_job_result_implementation(handle):
+    job = job_registry.get(handle)
+    if job is None:
+        return f"Job {handle} is unknown or has expired."
+    status = job.status
+    if status == "running":
+        return f"Job {handle} is still running. Please check again later."
+    if status == "cancelled":
+        return f"Job {handle} was cancelled."
+    if status == "failed":
+        return f"Job {handle} failed: {job.task.exception()}"
+    return job.task.result()
+
@@ -0,0 +1,94 @@
+import os
+import time
+import uuid
+import asyncio
+from AnalyticsClient import background_priority
+
+JOB_HANDLE_TTL = float(os.getenv("JOB_HANDLE_TTL", "1800"))
+JOB_MAX_RUNNING = int(os.getenv("JOB_MAX_RUNNING", "8"))
+JOB_BACKGROUND_TIMEOUT = float(os.getenv("JOB_BACKGROUND_TIMEOUT", "3600"))
+
+
+class BackgroundJob:
+    """
+    Work handed over to a background task, whose status and result are collected later through its handle.
+    """
+
+    def __init__(self, handle, kind, description):
+        self.handle = handle
+        self.kind = kind
+        self.description = description
+        self.task = None
+        self.start_time = time.time()
+        self.end_time = None
+
+    @property
+    def status(self):
+        if not self.task.done():
+            return "running"
+        if self.task.cancelled():
+            return "cancelled"
+        if self.task.exception() is not None:
+            return "failed"
+        return "completed"
+
+    def get_details(self):
+        details = {
+            "handle": self.handle,
+            "kind": self.kind,
+            "description": self.description,
+            "status": self.status,
+            "elapsed_seconds": round((self.end_time or time.time()) - self.start_time, 1)
+        }
+        if details["status"] == "failed":
+            details["error"] = str(self.task.exception())
+        return details
+
+
+class JobRegistry:
+    """
+    Background jobs by handle. The jobs run with background priority, so that their requests give way to the
+    interactive calls. At most max_running jobs run at a time, and a finished job is dropped ttl seconds after it
+    finished.
+    """
+
+    def __init__(self, max_running, ttl):
+        self.max_running = max_running
+        self.ttl = ttl
+        self.jobs = {}
+
+    def purge_finished(self):
+        current_time = time.time()
+        for handle in [handle for handle, job in self.jobs.items()
+                       if job.end_time is not None and current_time - job.end_time >= self.ttl]:
+            del self.jobs[handle]
+
+    def start(self, kind, description, func, *args, **kwargs):
+        """
+        Runs func in a background task, and returns its BackgroundJob, or None if max_running jobs are already running.
+        """
+        self.purge_finished()
+        if sum(job.end_time is None for job in self.jobs.values()) >= self.max_running:
+            return None
+        job = BackgroundJob(uuid.uuid4().hex, kind, description)
+        with background_priority():
+            job.task = asyncio.ensure_future(func(*args, **kwargs))
+        job.task.add_done_callback(lambda task: self.on_done(job))
+        self.jobs[job.handle] = job
+        return job
+
+    def on_done(self, job):
+        job.end_time = time.time()
+        if not job.task.cancelled():
+            # Marks the exception as retrieved, even if the result is never collected.
+            job.task.exception()
+
+    def get(self, handle):
+        """
+        Returns the BackgroundJob of the handle, or None if the handle is unknown or the job was dropped.
+        """
+        self.purge_finished()
+        return self.jobs.get(handle)
+
+
+job_registry = JobRegistry(JOB_MAX_RUNNING, JOB_HANDLE_TTL)
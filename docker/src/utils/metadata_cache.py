@@ -0,0 +1,205 @@
+import os
+import copy
+import json
+import atexit
+import asyncio
+import inspect
+from functools import wraps
+from AnalyticsClient import background_priority
+from config import Config, get_async_analytics_client_instance
+from utils.cache import TTLCache
+from utils.catalog_snapshot import CatalogSnapshot
+from utils.org_map import org_map
+
+METADATA_CACHE_SIZE = int(os.getenv("METADATA_CACHE_SIZE", "256"))
+METADATA_CACHE_TTL = float(os.getenv("METADATA_CACHE_TTL", "300"))
+METADATA_SNAPSHOT_ENABLED = os.getenv("METADATA_SNAPSHOT", "true").lower() == "true"
+METADATA_SNAPSHOT_MAX_AGE = float(os.getenv("METADATA_SNAPSHOT_MAX_AGE", "86400"))
+# Delay in seconds before a change of the cache is written to the snapshot, so that bursts of changes are written once.
+METADATA_SNAPSHOT_SAVE_DELAY = 5
+
+# Workspace lists, tagged with WORKSPACE_LIST_TAG, and views and view details, tagged with their workspace.
+metadata_cache = TTLCache("metadata", METADATA_CACHE_SIZE, METADATA_CACHE_TTL)
+WORKSPACE_LIST_TAG = "workspace_list"
+
+
+async def fetch_metadata(key):
+    """
+    Fetches the metadata of the cache key from the server. A key holds everything needed to fetch it, so that the
+    entries loaded from the snapshot can be revalidated.
+    """
+    analytics_client = get_async_analytics_client_instance()
+    kind = key[0]
+    if kind == "workspaces":
+        return await analytics_client.get_workspaces()
+    if kind == "owned_workspaces":
+        return await analytics_client.get_owned_workspaces()
+    if kind == "views":
+        org_id, workspace_id, config = key[1:]
+        workspace = analytics_client.get_workspace_instance(org_id, workspace_id)
+        return await workspace.get_views(json.loads(config))
+    if kind == "view_details":
+        view_id, config = key[1:]
+        return await analytics_client.get_view_details(view_id, config=json.loads(config))
+    raise ValueError(f"Unknown metadata cache key: {key}")
+
+
+def get_metadata_tags(key, value):
+    kind = key[0]
+    if kind in ("workspaces", "owned_workspaces"):
+        return [WORKSPACE_LIST_TAG]
+    if kind == "views":
+        return [key[2]]
+    return [value["workspaceId"]] if isinstance(value, dict) and value.get("workspaceId") else []
+
+
+def record_metadata_orgs(key, value):
+    """
+    Records the organizations of the workspaces and views in the fetched metadata, so that later calls for them need
+    no org fallback.
+    """
+    kind = key[0]
+    if kind in ("workspaces", "owned_workspaces"):
+        org_map.record_workspaces(value)
+    elif kind == "views":
+        org_map.set("WORKSPACE", key[2], key[1])
+    elif kind == "view_details" and isinstance(value, dict):
+        org_map.set_many([("VIEW", value.get("viewId"), value.get("orgId")),
+                          ("WORKSPACE", value.get("workspaceId"), value.get("orgId"))])
+
+
+async def refresh_metadata(key):
+    """
+    Fetches and caches the metadata of the key, and returns it.
+    """
+    # The tags of a value are only known once it is fetched, so the versions of all the tags are taken up front.
+    tag_versions = dict(metadata_cache.tag_versions)
+    value = await fetch_metadata(key)
+    record_metadata_orgs(key, value)
+    tags = get_metadata_tags(key, value)
+    metadata_cache.set(key, value, tags, tuple(tag_versions.get(tag, 0) for tag in tags))
+    catalog.schedule_save()
+    return value
+
+
+async def get_cached(key):
+    """
+    Returns the cached metadata of the key, or fetches and caches it.
+    Every caller gets its own copy, since the tools modify the metadata before returning it.
+    """
+    catalog.load()
+    value = metadata_cache.get(key)
+    if value is None:
+        value = await refresh_metadata(key)
+    return copy.deepcopy(value)
+
+
+class PersistedCatalog:
+    """
+    Keeps the metadata cache in sync with its on-disk snapshot, if there is one. The snapshot is loaded on the first
+    lookup, and its entries are served right away while they are revalidated against the server in the background.
+    The cache is written back a few seconds after it changes, and when the process exits.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.is_loaded = snapshot is None
+        self.save_task = None
+        self.revalidation_task = None
+        if snapshot is not None:
+            atexit.register(self.save)
+
+    def load(self):
+        if self.is_loaded:
+            return
+        self.is_loaded = True
+        entries = self.snapshot.read(METADATA_SNAPSHOT_MAX_AGE)
+        for key, value, tags in entries:
+            metadata_cache.set(key, value, tags)
+        if entries:
+            with background_priority():
+                self.revalidation_task = asyncio.ensure_future(self.revalidate([key for key, value, tags in entries]))
+
+    async def revalidate(self, keys):
+        for key in keys:
+            # The entries that were invalidated in the meantime are fetched again when they are needed.
+            if key not in metadata_cache.entries:
+                continue
+            try:
+                await refresh_metadata(key)
+            except Exception:
+                # For example a view that was deleted by another client, which must not be served from the snapshot.
+                if key in metadata_cache.entries:
+                    metadata_cache.remove(key)
+                    self.schedule_save()
+
+    def schedule_save(self):
+        if self.snapshot is None or (self.save_task is not None and not self.save_task.done()):
+            return
+        self.save_task = asyncio.ensure_future(self.save_later())
+
+    async def save_later(self):
+        await asyncio.sleep(METADATA_SNAPSHOT_SAVE_DELAY)
+        self.save()
+
+    def save(self):
+        # A process that never loaded the snapshot must not replace it with its empty cache.
+        if self.snapshot is None or not self.is_loaded:
+            return
+        try:
+            self.snapshot.write(metadata_cache.get_entries())
+        except OSError:
+            pass
+
+
+catalog = PersistedCatalog(
+    CatalogSnapshot(Config.CACHE_DIR, Config.CLIENT_ID, Config.REFRESH_TOKEN, Config.ANALYTICS_SERVER_URL)
+    if METADATA_SNAPSHOT_ENABLED and Config.CACHE_DIR and METADATA_CACHE_TTL > 0 else None
+)
+
+
+async def get_workspaces():
+    return await get_cached(("workspaces",))
+
+
+async def get_owned_workspaces():
+    return await get_cached(("owned_workspaces",))
+
+
+async def get_workspace_views(org_id, workspace_id, config):
+    return await get_cached(("views", org_id, workspace_id, json.dumps(config, sort_keys=True)))
+
+
+async def get_view_details(view_id, config):
+    return await get_cached(("view_details", view_id, json.dumps(config, sort_keys=True)))
+
+
+def get_cached_view_columns(view_ids):
+    """
+    Returns the column names of the views whose details are cached, by view id, without fetching anything.
+    """
+    view_columns = {}
+    for key, value, tags in metadata_cache.get_entries():
+        if key[0] == "view_details" and key[1] in view_ids and isinstance(value, dict):
+            view_columns[key[1]] = [column["columnName"] for column in value.get("columns") or []
+                                    if isinstance(column, dict) and column.get("columnName")]
+    return view_columns
+
+
+def invalidates_metadata(func):
+    """
+    Decorator for the implementations that create or delete objects. Drops the cached views and view details of the
+    workspace once the change is done, even if it failed, or the cached workspace lists for the implementations that
+    are not given a workspace_id, i.e. the ones that create workspaces.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            workspace_id = signature.bind(*args, **kwargs).arguments.get("workspace_id")
+            metadata_cache.invalidate(workspace_id if workspace_id else WORKSPACE_LIST_TAG)
+            catalog.schedule_save()
+    return wrapper
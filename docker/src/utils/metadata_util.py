@@ -1,4 +1,5 @@
-from config import get_analytics_client_instance
+from utils.metadata_cache import get_workspace_views, get_cached_view_columns
+from utils.view_index import search_view_list
 import os
 from fastmcp import Context
 import math
@@ -25,10 +26,8 @@ def filter_and_limit_workspaces(workspaces, contains_str, owned_flag, limit=20):
     return filtered
 
 
-VIEW_RESULT_LIMIT = os.getenv("ANALYTICS_VIEW_LIST_RESULT_SIZE") or 15
-def get_views(org_id, workspace_id, allowedViewTypesIds, contains_str, from_relevant_views_tool=False):
-    analytics_client = get_analytics_client_instance()
-    workspace = analytics_client.get_workspace_instance(org_id, workspace_id)
+VIEW_RESULT_LIMIT = int(os.getenv("ANALYTICS_VIEW_LIST_RESULT_SIZE") or 15)
+async def get_views(org_id, workspace_id, allowedViewTypesIds, contains_str, from_relevant_views_tool=False):
     config={
         "viewTypes": allowedViewTypesIds or [0, 6],
         "noOfResult": VIEW_RESULT_LIMIT + 1,
@@ -36,16 +35,21 @@ def get_views(org_id, workspace_id, allowedViewTypesIds, contains_str, from_rele
         "sortedColumn": 0,
         'startIndex': 1
     }
-    if from_relevant_views_tool:
+    if from_relevant_views_tool or contains_str:
+        # Searches run on the local index of the whole view list, which is fetched once and then served from the cache.
         config = {
             "viewTypes": allowedViewTypesIds or [0, 6]
         }
-    if contains_str:
-        config["keyword"] = contains_str
-    view_list = workspace.get_views(config)
+    view_list = await get_workspace_views(org_id, workspace_id, config)
     if view_list is None or len(view_list) == 0:
         return "No views found"
-    
+
+    if contains_str and not from_relevant_views_tool:
+        view_columns = get_cached_view_columns({view["viewId"] for view in view_list})
+        view_list = search_view_list((org_id, workspace_id, tuple(config["viewTypes"])), view_list, view_columns,
+                                     contains_str, VIEW_RESULT_LIMIT)
+        return view_list if view_list else "No views found"
+
     if not from_relevant_views_tool and len(view_list) > VIEW_RESULT_LIMIT:
         return """
         Too many views found. 
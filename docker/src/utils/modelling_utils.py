@@ -1,30 +1,36 @@
-from config import get_analytics_client_instance
+from config import get_async_analytics_client_instance
+from utils.query_cache import invalidates_query_results
+from utils.metadata_cache import invalidates_metadata
 
-def create_workspace_implementation(org_id, workspace_name):
-    analytics_client = get_analytics_client_instance()
+@invalidates_metadata
+async def create_workspace_implementation(org_id, workspace_name):
+    analytics_client = get_async_analytics_client_instance()
     org = analytics_client.get_org_instance(org_id)
-    result = org.create_workspace(workspace_name)
+    result = await org.create_workspace(workspace_name)
     return f"Workspace '{workspace_name}' created successfully. Workspace Id : {result}"
 
 
-def create_table_implementation(org_id, workspace_id, table_name, columns_list):
-    analytics_client = get_analytics_client_instance()
+@invalidates_metadata
+async def create_table_implementation(org_id, workspace_id, table_name, columns_list):
+    analytics_client = get_async_analytics_client_instance()
     table_design = {}
     table_design["TABLENAME"] = table_name
     table_design["COLUMNS"] = columns_list
     workspace = analytics_client.get_workspace_instance(org_id, workspace_id)
-    table_id = workspace.create_table(table_design)
+    table_id = await workspace.create_table(table_design)
     return "Table created successfully. Table Id : " + str(table_id)
 
 
-def create_aggregate_formula_implementation(org_id, workspace_id, table_id, expression, formula_name):
-    analytics_client = get_analytics_client_instance()
+@invalidates_metadata
+async def create_aggregate_formula_implementation(org_id, workspace_id, table_id, expression, formula_name):
+    analytics_client = get_async_analytics_client_instance()
     view = analytics_client.get_view_instance(org_id, workspace_id, table_id)
-    result = view.add_aggregate_formula(formula_name, expression)
+    result = await view.add_aggregate_formula(formula_name, expression)
     return "Aggregate formula created successfully. Formula Id : " + str(result)
 
 
-def create_chart_report_implementation(org_id, workspace_id, table_name, chart_name, chart_details, filters=None):
+@invalidates_metadata
+async def create_chart_report_implementation(org_id, workspace_id, table_name, chart_name, chart_details, filters=None):
     if "chartType" not in chart_details:
         return "Chart type is required. Please provide 'chartType' in chart_details."
 
@@ -74,13 +80,14 @@ def create_chart_report_implementation(org_id, workspace_id, table_name, chart_n
                 return "Each filter must contain 'columnName', 'operation', 'filterType', 'values', and 'exclude'."
         config["filters"] = filters
 
-    analytics_client = get_analytics_client_instance()
+    analytics_client = get_async_analytics_client_instance()
     workspace = analytics_client.get_workspace_instance(org_id, workspace_id)
-    report_id = workspace.create_report(config)
+    report_id = await workspace.create_report(config)
     return f"Chart report created successfully. Report ID: {report_id}"
 
 
-def create_pivot_report_implementation(org_id, workspace_id, table_name, report_name, pivot_details, filters=None):
+@invalidates_metadata
+async def create_pivot_report_implementation(org_id, workspace_id, table_name, report_name, pivot_details, filters=None):
     if not pivot_details:
         return "Pivot details must be provided."
 
@@ -127,13 +134,14 @@ def create_pivot_report_implementation(org_id, workspace_id, table_name, report_
                 return "Each filter must contain 'columnName', 'operation', 'filterType', 'values', and 'exclude'."
         config["filters"] = filters
 
-    analytics_client = get_analytics_client_instance()
+    analytics_client = get_async_analytics_client_instance()
     workspace = analytics_client.get_workspace_instance(org_id, workspace_id)
-    report_id = workspace.create_report(config)
+    report_id = await workspace.create_report(config)
     return f"Pivot report created successfully. Report ID: {report_id}"
 
 
-def create_summary_report_implementation(org_id, workspace_id, table_name, report_name, summary_details, filters=None):
+@invalidates_metadata
+async def create_summary_report_implementation(org_id, workspace_id, table_name, report_name, summary_details, filters=None):
     if "group_by" not in summary_details or "aggregate" not in summary_details:
         return "Both 'group_by' and 'aggregate' must be provided in summary_details."
 
@@ -186,21 +194,25 @@ def create_summary_report_implementation(org_id, workspace_id, table_name, repor
                 return "Each filter must contain 'columnName', 'operation', 'filterType', 'values', and 'exclude'."
         config["filters"] = filters
 
-    analytics_client = get_analytics_client_instance()
+    analytics_client = get_async_analytics_client_instance()
     workspace = analytics_client.get_workspace_instance(org_id, workspace_id)
-    report_id = workspace.create_report(config)
+    report_id = await workspace.create_report(config)
     return f"Summary report created successfully. Report ID: {report_id}"
 
 
-def create_query_table_implementation(org_id, workspace_id, table_name, query):
-    analytics_client = get_analytics_client_instance()
+@invalidates_metadata
+@invalidates_query_results
+async def create_query_table_implementation(org_id, workspace_id, table_name, query):
+    analytics_client = get_async_analytics_client_instance()
     workspace = analytics_client.get_workspace_instance(org_id, workspace_id)
-    result = workspace.create_query_table(query, table_name)
+    result = await workspace.create_query_table(query, table_name)
     return f"Query table created successfully. Table Id : {result}"
 
 
-def delete_view_implementation(org_id, workspace_id, view_id):
-    analytics_client = get_analytics_client_instance()
+@invalidates_metadata
+@invalidates_query_results
+async def delete_view_implementation(org_id, workspace_id, view_id):
+    analytics_client = get_async_analytics_client_instance()
     view_instance = analytics_client.get_view_instance(org_id, workspace_id, view_id)
-    view_instance.delete()
+    await view_instance.delete()
     return f"View with ID {view_id} deleted successfully."
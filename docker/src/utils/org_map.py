@@ -0,0 +1,86 @@
+import json
+from config import Config
+from utils.private_cache import private_cache_path, write_private_json
+
+
+class OrgMap:
+    """
+    Remembers the organization of the workspaces and views, so that the calls for an entity of another organization
+    go to the right organization at once instead of failing first.
+    The map is learnt from the org fallbacks, the successful calls and the workspace listings, and is persisted on disk
+    when there is a cache directory, in a file of its own for every account.
+    """
+
+    def __init__(self, cache_dir, client_id, refresh_token, analytics_server_url):
+        self.map_path = None
+        if cache_dir:
+            self.map_path = private_cache_path(cache_dir, "orgs", analytics_server_url, client_id, refresh_token)
+        self.org_ids = None
+
+    def load(self):
+        if self.org_ids is not None:
+            return
+        self.org_ids = {}
+        if self.map_path is None:
+            return
+        try:
+            with open(self.map_path, "r") as file:
+                org_ids = json.load(file)
+            self.org_ids = {str(entity): str(org_id) for entity, org_id in org_ids.items()}
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def save(self):
+        """
+        Persists the map. Failures are ignored, the map then only lives as long as the process.
+        """
+        if self.map_path is None:
+            return
+        try:
+            write_private_json(self.map_path, self.org_ids)
+        except OSError:
+            pass
+
+    def get(self, entity_type, entity_id):
+        """
+        Returns the known organization of the entity, or None if it is not known.
+        """
+        self.load()
+        return self.org_ids.get(f"{entity_type}:{entity_id}")
+
+    def set_many(self, entity_orgs):
+        """
+        Records the organization of each (entity_type, entity_id, org_id), and persists the map if anything changed.
+        """
+        self.load()
+        is_changed = False
+        for entity_type, entity_id, org_id in entity_orgs:
+            if not entity_id or not org_id:
+                continue
+            entity = f"{entity_type}:{entity_id}"
+            if self.org_ids.get(entity) != str(org_id):
+                self.org_ids[entity] = str(org_id)
+                is_changed = True
+        if is_changed:
+            self.save()
+
+    def set(self, entity_type, entity_id, org_id):
+        self.set_many([(entity_type, entity_id, org_id)])
+
+    def remove(self, entity_type, entity_id):
+        self.load()
+        if self.org_ids.pop(f"{entity_type}:{entity_id}", None) is not None:
+            self.save()
+
+    def record_workspaces(self, workspaces):
+        """
+        Records the organization of the workspaces of a workspace listing, either a list of workspaces or a dictionary
+        with the owned and shared workspaces.
+        """
+        if isinstance(workspaces, dict):
+            workspaces = workspaces.get("ownedWorkspaces", []) + workspaces.get("sharedWorkspaces", [])
+        self.set_many([("WORKSPACE", workspace.get("workspaceId"), workspace.get("orgId"))
+                       for workspace in workspaces if isinstance(workspace, dict)])
+
+
+org_map = OrgMap(Config.CACHE_DIR, Config.CLIENT_ID, Config.REFRESH_TOKEN, Config.ANALYTICS_SERVER_URL)
@@ -0,0 +1,25 @@
+import os
+import json
+import hashlib
+
+
+def private_cache_path(cache_dir, kind, server_url, client_id, refresh_token):
+    """
+    Returns the path of the kind of cache file for an account. The file name is a hash of the server and the OAuth
+    credentials, so that accounts never share a file and the refresh token itself is never written to disk.
+    """
+    cache_key = hashlib.sha256(f"{server_url}|{client_id}|{refresh_token}".encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{kind}_{cache_key[:32]}.json")
+
+
+def write_private_json(path, data):
+    """
+    Atomically replaces the file with the data as JSON, so that readers never see a partially written file.
+    The file and its directory are only accessible by the current user.
+    """
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    temp_fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(temp_fd, "w") as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
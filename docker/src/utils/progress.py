@@ -0,0 +1,81 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+MCP_PROGRESS_INTERVAL = float(os.getenv("MCP_PROGRESS_INTERVAL", "0.5"))
+
+
+class ProgressReporter:
+    """
+    Sends MCP progress notifications and log messages for the long running steps of a tool call.
+    Progress is only sent when it increases, as the protocol requires, and at most every min_interval seconds except
+    for the final update. Nothing is sent once the tool call has returned, so a background job that outlives the call
+    reports nothing. Failures to send are ignored, since progress must never fail the work itself.
+    A tool call whose steps are measured in different units, for example the seconds spent waiting for an export job
+    and then the bytes downloaded, starts a phase for each of them, see start_phase.
+    """
+
+    def __init__(self, ctx, min_interval=MCP_PROGRESS_INTERVAL):
+        self.ctx = ctx
+        self.min_interval = min_interval
+        self.last_progress = None
+        self.last_report_time = 0
+        self.phase_offset = 0
+        self.is_closed = ctx is None
+
+    def start_phase(self):
+        """
+        Starts a step measured in its own unit. Since progress must keep increasing over the whole call, the progress
+        of the step is sent on top of the progress already sent, and so is its total, so that the host sees the step
+        complete when it reaches its own total.
+        """
+        self.phase_offset = self.last_progress or 0
+
+    async def report(self, progress, total=None):
+        progress = self.phase_offset + progress
+        if total is not None:
+            total = self.phase_offset + total
+        if self.is_closed or (self.last_progress is not None and progress <= self.last_progress):
+            return
+        current_time = time.monotonic()
+        if progress != total and current_time - self.last_report_time < self.min_interval:
+            return
+        self.last_progress = progress
+        self.last_report_time = current_time
+        try:
+            await self.ctx.report_progress(progress, total)
+        except Exception:
+            pass
+
+    async def log(self, message):
+        if self.is_closed:
+            return
+        try:
+            await self.ctx.info(message)
+        except Exception:
+            pass
+
+
+progress_reporter = ContextVar("progress_reporter", default=ProgressReporter(None))
+
+
+def get_progress_reporter():
+    """
+    Returns the ProgressReporter of the current tool call, which drops everything outside of a tool call.
+    """
+    return progress_reporter.get()
+
+
+@contextmanager
+def reporting_progress(ctx):
+    """
+    Sends the progress reported within the block through the context of the tool call.
+    """
+    reporter = ProgressReporter(ctx)
+    token = progress_reporter.set(reporter)
+    try:
+        yield reporter
+    finally:
+        reporter.is_closed = True
+        progress_reporter.reset(token)
@@ -0,0 +1,31 @@
+import os
+import inspect
+from functools import wraps
+from utils.cache import TTLCache
+from utils.sql_utils import normalize_sql
+
+QUERY_DATA_CACHE_SIZE = int(os.getenv("QUERY_DATA_CACHE_SIZE", "128"))
+QUERY_DATA_CACHE_TTL = float(os.getenv("QUERY_DATA_CACHE_TTL", "300"))
+
+# Results of query_data, tagged with their workspace.
+query_result_cache = TTLCache("query_results", QUERY_DATA_CACHE_SIZE, QUERY_DATA_CACHE_TTL)
+
+
+def get_query_cache_key(org_id, workspace_id, sql_query):
+    return (org_id, workspace_id, normalize_sql(sql_query))
+
+
+def invalidates_query_results(func):
+    """
+    Decorator for the implementations that write to a workspace. Drops the cached query results of the workspace
+    once the write is done, even if it failed, since a failed write may still have been partially applied.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            query_result_cache.invalidate(signature.bind(*args, **kwargs).arguments["workspace_id"])
+    return wrapper
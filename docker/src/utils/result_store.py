@@ -0,0 +1,136 @@
+import os
+import io
+import csv
+import uuid
+import atexit
+import shutil
+import tempfile
+from array import array
+from config import Config
+from utils.cache import TTLCache
+from utils.progress import get_progress_reporter
+
+QUERY_DATA_HANDLE_TTL = max(1.0, float(os.getenv("QUERY_DATA_HANDLE_TTL", "1800")))
+QUERY_DATA_MAX_HANDLES = max(1, int(os.getenv("QUERY_DATA_MAX_HANDLES", "16")))
+QUERY_DATA_HANDLE_MAX_ROWS = int(os.getenv("QUERY_DATA_HANDLE_MAX_ROWS", "100000"))
+QUERY_DATA_MAX_PAGE_SIZE = int(os.getenv("QUERY_DATA_MAX_PAGE_SIZE", "100"))
+
+
+class SpilledResult:
+    """
+    Query result kept as the exported CSV file, with the byte offset of every record, so that any page of rows is
+    read with a single seek instead of re-running the query or scanning the file.
+    The first record is the header, and the last offset is the end of the file.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.offsets = array("q", [0])
+        self.is_truncated = False
+
+    @property
+    def row_count(self):
+        return max(0, len(self.offsets) - 2)
+
+    async def write(self, chunks, max_rows):
+        """
+        Writes the utf-8 encoded chunks to the file while indexing the records, and stops reading once max_rows rows
+        are written. A line break only ends a record once all its quotes are closed. The bytes written are reported as
+        progress.
+        """
+        reporter = get_progress_reporter()
+        position = 0
+        is_quoted = False
+        with open(self.file_path, "wb") as spill_file:
+            async for chunk in chunks:
+                start = 0
+                while len(self.offsets) < max_rows + 2:
+                    newline = chunk.find(b"\n", start)
+                    if newline == -1:
+                        break
+                    is_quoted ^= chunk.count(b'"', start, newline) % 2 == 1
+                    start = newline + 1
+                    if not is_quoted:
+                        self.offsets.append(position + start)
+                if len(self.offsets) == max_rows + 2:
+                    spill_file.write(chunk[:start])
+                    self.is_truncated = start < len(chunk) or await self.has_more_data(chunks)
+                    return
+                is_quoted ^= chunk.count(b'"', start) % 2 == 1
+                spill_file.write(chunk)
+                position += len(chunk)
+                await reporter.report(position)
+        if position > self.offsets[-1]:
+            # The last record is not followed by a line break.
+            self.offsets.append(position)
+
+    async def has_more_data(self, chunks):
+        async for chunk in chunks:
+            if chunk:
+                return True
+        return False
+
+    def read_records(self, start, end):
+        if start >= end:
+            return []
+        with open(self.file_path, "rb") as spill_file:
+            spill_file.seek(self.offsets[start])
+            data = spill_file.read(self.offsets[end] - self.offsets[start])
+        return list(csv.reader(io.StringIO(data.decode("utf-8"), newline="")))
+
+    def get_columns(self):
+        records = self.read_records(0, min(1, len(self.offsets) - 1))
+        return records[0] if records else []
+
+    def read_rows(self, offset, limit):
+        return self.read_records(1 + offset, min(1 + offset + limit, len(self.offsets) - 1))
+
+    def delete(self):
+        try:
+            os.remove(self.file_path)
+        except FileNotFoundError:
+            pass
+
+
+class ResultStore:
+    """
+    Spilled query results by handle. A handle expires ttl seconds after it is created, the least recently used handle
+    is evicted when more than max_handles are held, and the file of a removed handle is deleted.
+    """
+
+    def __init__(self, max_handles, ttl):
+        self.handles = TTLCache("query_result_handles", max_handles, ttl,
+                                on_remove=lambda handle, result: result.delete())
+        self.spill_dir = None
+
+    def get_spill_dir(self):
+        if self.spill_dir is None:
+            if Config.CACHE_DIR:
+                os.makedirs(Config.CACHE_DIR, exist_ok=True)
+            self.spill_dir = tempfile.mkdtemp(prefix="query_results_", dir=Config.CACHE_DIR)
+            atexit.register(shutil.rmtree, self.spill_dir, True)
+        return self.spill_dir
+
+    async def create(self, chunks, max_rows):
+        """
+        Spills the result read from the chunks, and returns its new handle and the SpilledResult.
+        """
+        self.handles.purge_expired()
+        handle = uuid.uuid4().hex
+        result = SpilledResult(os.path.join(self.get_spill_dir(), handle + ".csv"))
+        try:
+            await result.write(chunks, max_rows)
+        except BaseException:
+            result.delete()
+            raise
+        self.handles.set(handle, result)
+        return handle, result
+
+    def get(self, handle):
+        """
+        Returns the SpilledResult of the handle, or None if the handle is unknown or was evicted.
+        """
+        return self.handles.get(handle)
+
+
+query_result_store = ResultStore(QUERY_DATA_MAX_HANDLES, QUERY_DATA_HANDLE_TTL)
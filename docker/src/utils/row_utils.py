@@ -1,17 +1,21 @@
-from config import get_analytics_client_instance
+from config import get_async_analytics_client_instance
+from utils.query_cache import invalidates_query_results
 
-def add_row_implementation(org_id, workspace_id, table_id, columns):
-    analytics_client = get_analytics_client_instance()
+@invalidates_query_results
+async def add_row_implementation(org_id, workspace_id, table_id, columns):
+    analytics_client = get_async_analytics_client_instance()
     view = analytics_client.get_view_instance(org_id, workspace_id, table_id)
-    return view.add_row(columns)
+    return await view.add_row(columns)
 
-def update_rows_implementation(org_id, workspace_id, table_id, criteria, columns):
-    analytics_client = get_analytics_client_instance()
+@invalidates_query_results
+async def update_rows_implementation(org_id, workspace_id, table_id, criteria, columns):
+    analytics_client = get_async_analytics_client_instance()
     view = analytics_client.get_view_instance(org_id, workspace_id, table_id)
-    view.update_row(columns, criteria)
+    await view.update_row(columns, criteria)
     return "Rows updated successfully."
 
-def delete_rows_implementation(org_id, workspace_id, table_id, criteria):
-    analytics_client = get_analytics_client_instance()
+@invalidates_query_results
+async def delete_rows_implementation(org_id, workspace_id, table_id, criteria):
+    analytics_client = get_async_analytics_client_instance()
     view = analytics_client.get_view_instance(org_id, workspace_id, table_id)
-    return view.delete_row(criteria)
\ No newline at end of file
+    return await view.delete_row(criteria)
\ No newline at end of file
@@ -0,0 +1,42 @@
+import asyncio
+import copy
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single execution. The callers that arrive while the call is
+    in flight wait for it instead of starting their own, and every caller gets its own copy of the result.
+    The call is cancelled once all its callers are cancelled, so that abandoned work does not run to completion.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.waiter_counts = {}
+
+    async def run(self, key, func, *args, **kwargs):
+        task = self.calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self.calls[key] = task
+            task.add_done_callback(lambda done_task: self.on_done(key, done_task))
+        self.waiter_counts[task] = self.waiter_counts.get(task, 0) + 1
+        try:
+            # A caller that is cancelled must not cancel the call that the other callers are waiting for.
+            result = await asyncio.shield(task)
+        finally:
+            self.waiter_counts[task] -= 1
+            if self.waiter_counts[task] == 0:
+                del self.waiter_counts[task]
+                if not task.done():
+                    # The callers that arrive from now on start a new call instead of joining the cancelled one.
+                    if self.calls.get(key) is task:
+                        del self.calls[key]
+                    task.cancel()
+        return copy.deepcopy(result)
+
+    def on_done(self, key, task):
+        if self.calls.get(key) is task:
+            del self.calls[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved, even if all the callers were cancelled.
+            task.exception()
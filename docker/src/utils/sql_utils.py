@@ -0,0 +1,106 @@
+import re
+
+AGGREGATE_FUNCTIONS = {
+    "COUNT", "SUM", "AVG", "MIN", "MAX", "GROUP_CONCAT", "STDDEV", "STDDEV_POP", "STDDEV_SAMP", "STD",
+    "VARIANCE", "VAR_POP", "VAR_SAMP", "BIT_AND", "BIT_OR", "BIT_XOR", "MEDIAN", "JSON_ARRAYAGG", "JSON_OBJECTAGG"
+}
+# Clauses at the outermost level that make the result shape unsafe to limit from the outside.
+UNSAFE_KEYWORDS = {"GROUP", "HAVING", "UNION", "INTERSECT", "EXCEPT", "MINUS", "INTO", "FOR", "FETCH", "PROCEDURE"}
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s+)
+    |(?P<comment>--[^\n]*|\#[^\n]*|/\*.*?\*/)
+    |(?P<string>'(?:[^'\\]|\\.|'')*')
+    |(?P<identifier>"(?:[^"]|"")*"|`(?:[^`]|``)*`)
+    |(?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+    |(?P<number>\d+(?:\.\d*)?)
+    |(?P<symbol>.)
+""", re.VERBOSE | re.DOTALL)
+
+
+def scan_top_level_tokens(sql_query):
+    """
+    Returns the (token, start, end) tuples at the outermost level of the query. Strings, quoted identifiers and
+    comments are skipped, and a parenthesised part is returned as a single "(" token.
+    Returns None if the query has an unterminated string, identifier, comment or parenthesis.
+    """
+    tokens = []
+    depth = 0
+    for match in TOKEN_PATTERN.finditer(sql_query):
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "symbol" and (text in "'\"`" or sql_query.startswith("/*", match.start())):
+            return None
+        if kind in ("space", "comment"):
+            continue
+        if text == "(":
+            if depth == 0:
+                tokens.append(("(", match.start(), match.end()))
+            depth += 1
+        elif text == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth == 0:
+                tokens[-1] = ("(", tokens[-1][1], match.end())
+        elif depth == 0:
+            tokens.append((text, match.start(), match.end()))
+    if depth != 0:
+        return None
+    return tokens
+
+
+def push_down_row_limit(sql_query, row_limit):
+    """
+    Adds LIMIT row_limit to the outermost SELECT of the query, or tightens its LIMIT if it is larger than row_limit,
+    so that the server does not compute and export rows that are never returned.
+    The query is left unchanged unless that is known to be safe, i.e. for anything other than a single SELECT, for
+    aggregates, GROUP BY and set operations at the outermost level, and for limits that are not plain numbers.
+    Returns the query and whether the limit was pushed down.
+    """
+    tokens = scan_top_level_tokens(sql_query)
+    if tokens and tokens[-1][0] == ";":
+        tokens = tokens[:-1]
+    if not tokens or tokens[0][0].upper() != "SELECT":
+        return sql_query, False
+
+    words = [token[0].upper() for token in tokens]
+    if ";" in words or UNSAFE_KEYWORDS.intersection(words):
+        return sql_query, False
+    for index, word in enumerate(words[:-1]):
+        if word in AGGREGATE_FUNCTIONS and words[index + 1] == "(":
+            return sql_query, False
+
+    if "LIMIT" not in words:
+        limit_position = tokens[-1][2]
+        return sql_query[:limit_position] + f" LIMIT {row_limit}" + sql_query[limit_position:], True
+
+    limit_index = len(words) - 1 - words[::-1].index("LIMIT")
+    limit_args = words[limit_index + 1:]
+    if len(limit_args) == 1:
+        count_token = tokens[limit_index + 1]
+    elif len(limit_args) == 3 and limit_args[1] == "OFFSET":
+        count_token = tokens[limit_index + 1]
+    elif len(limit_args) == 3 and limit_args[1] == ",":
+        count_token = tokens[limit_index + 3]
+    else:
+        return sql_query, False
+    if not count_token[0].isdigit() or int(count_token[0]) <= row_limit:
+        return sql_query, False
+    return sql_query[:count_token[1]] + str(row_limit) + sql_query[count_token[2]:], True
+
+
+def normalize_sql(sql_query):
+    """
+    Returns the query without comments and a trailing semicolon, and with the whitespace collapsed, so that trivially
+    different spellings of a query compare equal. The case of the words is kept, since the column headers of the result
+    follow the spelling of the aliases and expressions of the query.
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(sql_query):
+        if match.lastgroup in ("space", "comment"):
+            continue
+        tokens.append(match.group())
+    while tokens and tokens[-1] == ";":
+        tokens.pop()
+    return " ".join(tokens)
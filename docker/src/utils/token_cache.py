@@ -0,0 +1,55 @@
+import os
+import json
+from utils.private_cache import private_cache_path, write_private_json
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows, the cache then works without cross-process locking.
+    fcntl = None
+
+
+class TokenCache:
+    """
+    Persists the access token and its expiry on disk, so that a new server process can reuse a still valid token
+    instead of regenerating it against the accounts server.
+    Access is serialised across processes with a file lock.
+    """
+
+    def __init__(self, cache_dir, client_id, refresh_token, accounts_server_url):
+        self.cache_dir = cache_dir
+        self.cache_path = private_cache_path(cache_dir, "token", accounts_server_url, client_id, refresh_token)
+        self.lock_path = self.cache_path + ".lock"
+
+    def acquire_lock(self, blocking=True):
+        """
+        Acquires the cross-process lock and returns the lock file descriptor.
+        When blocking is False, returns None instead of waiting if another process holds the lock.
+        """
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(lock_fd)
+                return None
+        return lock_fd
+
+    def release_lock(self, lock_fd):
+        if fcntl is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        os.close(lock_fd)
+
+    def read(self):
+        """
+        Returns the cached (access_token, expiry) pair, or (None, None) if nothing usable is cached.
+        """
+        try:
+            with open(self.cache_path, "r") as file:
+                cached = json.load(file)
+            return cached["access_token"], float(cached["expiry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, None
+
+    def write(self, access_token, expiry):
+        write_private_json(self.cache_path, {"access_token": access_token, "expiry": expiry})
@@ -0,0 +1,221 @@
+import os
+import re
+import math
+import heapq
+from bisect import bisect_left
+from utils.cache import TTLCache
+
+VIEW_INDEX_CACHE_SIZE = int(os.getenv("VIEW_INDEX_CACHE_SIZE", "32"))
+# The indexes are brought up to date on every search, so they only expire to free the memory of unused workspaces.
+VIEW_INDEX_TTL = 3600
+
+# Weights of the fields of a view in the term frequencies, the name matters most.
+VIEW_NAME_WEIGHT = 3.0
+VIEW_DESC_WEIGHT = 1.0
+VIEW_COLUMN_WEIGHT = 0.5
+# Weights of the index terms that only match a query token by prefix or with a typo, relative to an exact match.
+PREFIX_MATCH_WEIGHT = 0.7
+FUZZY_MATCH_WEIGHT = 0.5
+# Query tokens shorter than this are only matched exactly or by prefix.
+FUZZY_MIN_LENGTH = 4
+# Most index terms a query token is expanded to by prefix.
+PREFIX_MAX_TERMS = 50
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text):
+    """
+    Splits the text into lower case terms, also on the case changes of camel case names such as OrderItems.
+    """
+    if not text:
+        return []
+    return re.findall(r"[^\W_]+", re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", str(text)).lower())
+
+
+def get_view_signature(view, view_columns):
+    """
+    Returns the searched fields of the view, its name, description and known columns.
+    """
+    return view.get("viewName"), view.get("viewDesc"), tuple(view_columns.get(view.get("viewId"), ()))
+
+
+def get_weighted_texts(signature):
+    """
+    Returns the (text, weight) pairs of the fields of a view signature.
+    """
+    view_name, view_desc, columns = signature
+    return [(view_name, VIEW_NAME_WEIGHT), (view_desc, VIEW_DESC_WEIGHT)] + \
+           [(column, VIEW_COLUMN_WEIGHT) for column in columns]
+
+
+def get_deletes(term):
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def is_within_one_edit(first, second):
+    """
+    Returns whether the terms differ by at most one insertion, deletion, substitution or transposition.
+    """
+    if abs(len(first) - len(second)) > 1:
+        return False
+    prefix_length = 0
+    while prefix_length < min(len(first), len(second)) and first[prefix_length] == second[prefix_length]:
+        prefix_length += 1
+    first, second = first[prefix_length:], second[prefix_length:]
+    if len(first) == len(second):
+        return first[1:] == second[1:] or (first[:2] == second[1::-1] and first[2:] == second[2:])
+    return first[1:] == second or second[1:] == first
+
+
+class ViewIndex:
+    """
+    In-memory inverted index over the names, descriptions and known columns of the views of a workspace, ranked with
+    BM25. Query tokens also match the index terms they are a prefix of, and the terms one typo away.
+    The index is updated incrementally, only the views that were added, changed or removed since the last update are
+    reindexed.
+    """
+
+    def __init__(self):
+        self.views = {}
+        self.positions = {}
+        self.signatures = {}
+        self.documents = {}
+        self.postings = {}
+        self.total_length = 0
+        self.deletes = {}
+        self.sorted_terms = None
+
+    def update(self, views, view_columns=None):
+        """
+        Brings the index in line with the view list. view_columns holds the known column names by view id.
+        """
+        view_columns = view_columns or {}
+        view_ids = set()
+        for position, view in enumerate(views):
+            view_id = view.get("viewId")
+            if view_id is None:
+                continue
+            view_ids.add(view_id)
+            signature = get_view_signature(view, view_columns)
+            if self.signatures.get(view_id) != signature:
+                self.remove_document(view_id)
+                self.add_document(view_id, signature)
+            self.views[view_id] = view
+            self.positions[view_id] = position
+        for view_id in [view_id for view_id in self.views if view_id not in view_ids]:
+            self.remove_document(view_id)
+            del self.views[view_id]
+            del self.positions[view_id]
+
+    def add_document(self, view_id, signature):
+        term_frequencies = {}
+        for text, weight in get_weighted_texts(signature):
+            for term in tokenize(text):
+                term_frequencies[term] = term_frequencies.get(term, 0) + weight
+        length = sum(term_frequencies.values())
+        self.documents[view_id] = (term_frequencies, length)
+        self.signatures[view_id] = signature
+        self.total_length += length
+        for term, frequency in term_frequencies.items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                self.add_term(term)
+            self.postings[term][view_id] = frequency
+
+    def remove_document(self, view_id):
+        document = self.documents.pop(view_id, None)
+        if document is None:
+            return
+        del self.signatures[view_id]
+        term_frequencies, length = document
+        self.total_length -= length
+        for term in term_frequencies:
+            postings = self.postings[term]
+            del postings[view_id]
+            if not postings:
+                del self.postings[term]
+                self.remove_term(term)
+
+    def add_term(self, term):
+        self.sorted_terms = None
+        for deleted in get_deletes(term) | {term}:
+            self.deletes.setdefault(deleted, set()).add(term)
+
+    def remove_term(self, term):
+        self.sorted_terms = None
+        for deleted in get_deletes(term) | {term}:
+            terms = self.deletes[deleted]
+            terms.discard(term)
+            if not terms:
+                del self.deletes[deleted]
+
+    def expand(self, token):
+        """
+        Returns the index terms matching the query token, with the weight of each match.
+        """
+        matches = {}
+        if self.sorted_terms is None:
+            self.sorted_terms = sorted(self.postings)
+        start = bisect_left(self.sorted_terms, token)
+        for term in self.sorted_terms[start:start + PREFIX_MAX_TERMS]:
+            if not term.startswith(token):
+                break
+            matches[term] = 1.0 if term == token else PREFIX_MATCH_WEIGHT
+        if len(token) >= FUZZY_MIN_LENGTH:
+            for deleted in get_deletes(token) | {token}:
+                for term in self.deletes.get(deleted, ()):
+                    if term not in matches and is_within_one_edit(token, term):
+                        matches[term] = FUZZY_MATCH_WEIGHT
+        return matches
+
+    def search(self, query, limit):
+        """
+        Returns the views matching the query, the best match first, and at most limit of them.
+        Views are matched on any query token, and the ties keep the order of the view list.
+        When there are fewer than limit matches, the views whose name contains the query are added after them.
+        """
+        document_count = len(self.documents)
+        if document_count == 0:
+            return []
+        average_length = self.total_length / document_count or 1
+        scores = {}
+        for token in set(tokenize(query)):
+            # A view is scored on the best matching term of each query token, so that a token matching many terms
+            # by prefix does not outweigh the others.
+            token_scores = {}
+            for term, weight in self.expand(token).items():
+                postings = self.postings[term]
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for view_id, frequency in postings.items():
+                    length = self.documents[view_id][1]
+                    score = weight * idf * frequency * (BM25_K1 + 1) / (
+                        frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length))
+                    if score > token_scores.get(view_id, 0):
+                        token_scores[view_id] = score
+            for view_id, score in token_scores.items():
+                scores[view_id] = scores.get(view_id, 0) + score
+        view_ids = heapq.nsmallest(limit, scores, key=lambda view_id: (-scores[view_id], self.positions[view_id]))
+        if len(view_ids) < limit and query:
+            query_text = query.strip().lower()
+            for view_id in sorted(self.views, key=self.positions.get):
+                if len(view_ids) >= limit:
+                    break
+                if view_id not in scores and query_text in str(self.views[view_id].get("viewName", "")).lower():
+                    view_ids.append(view_id)
+        return [self.views[view_id] for view_id in view_ids]
+
+
+view_indexes = TTLCache("view_index", VIEW_INDEX_CACHE_SIZE, VIEW_INDEX_TTL)
+
+
+def search_view_list(index_key, views, view_columns, query, limit):
+    """
+    Searches the view list through the index of index_key, which is updated with the list first.
+    """
+    index = view_indexes.get(index_key)
+    if index is None:
+        index = ViewIndex()
+    index.update(views, view_columns)
+    view_indexes.set(index_key, index)
+    return index.search(query, limit)
@@ -0,0 +1,84 @@
+import numpy as np
+from utils.view_index import tokenize, get_view_signature, get_weighted_texts
+
+# Length of the character n-grams, which match the partial words and the spelling variants of the query.
+NGRAM_LENGTH = 3
+# The best match is unambiguous when its score is at least UNAMBIGUOUS_MIN_SCORE and UNAMBIGUOUS_MIN_MARGIN times the
+# score of the second best match.
+UNAMBIGUOUS_MIN_SCORE = 0.5
+UNAMBIGUOUS_MIN_MARGIN = 1.5
+
+
+def get_features(text):
+    """
+    Returns the words of the text, and the character n-grams of each word padded with spaces.
+    """
+    features = []
+    for word in tokenize(text):
+        features.append(word)
+        padded_word = f" {word} "
+        features.extend(f"#{padded_word[i:i + NGRAM_LENGTH]}" for i in range(len(padded_word) - NGRAM_LENGTH + 1))
+    return features
+
+
+class ViewRanker:
+    """
+    Lexical pre-ranker for the views of a workspace. The views are TF-IDF vectors of the words and character n-grams
+    of their fields, weighted as in the ViewIndex, and are ranked by their cosine similarity with the query.
+    The vectors are kept as a sparse matrix in coordinate form, so that a query is scored in a few vectorized passes.
+    """
+
+    def __init__(self, views, view_columns=None):
+        view_columns = view_columns or {}
+        self.view_ids = [view["viewId"] for view in views]
+        self.features = {}
+        rows, columns, frequencies = [], [], []
+        for row, view in enumerate(views):
+            term_frequencies = {}
+            for text, weight in get_weighted_texts(get_view_signature(view, view_columns)):
+                for feature in get_features(text):
+                    column = self.features.setdefault(feature, len(self.features))
+                    term_frequencies[column] = term_frequencies.get(column, 0) + weight
+            rows.extend([row] * len(term_frequencies))
+            columns.extend(term_frequencies)
+            frequencies.extend(term_frequencies.values())
+        self.rows = np.array(rows, dtype=np.int64)
+        self.columns = np.array(columns, dtype=np.int64)
+        document_frequencies = np.bincount(self.columns, minlength=len(self.features))
+        self.idf = np.log((1 + len(views)) / (1 + document_frequencies)) + 1
+        weights = (1 + np.log(np.array(frequencies, dtype=np.float64).clip(min=1))) * self.idf[self.columns]
+        norms = np.sqrt(np.bincount(self.rows, weights=weights ** 2, minlength=len(views)))
+        self.weights = weights / np.where(norms > 0, norms, 1)[self.rows]
+
+    def score(self, query):
+        """
+        Returns the cosine similarity of each view with the query, in the order of the view list.
+        """
+        query_vector = np.zeros(len(self.features))
+        for feature in get_features(query):
+            column = self.features.get(feature)
+            if column is not None:
+                query_vector[column] += 1
+        query_vector = np.where(query_vector > 0, 1 + np.log(query_vector.clip(min=1)), 0) * self.idf
+        norm = np.linalg.norm(query_vector)
+        if norm == 0:
+            return np.zeros(len(self.view_ids))
+        return np.bincount(self.rows, weights=self.weights * (query_vector / norm)[self.columns],
+                           minlength=len(self.view_ids))
+
+    def rank(self, query, limit):
+        """
+        Returns the ids of the limit best matching views, the best match first, and whether the best match is
+        unambiguous. The ties keep the order of the view list.
+        If no view matches the query at all, all the views are returned in their order, since the ranking then says
+        nothing about their relevance.
+        """
+        scores = self.score(query)
+        if not scores.any():
+            return list(self.view_ids), False
+        # A stable sort, so that the ties keep the order of the view list.
+        order = np.argsort(-scores, kind="stable")[:limit]
+        top_scores = scores[order]
+        second_score = top_scores[1] if len(top_scores) > 1 else 0
+        is_unambiguous = bool(top_scores[0] >= UNAMBIGUOUS_MIN_SCORE and top_scores[0] >= UNAMBIGUOUS_MIN_MARGIN * second_score)
+        return [self.view_ids[index] for index in order], is_unambiguous
@@ -0,0 +1,130 @@
+import os
+import re
+import sys
+import json
+import asyncio
+import httpx
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+os.environ.setdefault("APP_PROFILE", "ZA")
+os.environ.setdefault("ANALYTICS_ORG_ID", "1")
+# Nothing is persisted between the tests.
+os.environ.pop("ANALYTICS_MCP_DATA_DIR", None)
+sys.path.insert(0, SRC_DIR)
+# config.properties is read from the working directory, as in the Docker image.
+os.chdir(SRC_DIR)
+
+import config
+import tools
+from fastmcp import Client
+from mcp_instance import mcp
+from AsyncAnalyticsClient import AsyncAnalyticsClient
+from utils.query_cache import query_result_cache
+from utils.org_map import org_map
+
+
+class FakeAnalyticsServer:
+    """
+    Serves the OAuth, workspace details, batch import and export APIs from a table of row_count rows. The LIMIT of an exported SQL
+    query is applied. The method and path of every request are recorded in the order they arrive.
+    The workspace is in the organization workspace_org_id, and the requests for it from another organization fail.
+    The export jobs are reported with job_code, completed unless it is changed. While gate is set to an unset
+    asyncio.Event, the API requests are held once they have arrived.
+    """
+
+    def __init__(self, row_count, workspace_org_id="1"):
+        self.row_count = row_count
+        self.workspace_org_id = workspace_org_id
+        self.job_code = "1004"
+        self.gate = None
+        self.sql_queries = []
+        self.jobs = {}
+        self.requests = []
+
+    async def handle(self, request):
+        self.requests.append((request.method, request.url.path))
+        if request.url.path.endswith("/oauth/v2/token"):
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        if self.gate is not None:
+            await self.gate.wait()
+        if "ZANALYTICS-ORGID" not in request.headers:
+            workspace_id = request.url.path.split("/")[-1]
+            return httpx.Response(200, json={"status": "success", "data": {"workspaces": {
+                "workspaceId": workspace_id, "orgId": self.workspace_org_id}}})
+        if request.headers["ZANALYTICS-ORGID"] != self.workspace_org_id:
+            return httpx.Response(400, json={"status": "failure", "data": {
+                "errorCode": 8084, "errorMessage": "The workspace is not in the organization"}})
+        if request.url.path.endswith("/data/batch"):
+            return httpx.Response(200, json={"status": "success", "data": {"batchKey": "batch_key", "jobId": "1"}})
+        if "/views/" in request.url.path and "/bulk/" not in request.url.path:
+            return httpx.Response(200, content=self.export_rows(""))
+        if request.url.path.endswith("/data") and "/exportjobs/" in request.url.path:
+            job_id = request.url.path.split("/")[-2]
+            return httpx.Response(200, content=self.export_rows(self.jobs[job_id]))
+        if "/exportjobs/" in request.url.path:
+            return httpx.Response(200, json={"status": "success", "data": {"jobCode": self.job_code}})
+        if request.url.path.endswith("/data"):
+            sql_query = json.loads(request.url.params["CONFIG"])["sqlQuery"]
+            self.sql_queries.append(sql_query)
+            job_id = str(len(self.jobs) + 1)
+            self.jobs[job_id] = sql_query
+            return httpx.Response(200, json={"status": "success", "data": {"jobId": job_id}})
+        return httpx.Response(404, json={"status": "failure", "data": {"errorCode": 7005, "errorMessage": "Not found"}})
+
+    def export_rows(self, sql_query):
+        limit = re.search(r"LIMIT (\d+)\s*$", sql_query)
+        row_count = min(self.row_count, int(limit.group(1))) if limit else self.row_count
+        return "Id,Name\n" + "".join(f"{row},Name {row}\n" for row in range(row_count))
+
+
+class FakeClock:
+    """
+    Clock of a RequestScheduler that stands still until advanced, so that its buckets are only refilled on demand.
+    """
+
+    def __init__(self):
+        self.current_time = 0.0
+
+    def __call__(self):
+        return self.current_time
+
+    def advance(self, seconds):
+        self.current_time += seconds
+
+
+async def wait_until(condition, timeout=5):
+    """
+    Waits until the condition holds, and fails if it does not hold within timeout seconds.
+    """
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """
+    Starts a FakeAnalyticsServer with the given arguments, and points the tools at it through a new client.
+    """
+    def start(**kwargs):
+        server = FakeAnalyticsServer(**kwargs)
+        client = AsyncAnalyticsClient("client_id", "client_secret", "refresh_token")
+        config.configure_analytics_client(client)
+        monkeypatch.setattr(client, "create_request_obj",
+                            lambda: httpx.AsyncClient(transport=httpx.MockTransport(server.handle)))
+        monkeypatch.setattr(config, "async_analytics_client", client)
+        monkeypatch.setattr(org_map, "org_ids", {})
+        return server
+    query_result_cache.clear()
+    yield start
+    query_result_cache.clear()
+
+
+async def call_tool(name, arguments):
+    """
+    Calls the tool through an in-memory MCP client, and returns its result parsed from JSON.
+    """
+    async with Client(mcp) as client:
+        result = await client.call_tool(name, arguments)
+    return json.loads(result[0].text)
@@ -0,0 +1,45 @@
+import re
+import asyncio
+from fastmcp import Client
+from mcp_instance import mcp
+from utils.org_map import org_map
+from utils.job_registry import job_registry
+
+
+async def export_view(arguments):
+    async with Client(mcp) as client:
+        result = await client.call_tool("export_view", {"workspace_id": "1", "view_id": "5", "response_file_format": "csv",
+                                                        **arguments})
+    return result[0].text
+
+
+def test_background_export_falls_back_to_the_org_of_the_workspace(fake_server, tmp_path):
+    fake_server(row_count=3, workspace_org_id="2")
+    file_path = str(tmp_path / "sales.csv")
+
+    async def export_in_background():
+        message = await export_view({"response_file_path": file_path, "run_in_background": True})
+        job = job_registry.get(re.search(r"as the job (\w+)", message).group(1))
+        return await job.task
+
+    result = asyncio.run(export_in_background())
+
+    assert result == f"Object exported successfully to {file_path} in csv format."
+    assert org_map.get("WORKSPACE", "1") == "2"
+    with open(file_path) as file:
+        assert file.read().splitlines()[0] == "Id,Name"
+
+
+def test_failed_background_export_records_no_org(fake_server, tmp_path):
+    fake_server(row_count=3, workspace_org_id="2")
+    file_path = str(tmp_path / "missing" / "sales.csv")
+
+    async def export_in_background():
+        message = await export_view({"response_file_path": file_path, "run_in_background": True})
+        job = job_registry.get(re.search(r"as the job (\w+)", message).group(1))
+        await asyncio.gather(job.task, return_exceptions=True)
+        return job.status
+
+    assert asyncio.run(export_in_background()) == "failed"
+    # The workspace is only known to be in an organization once the server has accepted an export.
+    assert org_map.get("WORKSPACE", "1") is None
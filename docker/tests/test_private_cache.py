@@ -0,0 +1,33 @@
+import os
+import json
+import stat
+from utils.private_cache import private_cache_path, write_private_json
+from utils.token_cache import TokenCache
+from utils.catalog_snapshot import CatalogSnapshot
+
+
+def test_cache_files_are_private_to_the_account(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    token_path = private_cache_path(cache_dir, "token", "https://accounts", "client_id", "refresh_token")
+    other_path = private_cache_path(cache_dir, "token", "https://accounts", "client_id", "other_refresh_token")
+
+    write_private_json(token_path, {"access_token": "token"})
+
+    assert token_path != other_path
+    assert "refresh_token" not in token_path
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(token_path).st_mode) == 0o600
+    assert os.listdir(cache_dir) == [os.path.basename(token_path)]
+    with open(token_path) as file:
+        assert json.load(file) == {"access_token": "token"}
+
+
+def test_caches_round_trip_through_the_shared_files(tmp_path):
+    token_cache = TokenCache(str(tmp_path), "client_id", "refresh_token", "https://accounts")
+    catalog_snapshot = CatalogSnapshot(str(tmp_path), "client_id", "refresh_token", "https://analytics")
+
+    token_cache.write("token", 100.0)
+    catalog_snapshot.write([(("views", "1"), ["view"], ("workspace:1",))])
+
+    assert token_cache.read() == ("token", 100.0)
+    assert catalog_snapshot.read(max_age=60) == [(("views", "1"), ["view"], ("workspace:1",))]
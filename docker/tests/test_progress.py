@@ -0,0 +1,45 @@
+import asyncio
+import config
+from utils.progress import ProgressReporter, progress_reporter
+
+
+class FakeContext:
+
+    def __init__(self):
+        self.progress = []
+
+    async def report_progress(self, progress, total=None):
+        self.progress.append((progress, total))
+
+
+def test_phase_is_reported_on_top_of_the_previous_phase():
+    ctx = FakeContext()
+    reporter = ProgressReporter(ctx, min_interval=0)
+
+    async def wait_then_download():
+        # Seconds spent waiting for the export job, then the bytes downloaded.
+        for elapsed_time in (1.5, 3.0):
+            await reporter.report(elapsed_time)
+        reporter.start_phase()
+        for bytes_written in (0, 100, 200):
+            await reporter.report(bytes_written, 200)
+
+    asyncio.run(wait_then_download())
+
+    assert ctx.progress == [(1.5, None), (3.0, None), (103.0, 203.0), (203.0, 203.0)]
+
+
+def test_batch_import_reports_the_batches_sent(fake_server, tmp_path):
+    fake_server(row_count=0)
+    file_path = tmp_path / "sales.csv"
+    file_path.write_text("Id,Name\n" + "".join(f"{row},Name {row}\n" for row in range(5)))
+    ctx = FakeContext()
+
+    async def import_in_batches():
+        progress_reporter.set(ProgressReporter(ctx, min_interval=0))
+        bulk = config.async_analytics_client.get_bulk_instance("1", "1")
+        return await bulk.import_data_as_batches("5", "append", "true", str(file_path), 2)
+
+    assert asyncio.run(import_in_batches()) == "1"
+    # The file is read in a single pass, so the total is only known with the last batch.
+    assert ctx.progress == [(1, None), (2, None), (3, 3)]
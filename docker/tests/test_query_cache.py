@@ -0,0 +1,17 @@
+import asyncio
+from conftest import call_tool
+from utils.query_cache import get_query_cache_key
+
+
+def test_spellings_of_a_query_share_a_cache_key():
+    assert get_query_cache_key("1", "1", "SELECT Id  FROM Sales -- all of them\n;") == \
+           get_query_cache_key("1", "1", "SELECT Id\nFROM Sales")
+
+
+def test_queries_differing_in_alias_case_do_not_share_a_cache_entry(fake_server):
+    server = fake_server(row_count=3)
+
+    for alias in ("Total", "total"):
+        asyncio.run(call_tool("query_data", {"workspace_id": "1", "sql_query": f"SELECT SUM(Id) AS {alias} FROM Sales"}))
+
+    assert server.sql_queries == ["SELECT SUM(Id) AS Total FROM Sales", "SELECT SUM(Id) AS total FROM Sales"]
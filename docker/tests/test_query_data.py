@@ -0,0 +1,19 @@
+import asyncio
+import pytest
+from conftest import call_tool
+from tools import data_tools
+from utils import data_utils
+
+
+@pytest.mark.parametrize("row_count, is_truncated", [(49, False), (50, False), (51, True), (80, True)])
+def test_paged_query_is_truncated_only_beyond_the_row_limit(fake_server, monkeypatch, row_count, is_truncated):
+    monkeypatch.setattr(data_tools, "QUERY_DATA_HANDLE_MAX_ROWS", 50)
+    monkeypatch.setattr(data_utils, "QUERY_DATA_HANDLE_MAX_ROWS", 50)
+    server = fake_server(row_count=row_count)
+
+    page = asyncio.run(call_tool("query_data", {"workspace_id": "1", "sql_query": "SELECT Id, Name FROM Sales", "paged": True}))
+
+    assert server.sql_queries == ["SELECT Id, Name FROM Sales LIMIT 51"]
+    assert page["columns"] == ["Id", "Name"]
+    assert page["total_rows"] == min(row_count, 50)
+    assert page["is_truncated"] == is_truncated
@@ -0,0 +1,66 @@
+import asyncio
+import config
+from conftest import call_tool, FakeClock, wait_until
+from AnalyticsClient import RequestScheduler
+from utils.data_utils import query_data_batch_implementation
+
+SQL_QUERIES = [f"SELECT Id FROM Sales WHERE Id = {index}" for index in range(20)]
+
+
+def get_request_steps(server):
+    """
+    Returns the step of each request the server received, in order, leaving out the OAuth requests.
+    """
+    steps = []
+    for _, path in server.requests:
+        if "/exportjobs/" in path:
+            steps.append("download" if path.endswith("/data") else "status")
+        elif path.endswith("/data"):
+            steps.append("submit")
+    return steps
+
+
+def test_batch_sends_each_step_of_its_queries_at_once_with_scheduling(fake_server):
+    server = fake_server(row_count=3)
+    # The clock stands still, so the batch only completes if the rate limits let all its requests through at once.
+    config.async_analytics_client.request_scheduler = RequestScheduler(clock=FakeClock())
+
+    async def run_batch():
+        server.gate = asyncio.Event()
+        batch = asyncio.ensure_future(call_tool("query_data_batch", {"workspace_id": "1", "sql_queries": SQL_QUERIES}))
+        # All the queries are submitted before the first submission is answered.
+        await wait_until(lambda: get_request_steps(server).count("submit") == len(SQL_QUERIES))
+        server.gate.set()
+        return await asyncio.wait_for(batch, timeout=5)
+
+    results = asyncio.run(run_batch())
+
+    assert [result["sql_query"] for result in results] == SQL_QUERIES
+    assert [result["executed_sql_query"] for result in results] == [f"{sql_query} LIMIT 20" for sql_query in SQL_QUERIES]
+    # The header and the 3 rows.
+    assert all(len(result["result"]) == 4 for result in results)
+    # A round of submits, a single round of status checks, and a round of downloads.
+    assert get_request_steps(server) == ["submit"] * 20 + ["status"] * 20 + ["download"] * 20
+
+
+def test_batch_leaves_the_burst_to_other_calls_while_its_queries_run(fake_server):
+    server = fake_server(row_count=3)
+    server.job_code = "1002"
+    clock = FakeClock()
+    # Room for 20 bulk requests, which is only refilled when the clock is advanced.
+    config.async_analytics_client.request_scheduler = RequestScheduler({"bulk": 2}, burst_seconds=10, clock=clock)
+
+    async def run_batch_with_other_exports():
+        bulk = config.async_analytics_client.get_bulk_instance("1", "1")
+        batch = asyncio.ensure_future(query_data_batch_implementation("1", "1", SQL_QUERIES[:5]))
+        await wait_until(lambda: len(server.sql_queries) >= 5)
+        # The rest of the burst goes to the other calls while the queries of the batch run.
+        await asyncio.wait_for(asyncio.gather(*(bulk.initiate_bulk_export_using_sql(f"SELECT {index}", "CSV")
+                                                for index in range(15))), timeout=5)
+        server.job_code = "1004"
+        clock.advance(2.5)
+        return await asyncio.wait_for(batch, timeout=5)
+
+    results = asyncio.run(run_batch_with_other_exports())
+
+    assert all(len(result["result"]) == 4 for result in results)
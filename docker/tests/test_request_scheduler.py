@@ -0,0 +1,39 @@
+import asyncio
+import config
+from conftest import FakeClock, wait_until
+from AnalyticsClient import RequestScheduler
+
+
+async def submit_exports(count):
+    bulk = config.async_analytics_client.get_bulk_instance("1", "1")
+    await asyncio.gather(*(bulk.initiate_bulk_export_using_sql(f"SELECT {index}", "CSV") for index in range(count)))
+
+
+def test_burst_of_bulk_requests_is_sent_at_once(fake_server):
+    server = fake_server(row_count=1)
+    # The clock stands still, so the requests are only sent if they fit in the burst.
+    config.async_analytics_client.request_scheduler = RequestScheduler(clock=FakeClock())
+
+    asyncio.run(asyncio.wait_for(submit_exports(6), timeout=5))
+
+    assert len(server.sql_queries) == 6
+
+
+def test_sustained_bulk_requests_are_held_to_the_rate(fake_server):
+    server = fake_server(row_count=1)
+    clock = FakeClock()
+    config.async_analytics_client.request_scheduler = RequestScheduler({"bulk": 4}, burst_seconds=1, clock=clock)
+
+    async def submit_while_time_passes():
+        exports = asyncio.ensure_future(submit_exports(8))
+        await wait_until(lambda: len(server.sql_queries) >= 4)
+        sent_counts = [len(server.sql_queries)]
+        for _ in range(2):
+            clock.advance(0.5)
+            await wait_until(lambda: len(server.sql_queries) >= sent_counts[-1] + 2)
+            sent_counts.append(len(server.sql_queries))
+        await exports
+        return sent_counts
+
+    # The first 4 requests use the burst, and every half second lets 2 more through.
+    assert asyncio.run(submit_while_time_passes()) == [4, 6, 8]
@@ -0,0 +1,45 @@
+import pytest
+from utils.sql_utils import push_down_row_limit
+
+PUSH_DOWN_CASES = [
+    # No LIMIT yet.
+    ("SELECT Id FROM Sales", "SELECT Id FROM Sales LIMIT 20", True),
+    ("select id from sales", "select id from sales LIMIT 20", True),
+    ("SELECT Id FROM (SELECT Id FROM Sales LIMIT 5) AS s", "SELECT Id FROM (SELECT Id FROM Sales LIMIT 5) AS s LIMIT 20", True),
+    # A larger LIMIT is tightened, a smaller one is kept.
+    ("SELECT Id FROM Sales LIMIT 100", "SELECT Id FROM Sales LIMIT 20", True),
+    ("SELECT Id FROM Sales LIMIT 5", "SELECT Id FROM Sales LIMIT 5", False),
+    ("SELECT Id FROM Sales LIMIT 20", "SELECT Id FROM Sales LIMIT 20", False),
+    ("SELECT Id FROM Sales LIMIT n", "SELECT Id FROM Sales LIMIT n", False),
+    # LIMIT offset, count and LIMIT count OFFSET offset.
+    ("SELECT Id FROM Sales LIMIT 10, 100", "SELECT Id FROM Sales LIMIT 10, 20", True),
+    ("SELECT Id FROM Sales LIMIT 10, 5", "SELECT Id FROM Sales LIMIT 10, 5", False),
+    ("SELECT Id FROM Sales LIMIT 100 OFFSET 10", "SELECT Id FROM Sales LIMIT 20 OFFSET 10", True),
+    ("SELECT Id FROM Sales LIMIT 5 OFFSET 10", "SELECT Id FROM Sales LIMIT 5 OFFSET 10", False),
+    # A trailing semicolon.
+    ("SELECT Id FROM Sales;", "SELECT Id FROM Sales LIMIT 20;", True),
+    ("SELECT Id FROM Sales LIMIT 100;", "SELECT Id FROM Sales LIMIT 20;", True),
+    # Comments and strings are not part of the query.
+    ("SELECT Id FROM Sales -- limit 5\n", "SELECT Id FROM Sales LIMIT 20 -- limit 5\n", True),
+    ("SELECT Id FROM Sales /* LIMIT 5 */", "SELECT Id FROM Sales LIMIT 20 /* LIMIT 5 */", True),
+    ("SELECT Id FROM Sales WHERE Name = 'no limit 5'", "SELECT Id FROM Sales WHERE Name = 'no limit 5' LIMIT 20", True),
+    ("SELECT Id FROM Sales WHERE Name = 'it''s'", "SELECT Id FROM Sales WHERE Name = 'it''s' LIMIT 20", True),
+    ("SELECT Id FROM Sales WHERE Name = 'limit", "SELECT Id FROM Sales WHERE Name = 'limit", False),
+    # Set operations, aggregates and groups change the shape of the result.
+    ("SELECT Id FROM Sales UNION SELECT Id FROM Returns", "SELECT Id FROM Sales UNION SELECT Id FROM Returns", False),
+    ("SELECT Id FROM Sales UNION ALL SELECT Id FROM Returns LIMIT 100",
+     "SELECT Id FROM Sales UNION ALL SELECT Id FROM Returns LIMIT 100", False),
+    ("SELECT COUNT(*) FROM Sales", "SELECT COUNT(*) FROM Sales", False),
+    ("SELECT Name FROM Sales GROUP BY Name", "SELECT Name FROM Sales GROUP BY Name", False),
+    # Anything other than a single SELECT.
+    ("UPDATE Sales SET Id = 1", "UPDATE Sales SET Id = 1", False),
+    ("SHOW TABLES", "SHOW TABLES", False),
+    ("WITH s AS (SELECT Id FROM Sales) SELECT Id FROM s", "WITH s AS (SELECT Id FROM Sales) SELECT Id FROM s", False),
+    ("SELECT Id FROM Sales; DROP TABLE Sales", "SELECT Id FROM Sales; DROP TABLE Sales", False),
+    ("", "", False),
+]
+
+
+@pytest.mark.parametrize("sql_query, limited_query, is_limit_pushed_down", PUSH_DOWN_CASES)
+def test_push_down_row_limit(sql_query, limited_query, is_limit_pushed_down):
+    assert push_down_row_limit(sql_query, 20) == (limited_query, is_limit_pushed_down)
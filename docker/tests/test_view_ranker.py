@@ -0,0 +1,28 @@
+from utils.view_ranker import ViewRanker
+from utils.view_index import ViewIndex
+
+VIEWS = [
+    {"viewId": "1", "viewName": "Customers", "viewDesc": "People who bought from the sales team"},
+    {"viewId": "2", "viewName": "Sales", "viewDesc": "Orders of the customers"},
+    {"viewId": "3", "viewName": "Products", "viewDesc": None},
+]
+VIEW_COLUMNS = {"3": ("Product Name", "Unit Price")}
+
+
+def test_ranker_and_index_agree_on_the_fields_of_the_views():
+    ranker = ViewRanker(VIEWS, VIEW_COLUMNS)
+    index = ViewIndex()
+    index.update(VIEWS, VIEW_COLUMNS)
+
+    for query, view_id in [("sales", "2"), ("customers", "1"), ("unit price", "3")]:
+        ranked_view_ids, _ = ranker.rank(query, 3)
+        assert ranked_view_ids[0] == view_id
+        assert index.search(query, 3)[0]["viewId"] == view_id
+    # A name match outweighs the same word in a description.
+    assert ranker.rank("sales", 3)[1]
+
+
+def test_ranker_matches_partial_words():
+    ranked_view_ids, _ = ViewRanker(VIEWS, VIEW_COLUMNS).rank("custmer", 3)
+
+    assert ranked_view_ids[0] == "1"